@@ -83,7 +83,9 @@ async def get_popular_tickers(
     """
     Get most traded stock tickers by Congress members.
     
-    Returns tickers ranked by number of transactions.
+    Returns tickers ranked by number of transactions among the most recent
+    trades (the newest 20,000 by default, set by CAPITOL_TRADES_MAX_PAGES
+    pages of 500), not the full trading history.
     """
     return await congress_service.get_popular_tickers(limit=limit)
 
@@ -10,15 +10,21 @@ router = APIRouter(prefix="/debt", tags=["debt"])
 
 
 @router.get("/")
-async def get_debt(days: int = Query(default=365, ge=1, le=10000)):
+async def get_debt(
+    days: int = Query(default=365, ge=1, le=10000),
+    response_format: str = Query(
+        "rows", alias="format", pattern="^(rows|columnar)$",
+        description="rows: [{date, total_debt}, ...]; columnar: parallel dates/values arrays",
+    ),
+):
     """
     Get national debt data from Treasury.
     
-    Data is cached for 24 hours since historical debt data doesn't change.
+    Served from one cached copy of the full history, whatever *days* is.
     """
     try:
         service = get_gov_data_service()
-        return await service.get_national_debt(days=days)
+        return await service.get_national_debt(days=days, columnar=response_format == "columnar")
     except DataFetchError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -28,14 +34,13 @@ async def get_latest_debt():
     """Get the most recent debt figure."""
     try:
         service = get_gov_data_service()
-        data = await service.get_national_debt(days=1)
-        if data["data"]:
-            latest = data["data"][0]
+        latest = await service.get_latest_debt()
+        if latest:
             return {
                 "date": latest["date"],
                 "total_debt": latest["total_debt"],
                 "formatted": f"${latest['total_debt']:,.0f}",
-                "source": data["source"]
+                "source": latest["source"]
             }
         raise HTTPException(status_code=404, detail="No debt data available")
     except DataFetchError as e:
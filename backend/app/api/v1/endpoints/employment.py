@@ -8,7 +8,13 @@ router = APIRouter(prefix="/employment", tags=["employment"])
 
 
 @router.get("/unemployment")
-async def get_unemployment(years: int = Query(default=5, ge=1, le=20)):
+async def get_unemployment(
+    years: int = Query(default=5, ge=1, le=20),
+    response_format: str = Query(
+        "rows", alias="format", pattern="^(rows|columnar)$",
+        description="rows: [{year, month, rate}, ...]; columnar: parallel dates/values arrays",
+    ),
+):
     """
     Get unemployment rate data from Bureau of Labor Statistics.
     
@@ -16,7 +22,7 @@ async def get_unemployment(years: int = Query(default=5, ge=1, le=20)):
     """
     try:
         service = get_gov_data_service()
-        return await service.get_unemployment_rate(years=years)
+        return await service.get_unemployment_rate(years=years, columnar=response_format == "columnar")
     except DataFetchError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -19,6 +19,23 @@ logger = get_logger(__name__)
 
 _DB_UNAVAILABLE = "Housing database is not available. Run sync_housing.py first."
 
+_FREQUENCY = Query(
+    None, pattern="^(week|month|quarter|year)$",
+    description="Aggregate to this period in SQL (week, month, quarter, year)",
+)
+_AGGREGATION = Query(
+    "avg", pattern="^(avg|last)$",
+    description="Per-period value when frequency is set: average or last observation",
+)
+_MAX_POINTS = Query(
+    None, ge=3,
+    description="Downsample (LTTB) to at most this many points per series",
+)
+_FORMAT = Query(
+    "rows", alias="format", pattern="^(rows|columnar)$",
+    description="rows: [{date, value}, ...]; columnar: parallel dates/values arrays",
+)
+
 
 def _check_pool():
     """Raise 503 early if the DB pool isn't initialised."""
@@ -67,13 +84,22 @@ async def get_observations(
     series_id: str,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    frequency: Optional[str] = _FREQUENCY,
+    aggregation: str = _AGGREGATION,
+    max_points: Optional[int] = _MAX_POINTS,
+    response_format: str = _FORMAT,
 ):
     """Get time-series observations for a single series."""
     _check_pool()
     service = get_housing_service()
+    columnar = response_format == "columnar"
     try:
-        data = await service.get_observations(series_id, start_date=start_date, end_date=end_date)
-        if not data["observations"]:
+        data = await service.get_observations(
+            series_id, start_date=start_date, end_date=end_date,
+            frequency=frequency, aggregation=aggregation, max_points=max_points,
+            columnar=columnar,
+        )
+        if not data["dates" if columnar else "observations"]:
             raise HTTPException(status_code=404, detail=f"No data found for series {series_id}")
         return {
             "source": "FRED (Federal Reserve Economic Data)",
@@ -91,6 +117,10 @@ async def compare_series(
     series_ids: str = Query(..., description="Comma-separated series IDs"),
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    frequency: Optional[str] = _FREQUENCY,
+    aggregation: str = _AGGREGATION,
+    max_points: Optional[int] = _MAX_POINTS,
+    response_format: str = _FORMAT,
 ):
     """Compare multiple series on the same time axis."""
     ids = [s.strip() for s in series_ids.split(",") if s.strip()]
@@ -102,7 +132,11 @@ async def compare_series(
     _check_pool()
     service = get_housing_service()
     try:
-        series = await service.get_compare(ids, start_date=start_date, end_date=end_date)
+        series = await service.get_compare(
+            ids, start_date=start_date, end_date=end_date,
+            frequency=frequency, aggregation=aggregation, max_points=max_points,
+            columnar=response_format == "columnar",
+        )
         return {
             "source": "FRED (Federal Reserve Economic Data)",
             "series": series,
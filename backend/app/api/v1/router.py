@@ -20,28 +20,29 @@ router.include_router(education.router)
 
 @router.get("/health")
 async def health_check():
-    """Health check with cache diagnostics."""
-    import os
+    """Health check with cache diagnostics (served from the cache manifest)."""
+    import asyncio
     from datetime import datetime
-    from pathlib import Path
     from app.config import get_settings
+    from app.services.cache import get_cache_manifest
+    from app.services.cache_janitor import get_cache_janitor
+    from app.db.pool import pool_stats
+    from app.services.housing.housing_service import get_housing_service
+    from app.services.http_client import http_client_stats
 
     settings = get_settings()
-    cache_dir = settings.data_dir / "cache"
-
-    cache_files = list(cache_dir.glob("*.json")) if cache_dir.exists() else []
-    total_bytes = sum(f.stat().st_size for f in cache_files)
-    oldest = min((f.stat().st_mtime for f in cache_files), default=0) if cache_files else 0
+    manifest = get_cache_manifest(settings.data_dir / "cache", settings.cache_ttl_hours)
+    if not manifest.loaded:
+        await asyncio.to_thread(manifest.rebuild)
 
     return {
         "status": "healthy",
         "version": "2.1.0",
         "timestamp": datetime.utcnow().isoformat(),
-        "cache": {
-            "files": len(cache_files),
-            "size_mb": round(total_bytes / 1048576, 2),
-            "oldest_entry": datetime.fromtimestamp(oldest).isoformat() if oldest else None,
-        },
+        "cache": {**manifest.summary(), "janitor": get_cache_janitor().stats()},
+        "http": http_client_stats(),
+        "housing_cache": get_housing_service().cache_stats(),
+        "housing_db": pool_stats(),
         "endpoints": [
             "debt", "employment", "budget", "elections",
             "immigration", "congress", "housing", "education",
@@ -3,7 +3,7 @@
 import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
@@ -32,10 +32,39 @@ class Settings(BaseSettings):
     housing_db_user: str = "admin"
     housing_db_password: str = ""
     housing_db_name: str = "housing_db"
+    housing_db_pool_min_size: int = 2
+    housing_db_pool_max_size: int = 10
+    housing_db_statement_cache_size: int = 100  # Per connection; 0 disables caching and warm-up
+    housing_db_command_timeout_seconds: float = 30.0  # 0 = no timeout
+    housing_db_max_inactive_lifetime_seconds: float = 300.0  # Close idle connections after this
+    housing_sync_fetch_concurrency: int = 4  # Concurrent FRED fetches during a sync
+    housing_sync_db_concurrency: int = 4  # Concurrent DB stages (keep <= pool size)
+    housing_skip_unchanged: bool = True  # Skip series whose FRED last_updated has not moved
+    housing_copy_threshold: int = 1000  # Rows per series at which upserts switch to COPY + merge
+    housing_max_points: int = 5000  # LTTB cap on points per series in responses; 0 = unlimited
+    housing_read_cache_enabled: bool = True  # In-process read cache, invalidated by sync runs
+    housing_read_cache_max_entries: int = 512
+    housing_read_cache_poll_seconds: float = 30.0  # Without LISTEN: min seconds between sync_log checks
 
     # Data cache settings
     data_dir: Path = Path("/app/data")
     cache_ttl_hours: int = 48  # How long to cache API responses (increased for performance)
+    cache_codec: Literal["json", "zlib"] = "json"  # Compact JSON, or zlib-compressed JSON
+    cache_stale_ttl_hours: int = 24  # Serve stale entries this long past TTL while refreshing
+    memory_cache_max_entries: int = 256  # In-process L1 tier in front of the file cache
+    memory_cache_max_bytes: int = 64 * 1024 * 1024
+    cache_max_bytes: int = 512 * 1024 * 1024  # Janitor evicts down to this total on disk
+    cache_eviction_policy: Literal["lru", "lfu"] = "lru"  # Least recently or least frequently used
+    cache_janitor_interval_minutes: int = 15  # 0 disables the background janitor
+
+    # Shared outbound HTTP client (one keep-alive pool per upstream host)
+    http_timeout_seconds: float = 30.0
+    http_max_connections_per_host: int = 10
+    http_max_keepalive_per_host: int = 5
+    http_keepalive_expiry_seconds: float = 30.0
+    http_http2: bool = True  # Used only when the optional ``h2`` package is installed
+    http_trust_env: bool = True  # Honour HTTP(S)_PROXY / NO_PROXY / SSL_CERT_FILE from the environment
+    rate_limit_enabled: bool = True  # Per-upstream token buckets (app/services/rate_limit.py)
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
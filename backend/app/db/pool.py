@@ -2,36 +2,197 @@
 asyncpg connection pool lifecycle.
 
 Call ``init_pool`` at application startup and ``close_pool`` at shutdown.
+Standalone scripts build their own pool with ``create_pool`` so they use
+the same settings.
+
+Pool sizing, statement-cache size, command timeout and idle-connection
+lifetime come from ``Settings``.  Each new connection plans the read
+queries in ``queries.PREPARED_STATEMENTS`` once, so the first request on
+a fresh connection does not pay for parsing and planning.  The pool is
+wrapped in ``MeteredPool``, which records how long callers wait for a
+connection and how long queries take.
 """
 
-from typing import Optional
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Optional
 
 import asyncpg
 
 from app.config import get_settings
+from app.db import queries as Q
 from app.utils.logger import get_logger
+from app.utils.metrics import Histogram
 
 logger = get_logger(__name__)
 
-_pool: Optional[asyncpg.Pool] = None
+# Query text -> constant name in ``queries.py``, for per-statement latency.
+_STATEMENT_NAMES = {
+    text: name for name, text in vars(Q).items()
+    if name.isupper() and isinstance(text, str) and "\n" in text
+}
 
 
-async def init_pool() -> asyncpg.Pool:
-    """Create the asyncpg connection pool from application settings."""
-    global _pool
+async def _prepare_statements(conn: asyncpg.Connection) -> None:
+    """
+    ``init`` hook: put the read queries into the connection's statement cache.
+
+    ``Connection.prepare`` returns a statement object without caching it
+    (it passes ``use_cache=False``), so this goes through ``_get_statement``
+    — the path ``fetch`` itself uses.  asyncpg is pinned in
+    ``requirements.txt`` and ``test_db_pool`` checks the method's
+    signature, so an upgrade that changes it fails the tests rather than
+    silently disabling warm-up.
+    """
+    get_statement = getattr(conn, "_get_statement", None)
+    if get_statement is None:
+        logger.warning("asyncpg Connection has no _get_statement; statement warm-up disabled")
+        return
+    for query in Q.PREPARED_STATEMENTS:
+        try:
+            await get_statement(query, None)
+        except asyncpg.PostgresError as e:
+            # e.g. housing.latest_observation before the first sync
+            logger.debug("Skipping prepare of %s: %s", _STATEMENT_NAMES.get(query, "?"), e)
+
+
+class _MeteredAcquire:
+    """``pool.acquire()`` replacement: awaitable or ``async with``, timed either way."""
+
+    def __init__(self, metered: "MeteredPool", timeout: Optional[float]) -> None:
+        self._metered = metered
+        self._timeout = timeout
+        self._conn: Optional[asyncpg.Connection] = None
+
+    async def _acquire(self) -> asyncpg.Connection:
+        started = time.perf_counter()
+        try:
+            return await self._metered._pool.acquire(timeout=self._timeout)
+        except asyncio.TimeoutError:
+            self._metered.acquire_timeouts += 1
+            raise
+        finally:
+            self._metered.acquire_wait.observe((time.perf_counter() - started) * 1000)
+
+    def __await__(self):
+        return self._acquire().__await__()
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        self._conn = await self._acquire()
+        return self._conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        conn, self._conn = self._conn, None
+        await self._metered._pool.release(conn)
+
+
+class MeteredPool:
+    """
+    ``asyncpg.Pool`` wrapper that records acquire-wait and query-latency
+    histograms.
+
+    The query helpers (``fetch``, ``fetchrow``, ``fetchval``, ``execute``,
+    ``executemany``) acquire a connection through the metered path and time
+    the query itself separately, so a slow endpoint can be told apart from
+    a starved pool.  Anything else is delegated to the wrapped pool.
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self.acquire_wait = Histogram()
+        self.query_latency = Histogram()
+        self.statement_latency: dict[str, Histogram] = defaultdict(Histogram)
+        self.acquire_timeouts = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _MeteredAcquire:
+        return _MeteredAcquire(self, timeout)
+
+    async def release(self, conn: asyncpg.Connection, *, timeout: Optional[float] = None) -> None:
+        await self._pool.release(conn, timeout=timeout)
+
+    async def _run(self, method: str, query: str, *args: Any, **kwargs: Any) -> Any:
+        async with self.acquire() as conn:
+            started = time.perf_counter()
+            try:
+                return await getattr(conn, method)(query, *args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - started) * 1000
+                self.query_latency.observe(ms)
+                self.statement_latency[_STATEMENT_NAMES.get(query, "other")].observe(ms)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list[asyncpg.Record]:
+        return await self._run("fetch", query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Optional[asyncpg.Record]:
+        return await self._run("fetchrow", query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchval", query, *args, **kwargs)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        return await self._run("execute", query, *args, **kwargs)
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        return await self._run("executemany", command, args, **kwargs)
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Pool occupancy plus acquire-wait and query-latency histograms."""
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+            "acquire_timeouts": self.acquire_timeouts,
+            "acquire_wait": self.acquire_wait.snapshot(),
+            "query": self.query_latency.snapshot(),
+            "statements": {
+                name: hist.snapshot(buckets=False)
+                for name, hist in sorted(self.statement_latency.items())
+            },
+        }
+
+
+_pool: Optional[MeteredPool] = None
+
+
+async def create_pool() -> MeteredPool:
+    """Create a metered asyncpg pool from application settings."""
     settings = get_settings()
-    _pool = await asyncpg.create_pool(
+    pool = await asyncpg.create_pool(
         host=settings.housing_db_host,
         port=settings.housing_db_port,
         user=settings.housing_db_user,
         password=settings.housing_db_password or None,
         database=settings.housing_db_name,
-        min_size=2,
-        max_size=10,
+        min_size=settings.housing_db_pool_min_size,
+        max_size=settings.housing_db_pool_max_size,
+        max_inactive_connection_lifetime=settings.housing_db_max_inactive_lifetime_seconds,
+        statement_cache_size=settings.housing_db_statement_cache_size,
+        command_timeout=settings.housing_db_command_timeout_seconds or None,
+        init=_prepare_statements if settings.housing_db_statement_cache_size > 0 else None,
     )
-    logger.info("Housing DB pool initialised (%s@%s:%s/%s)",
+    return MeteredPool(pool)
+
+
+async def init_pool() -> MeteredPool:
+    """Create the application's connection pool."""
+    global _pool
+    settings = get_settings()
+    _pool = await create_pool()
+    logger.info("Housing DB pool initialised (%s@%s:%s/%s, size %d-%d)",
                 settings.housing_db_user, settings.housing_db_host,
-                settings.housing_db_port, settings.housing_db_name)
+                settings.housing_db_port, settings.housing_db_name,
+                settings.housing_db_pool_min_size, settings.housing_db_pool_max_size)
     return _pool
 
 
@@ -44,8 +205,15 @@ async def close_pool() -> None:
         _pool = None
 
 
-def get_pool() -> asyncpg.Pool:
+def get_pool() -> MeteredPool:
     """Return the live pool or raise if not yet initialised."""
     if _pool is None:
         raise RuntimeError("Housing DB pool is not initialised — call init_pool() first")
     return _pool
+
+
+def pool_stats() -> Optional[dict[str, Any]]:
+    """Pool metrics for ``/health`` (*None* when the pool is not initialised)."""
+    if _pool is None:
+        return None
+    return _pool.stats()
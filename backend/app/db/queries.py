@@ -42,6 +42,18 @@ FROM housing.series_registry
 WHERE series_id = $1
 """
 
+SELECT_SYNC_STATE = """
+SELECT last_synced_at, fred_last_updated
+FROM housing.series_registry
+WHERE series_id = $1
+"""
+
+UPDATE_SERIES_FRED_LAST_UPDATED = """
+UPDATE housing.series_registry
+SET fred_last_updated = $2
+WHERE series_id = $1
+"""
+
 # ---------------------------------------------------------------------------
 # observations
 # ---------------------------------------------------------------------------
@@ -52,6 +64,28 @@ VALUES ($1, $2, $3)
 ON CONFLICT (series_id, date) DO UPDATE SET value = EXCLUDED.value
 """
 
+# Bulk path: COPY rows into a per-session staging table, then merge them
+# with one statement.  ``ON COMMIT DELETE ROWS`` empties the staging table at
+# the end of each transaction, so it can be reused across batches.
+CREATE_OBSERVATIONS_STAGING = """
+CREATE TEMP TABLE IF NOT EXISTS observations_staging (
+    series_id TEXT NOT NULL,
+    date      DATE NOT NULL,
+    value     DOUBLE PRECISION
+) ON COMMIT DELETE ROWS
+"""
+
+OBSERVATIONS_STAGING_TABLE = "observations_staging"
+OBSERVATIONS_STAGING_COLUMNS = ("series_id", "date", "value")
+
+MERGE_OBSERVATIONS_STAGING = """
+INSERT INTO housing.observations (series_id, date, value)
+SELECT DISTINCT ON (series_id, date) series_id, date, value
+FROM observations_staging
+ORDER BY series_id, date
+ON CONFLICT (series_id, date) DO UPDATE SET value = EXCLUDED.value
+"""
+
 SELECT_OBSERVATIONS = """
 SELECT date, value
 FROM housing.observations
@@ -68,6 +102,22 @@ WHERE series_id = $1
 ORDER BY date
 """
 
+# Period-aggregated reads: $4 is a date_trunc unit (week, month, quarter,
+# year) and $5 picks the period's average or its last observation.
+SELECT_OBSERVATIONS_RESAMPLED = """
+SELECT date_trunc($4::text, date::timestamp)::date AS date,
+       CASE WHEN $5::text = 'last'
+            THEN (array_agg(value ORDER BY date DESC))[1]
+            ELSE avg(value)
+       END AS value
+FROM housing.observations
+WHERE series_id = $1
+  AND ($2::date IS NULL OR date >= $2)
+  AND ($3::date IS NULL OR date <= $3)
+GROUP BY 1
+ORDER BY 1
+"""
+
 SELECT_LATEST_OBSERVATION = """
 SELECT date, value
 FROM housing.observations
@@ -76,6 +126,40 @@ ORDER BY date DESC
 LIMIT 1
 """
 
+# Latest value per series.  ``housing.latest_observation`` is maintained by
+# the sync job (one row per series, keyed by series_id), so the dashboard is
+# a single primary-key lookup over ANY($1).  The LATERAL form reads the
+# observations table directly and is used for series the table lacks.
+SELECT_LATEST_OBSERVATIONS_MULTI = """
+SELECT series_id, date, value
+FROM housing.latest_observation
+WHERE series_id = ANY($1)
+"""
+
+SELECT_LATEST_OBSERVATIONS_MULTI_LIVE = """
+SELECT s.series_id, o.date, o.value
+FROM unnest($1::text[]) AS s(series_id)
+CROSS JOIN LATERAL (
+    SELECT date, value
+    FROM housing.observations
+    WHERE series_id = s.series_id
+    ORDER BY date DESC
+    LIMIT 1
+) o
+"""
+
+REFRESH_LATEST_OBSERVATIONS = """
+INSERT INTO housing.latest_observation (series_id, date, value, refreshed_at)
+SELECT DISTINCT ON (series_id) series_id, date, value, NOW()
+FROM housing.observations
+WHERE series_id = ANY($1)
+ORDER BY series_id, date DESC
+ON CONFLICT (series_id) DO UPDATE SET
+    date         = EXCLUDED.date,
+    value        = EXCLUDED.value,
+    refreshed_at = NOW()
+"""
+
 SELECT_OBSERVATIONS_MULTI = """
 SELECT series_id, date, value
 FROM housing.observations
@@ -85,10 +169,39 @@ WHERE series_id = ANY($1)
 ORDER BY series_id, date
 """
 
+SELECT_OBSERVATIONS_MULTI_RESAMPLED = """
+SELECT series_id,
+       date_trunc($4::text, date::timestamp)::date AS date,
+       CASE WHEN $5::text = 'last'
+            THEN (array_agg(value ORDER BY date DESC))[1]
+            ELSE avg(value)
+       END AS value
+FROM housing.observations
+WHERE series_id = ANY($1)
+  AND ($2::date IS NULL OR date >= $2)
+  AND ($3::date IS NULL OR date <= $3)
+GROUP BY 1, 2
+ORDER BY 1, 2
+"""
+
 # ---------------------------------------------------------------------------
 # sync_log
 # ---------------------------------------------------------------------------
 
+# Schema the sync maintains itself (idempotent; run before each sync):
+# FRED's ``last_updated`` per series, per-series stats per sync run, and the
+# latest-value table behind the dashboard.
+ENSURE_SYNC_SCHEMA = """
+ALTER TABLE housing.series_registry ADD COLUMN IF NOT EXISTS fred_last_updated TEXT;
+ALTER TABLE housing.sync_log ADD COLUMN IF NOT EXISTS series_stats JSONB;
+CREATE TABLE IF NOT EXISTS housing.latest_observation (
+    series_id    TEXT PRIMARY KEY,
+    date         DATE NOT NULL,
+    value        DOUBLE PRECISION,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
 INSERT_SYNC_LOG = """
 INSERT INTO housing.sync_log
     (run_started_at, run_finished_at, series_synced, observations_upserted, errors, status)
@@ -96,6 +209,26 @@ VALUES ($1, $2, $3, $4, $5, $6)
 RETURNING id
 """
 
+INSERT_SYNC_LOG_WITH_STATS = """
+INSERT INTO housing.sync_log
+    (run_started_at, run_finished_at, series_synced, observations_upserted, errors, status,
+     series_stats)
+VALUES ($1, $2, $3, $4, $5, $6, $7)
+RETURNING id
+"""
+
+# Readers cache query results per sync run: the newest sync_log id is the
+# data version, announced on SYNC_NOTIFY_CHANNEL when a run is logged.
+SYNC_NOTIFY_CHANNEL = "housing_sync"
+
+SELECT_SYNC_VERSION = """
+SELECT COALESCE(MAX(id), 0) FROM housing.sync_log
+"""
+
+NOTIFY_SYNC = """
+SELECT pg_notify($1, $2)
+"""
+
 SELECT_LATEST_SYNC = """
 SELECT id, run_started_at, run_finished_at, series_synced,
        observations_upserted, errors, status
@@ -103,3 +236,21 @@ FROM housing.sync_log
 ORDER BY run_started_at DESC
 LIMIT 1
 """
+
+# ---------------------------------------------------------------------------
+# Statement warm-up
+# ---------------------------------------------------------------------------
+
+# Read queries planned on every new pool connection (see ``pool.py``).
+PREPARED_STATEMENTS = (
+    SELECT_ALL_ACTIVE_SERIES,
+    SELECT_SERIES_BY_CATEGORY,
+    SELECT_OBSERVATIONS_RANGE,
+    SELECT_OBSERVATIONS_MULTI,
+    SELECT_OBSERVATIONS_RESAMPLED,
+    SELECT_OBSERVATIONS_MULTI_RESAMPLED,
+    SELECT_LATEST_OBSERVATIONS_MULTI,
+    SELECT_LATEST_OBSERVATIONS_MULTI_LIVE,
+    SELECT_SYNC_VERSION,
+    SELECT_LATEST_SYNC,
+)
@@ -7,6 +7,8 @@ Simplified architecture:
 - Direct government API calls with smart caching
 """
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 
@@ -17,7 +19,11 @@ from fastapi.middleware.gzip import GZipMiddleware
 from app.api.v1.router import router as api_router
 from app.config import get_settings
 from app.db.pool import init_pool, close_pool
+from app.services.cache import get_cache_manifest
+from app.services.cache_janitor import get_cache_janitor
 from app.services.gov_data import get_gov_data_service
+from app.services.housing.housing_service import get_housing_service
+from app.services.http_client import init_http_client, close_http_client
 from app.middleware.cache import CacheControlMiddleware
 
 settings = get_settings()
@@ -27,19 +33,41 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    # Startup: one shared HTTP client (per-host keep-alive pools) for all services
+    await init_http_client()
+
+    # Startup: index the cache directory once so /health never scans it
+    manifest = get_cache_manifest(settings.data_dir / "cache", settings.cache_ttl_hours)
+    await asyncio.to_thread(manifest.rebuild)
+
+    # Startup: keep the cache directory within its byte budget
+    janitor_task = None
+    if settings.cache_janitor_interval_minutes > 0:
+        janitor_task = asyncio.create_task(
+            get_cache_janitor().run_forever(settings.cache_janitor_interval_minutes * 60)
+        )
+
     # Startup: initialise housing DB pool (optional — app works without it)
     if settings.fred_api_key:
         try:
             await init_pool()
+            # Drop cached housing reads as soon as a sync run is logged
+            await get_housing_service().start_cache_listener()
         except Exception as e:
             logger.warning("Housing DB pool init failed: %s", e)
 
     yield
 
     # Shutdown
+    if janitor_task is not None:
+        janitor_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await janitor_task
+    await get_housing_service().stop_cache_listener()
     await close_pool()
     service = get_gov_data_service()
     await service.close()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -5,17 +5,26 @@ Provides shared HTTP client management, file-based caching, error handling,
 and response formatting for all government data services.
 """
 
-import json
 import hashlib
 import asyncio
+import time
 from abc import ABC
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Coroutine, Optional
 
 import httpx
 
 from app.config import get_settings
+from app.services.cache import (
+    MemoryCache,
+    SingleFlight,
+    atomic_write_bytes,
+    decode_cache_entry,
+    encode_cache_entry,
+    get_cache_manifest,
+)
+from app.services.http_client import get_http_client
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -36,7 +45,8 @@ class BaseGovService(ABC):
     Abstract base class for government data services.
 
     Subclasses set class-level config and inherit HTTP client management,
-    file-based JSON caching, and standardised response formatting.
+    two-tier caching (in-memory LRU in front of file-based JSON), and
+    standardised response formatting.
 
     Example subclass::
 
@@ -53,26 +63,30 @@ class BaseGovService(ABC):
     DEFAULT_HEADERS: dict[str, str] = {"Accept": "application/json"}
 
     def __init__(self) -> None:
-        self._client: Optional[httpx.AsyncClient] = None
         self._cache_dir: Path = settings.data_dir / "cache"
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory = MemoryCache(
+            max_entries=settings.memory_cache_max_entries,
+            max_bytes=settings.memory_cache_max_bytes,
+        )
+        self._inflight = SingleFlight()
+        self._manifest = get_cache_manifest(self._cache_dir, settings.cache_ttl_hours)
 
     # -- HTTP client ----------------------------------------------------------
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Lazy-initialise and return the shared ``httpx.AsyncClient``."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers=self.DEFAULT_HEADERS,
-            )
-        return self._client
+        """
+        Return the process-wide ``httpx.AsyncClient``.
+
+        The client (and its per-host connection pools) is shared by every
+        service; ``TIMEOUT`` and ``DEFAULT_HEADERS`` are applied per request.
+        It is looked up on every call rather than kept, so long-lived
+        services pick up a client recreated after ``close_http_client``.
+        """
+        return get_http_client()
 
     async def close(self) -> None:
-        """Close the HTTP client (call on shutdown)."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Nothing to release; the shared client is closed in the app lifespan."""
 
     # -- HTTP fetch -----------------------------------------------------------
 
@@ -116,10 +130,11 @@ class BaseGovService(ABC):
                 if method.upper() == "POST":
                     resp = await client.post(
                         url, params=params, json=json_body, headers=merged_headers,
+                        timeout=self.TIMEOUT,
                     )
                 else:
                     resp = await client.get(
-                        url, params=params, headers=merged_headers,
+                        url, params=params, headers=merged_headers, timeout=self.TIMEOUT,
                     )
                 resp.raise_for_status()
                 return resp.json()
@@ -147,9 +162,36 @@ class BaseGovService(ABC):
         return hashlib.md5(raw.encode()).hexdigest()
 
     def _cache_path(self, key: str) -> Path:
-        """Return the file path for a cache key."""
+        """
+        Return the file path for a cache key.
+
+        The ``.json`` suffix predates the binary codecs and is kept so legacy
+        entries are found in place; the file header identifies the encoding.
+        """
         return self._cache_dir / f"{key}.json"
 
+    @staticmethod
+    def _max_age(ttl: Optional[float]) -> float:
+        """Convert a TTL in hours (``None`` = settings default) to seconds."""
+        ttl_hours = ttl if ttl is not None else settings.cache_ttl_hours
+        return ttl_hours * 3600
+
+    def _load_cache_entry(self, key: str) -> Optional[tuple[dict, float, int]]:
+        """
+        Read the cache file for *key* regardless of age.
+
+        Returns ``(data, written_at, size_bytes)`` or *None* if the file is
+        missing or unreadable.  *size_bytes* is the uncompressed JSON length,
+        which the memory tier budgets by; the file size is the manifest's.
+        """
+        path = self._cache_path(key)
+        try:
+            written_at = path.stat().st_mtime
+            data, size = decode_cache_entry(path.read_bytes())
+            return data, written_at, size
+        except (ValueError, OSError):
+            return None
+
     def _read_cache(self, key: str, ttl: Optional[int] = None) -> Optional[dict]:
         """
         Return cached data if the file exists and is still fresh.
@@ -161,34 +203,68 @@ class BaseGovService(ABC):
         ttl:
             Freshness window in hours.  Falls back to ``settings.cache_ttl_hours``.
         """
-        path = self._cache_path(key)
-        if not path.exists():
+        entry = self._load_cache_entry(key)
+        if entry is None:
             return None
-
-        ttl_hours = ttl if ttl is not None else settings.cache_ttl_hours
-        mtime = datetime.fromtimestamp(path.stat().st_mtime)
-        if datetime.now() - mtime >= timedelta(hours=ttl_hours):
+        data, written_at, _ = entry
+        if time.time() - written_at >= self._max_age(ttl):
             return None
+        return data
 
-        try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
-            return None
+    def _write_cache_file(self, key: str, data: dict, ttl: Optional[float] = None) -> int:
+        """
+        Encode *data* and atomically replace the cache file for *key*.
 
-    def _write_cache(self, key: str, data: dict) -> None:
-        """Write *data* to the cache file for *key*."""
-        path = self._cache_path(key)
-        path.write_text(json.dumps(data, indent=2, default=str))
+        The header records the owning service and *ttl* so the cache
+        manifest can be rebuilt without decoding payloads.  The manifest
+        records the file size; the uncompressed JSON length is returned for
+        the memory tier.
+        """
+        meta = {"service": self.SERVICE_NAME, "ttl": ttl}
+        payload, size = encode_cache_entry(data, settings.cache_codec, meta=meta)
+        atomic_write_bytes(self._cache_path(key), payload)
+        self._manifest.record_write(key, self.SERVICE_NAME, len(payload), ttl)
+        return size
+
+    def _write_cache(self, key: str, data: dict, ttl: Optional[float] = None) -> int:
+        """
+        Write *data* to the cache file for *key* and return its JSON size in bytes.
+
+        The file is encoded with ``settings.cache_codec`` and replaced
+        atomically.  Any in-memory copy of *key* is invalidated.
+        """
+        self._memory.invalidate(key)
+        return self._write_cache_file(key, data, ttl)
+
+    async def _aload_cache_entry(self, key: str) -> Optional[tuple[dict, float, int]]:
+        """``_load_cache_entry`` on a worker thread, off the event loop."""
+        return await asyncio.to_thread(self._load_cache_entry, key)
+
+    async def _awrite_cache(self, key: str, data: dict, ttl: Optional[float] = None) -> int:
+        """``_write_cache`` with encoding and disk I/O on a worker thread."""
+        self._memory.invalidate(key)
+        return await asyncio.to_thread(self._write_cache_file, key, data, ttl)
 
     async def _cached_fetch(
         self,
         key: str,
         fetch_fn: Callable[[], Coroutine[Any, Any, dict]],
         ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        store_ttl: Optional[float] = None,
+        permanent: bool = False,
     ) -> dict:
         """
         Cache-aside helper: return cached data or call *fetch_fn* and cache the result.
 
+        Lookups go memory → disk → *fetch_fn*.  Fresh disk hits are promoted
+        into the in-memory tier; fetched data is written to both.  Concurrent
+        misses on the same key share a single *fetch_fn* call.
+
+        Entries past *ttl* but within a further *stale_ttl* hours are served
+        immediately while a background refresh runs (stale-while-revalidate).
+        Only entries older than both windows make the caller wait upstream.
+
         Parameters
         ----------
         key:
@@ -197,14 +273,82 @@ class BaseGovService(ABC):
             Async callable that returns the data dict to cache.
         ttl:
             Freshness window in hours.
+        stale_ttl:
+            Extra hours a stale entry may be served while refreshing.  Falls
+            back to ``settings.cache_stale_ttl_hours``; ``0`` disables.
+        store_ttl:
+            TTL in hours recorded with the written entry, which is what the
+            cache janitor expires by.  Defaults to *ttl*; set it when *ttl*
+            measures the age since an upstream release rather than how long
+            a new entry stays current.
+        permanent:
+            Write the entry with an infinite TTL so the cache janitor never
+            removes it.  *ttl* still decides when it is refreshed.
         """
-        cached = self._read_cache(key, ttl=ttl)
+        max_age = self._max_age(ttl)
+        stale_hours = stale_ttl if stale_ttl is not None else settings.cache_stale_ttl_hours
+        stale_max_age = max_age + stale_hours * 3600
+
+        cached = self._memory.get(key, max_age)
         if cached is not None:
+            self._manifest.record_hit(self.SERVICE_NAME, key)
             return cached
 
-        data = await fetch_fn()
-        self._write_cache(key, data)
-        return data
+        stale: Optional[tuple[dict, float]] = None
+        entry = await self._aload_cache_entry(key)
+        if entry is not None:
+            data, written_at, size = entry
+            if time.time() - written_at < max_age:
+                self._memory.set(key, data, written_at, size)
+                self._manifest.record_hit(self.SERVICE_NAME, key)
+                return data
+            stale = (data, written_at)
+        else:
+            stale = self._memory.peek(key)
+
+        async def _fetch_and_store() -> dict:
+            data = await fetch_fn()
+            if permanent:
+                written_ttl = float("inf")
+            else:
+                written_ttl = store_ttl if store_ttl is not None else ttl
+            size = await self._awrite_cache(key, data, written_ttl)
+            self._memory.set(key, data, time.time(), size)
+            return data
+
+        if stale is not None and time.time() - stale[1] < stale_max_age:
+            self._manifest.record_hit(self.SERVICE_NAME, key, stale=True)
+            self._refresh_in_background(key, _fetch_and_store)
+            return stale[0]
+
+        self._manifest.record_miss(self.SERVICE_NAME)
+        return await self._inflight.do(key, _fetch_and_store)
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Coroutine[Any, Any, dict]],
+    ) -> None:
+        """Start (or join) a refresh of *key* without waiting for it."""
+        if key in self._inflight:
+            return
+
+        def _log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    "%s: background refresh of %s failed, serving stale data: %s",
+                    self.SERVICE_NAME, key, task.exception(),
+                )
+
+        self._inflight.start(key, fetch_fn).add_done_callback(_log_failure)
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return cache and request-coalescing counters for diagnostics."""
+        return {
+            "service": self.SERVICE_NAME,
+            "memory": self._memory.stats(),
+            "single_flight": self._inflight.stats(),
+        }
 
     # -- Response formatting --------------------------------------------------
 
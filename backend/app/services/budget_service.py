@@ -13,25 +13,32 @@ No API key required - public API.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 import httpx
 
 from app.config import get_settings
+from app.services.base import BaseGovService, ServiceError
 from app.utils.logger import get_logger
+from app.utils.schedules import mts_release, next_mts_release, previous_mts_release
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 
-class BudgetServiceError(Exception):
+class BudgetServiceError(ServiceError):
     """Custom exception for budget service errors."""
     pass
 
 
-class USASpendingService:
+# Upstream failures an overview section may report instead of a result
+_UPSTREAM_ERRORS = (httpx.HTTPError, ServiceError)
+
+
+class USASpendingService(BaseGovService):
     """
     Service for fetching federal budget data from USASpending.gov.
     
@@ -42,30 +49,13 @@ class USASpendingService:
     Documentation: https://api.usaspending.gov/docs/
     """
     
+    SERVICE_NAME = "usaspending"
     BASE_URL = "https://api.usaspending.gov/api/v2"
     TIMEOUT = 30  # seconds
-    
-    def __init__(self):
-        """Initialize the USASpending service."""
-        self.client = None
-        
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
-            )
-        return self.client
-    
-    async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+
+    # Upper bound on the freshness of open fiscal years, in case a holiday
+    # pushes the Monthly Treasury Statement past its computed date.
+    CURRENT_YEAR_MAX_AGE_HOURS = 72
 
     # =========================================================================
     # AGENCY SPENDING
@@ -89,7 +79,7 @@ class USASpendingService:
         try:
             client = await self._get_client()
             params = {"fiscal_year": fy}
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -125,7 +115,7 @@ class USASpendingService:
         try:
             client = await self._get_client()
             params = {"fiscal_year": fy}
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             return response.json()
@@ -164,7 +154,7 @@ class USASpendingService:
         
         try:
             client = await self._get_client()
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -191,6 +181,11 @@ class USASpendingService:
         - Budgetary resources
         - Spending by category
         
+        The sections are fetched concurrently and cached per fiscal year:
+        closed years never expire, the open year is refreshed after each
+        Monthly Treasury Statement (see ``_fiscal_year_ttl`` and
+        ``_fiscal_year_store_ttl``).
+        
         Args:
             fiscal_year: Fiscal year
             
@@ -198,28 +193,49 @@ class USASpendingService:
             Budget overview data
         """
         fy = fiscal_year or self._current_fiscal_year()
-        
-        try:
-            # Fetch overall budget data
-            totals = await self._get_budget_totals(fy)
-            
-            # Fetch spending by budget function
-            by_function = await self.get_spending_by_budget_function(fy)
-            
-            return {
-                "fiscal_year": fy,
-                "totals": totals,
-                "by_function": by_function,
-                "fetched_at": datetime.utcnow().isoformat(),
-                "source": "USASpending.gov"
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to get budget overview: {e}")
-            raise BudgetServiceError(f"Failed to get budget overview: {e}")
+        now = datetime.now(timezone.utc)
+        ttl = self._fiscal_year_ttl(fy, now)
+        store_ttl = self._fiscal_year_store_ttl(fy, now)
+        
+        totals, by_function = await asyncio.gather(
+            self._cached_fetch(
+                self._cache_key("overview_totals", fy),
+                partial(self._fetch_budget_totals, fy),
+                ttl=ttl,
+                store_ttl=store_ttl,
+            ),
+            self._cached_fetch(
+                self._cache_key("overview_functions", fy),
+                partial(self._fetch_budget_functions, fy),
+                ttl=ttl,
+                store_ttl=store_ttl,
+            ),
+            return_exceptions=True,
+        )
+        
+        for result in (totals, by_function):
+            # Cancellation and programming errors propagate as they are.
+            if isinstance(result, BaseException) and not isinstance(result, _UPSTREAM_ERRORS):
+                raise result
+        if isinstance(totals, _UPSTREAM_ERRORS):
+            # Some endpoints may not exist; the overview goes out without totals
+            # (and nothing is cached, so the next request tries again).
+            logger.warning(f"Budget totals unavailable for FY{fy}: {totals}")
+            totals = {}
+        if isinstance(by_function, _UPSTREAM_ERRORS):
+            logger.error(f"Failed to get budget overview: {by_function}")
+            raise BudgetServiceError(f"Failed to get budget overview: {by_function}")
+        
+        return {
+            "fiscal_year": fy,
+            "totals": totals,
+            "by_function": by_function["results"],
+            "fetched_at": datetime.utcnow().isoformat(),
+            "source": "USASpending.gov"
+        }
     
-    async def _get_budget_totals(self, fiscal_year: int) -> Dict[str, Any]:
-        """Get total budget figures for a fiscal year."""
+    async def _fetch_budget_totals(self, fiscal_year: int) -> Dict[str, Any]:
+        """Get total budget figures for a fiscal year (raises ``ServiceError``)."""
         url = f"{self.BASE_URL}/spending/summary/"
         
         payload = {
@@ -227,14 +243,11 @@ class USASpendingService:
             "spending_type": "total"
         }
         
-        try:
-            client = await self._get_client()
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError:
-            # Some endpoints may not exist, return empty
-            return {}
+        return await self._fetch_json(url, method="POST", json_body=payload)
+    
+    async def _fetch_budget_functions(self, fiscal_year: int) -> Dict[str, Any]:
+        # Wrapped in a dict so the list can go through ``_cached_fetch``.
+        return {"results": await self.get_spending_by_budget_function(fiscal_year)}
     
     async def get_spending_by_budget_function(
         self,
@@ -255,17 +268,12 @@ class USASpendingService:
         url = f"{self.BASE_URL}/budget_functions/list_budget_functions/"
         
         try:
-            client = await self._get_client()
-            params = {"fiscal_year": fy}
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = await self._fetch_json(url, params={"fiscal_year": fy})
             return data.get("results", [])
             
-        except httpx.HTTPError as e:
+        except ServiceError as e:
             logger.error(f"Failed to fetch budget functions: {e}")
-            raise BudgetServiceError(f"Failed to fetch budget functions: {e}")
+            raise BudgetServiceError(f"Failed to fetch budget functions: {e}", e.source, e.url)
 
     # =========================================================================
     # FEDERAL ACCOUNTS
@@ -309,7 +317,7 @@ class USASpendingService:
         
         try:
             client = await self._get_client()
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -351,7 +359,7 @@ class USASpendingService:
         
         try:
             client = await self._get_client()
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -393,7 +401,7 @@ class USASpendingService:
         
         try:
             client = await self._get_client()
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -425,6 +433,36 @@ class USASpendingService:
             return today.year + 1
         return today.year
     
+    def _fiscal_year_ttl(self, fiscal_year: int, now: Optional[datetime] = None) -> float:
+        """
+        Freshness window in hours for cached data about *fiscal_year*.
+        
+        A fiscal year is closed once the September Monthly Treasury
+        Statement is out (October's release); its figures are then treated
+        as final and cached without expiry.  Until then the data is fresh
+        only if it was fetched after the latest statement, capped at
+        ``CURRENT_YEAR_MAX_AGE_HOURS``.
+        """
+        now = now or datetime.now(timezone.utc)
+        if now >= mts_release(fiscal_year, 10):
+            return float("inf")
+        since_release = (now - previous_mts_release(now)).total_seconds() / 3600
+        return min(since_release, self.CURRENT_YEAR_MAX_AGE_HOURS)
+    
+    def _fiscal_year_store_ttl(self, fiscal_year: int, now: Optional[datetime] = None) -> float:
+        """
+        TTL in hours recorded with data about *fiscal_year* written *now*.
+        
+        Closed years never expire.  Open-year data stays current until the
+        next statement (or ``CURRENT_YEAR_MAX_AGE_HOURS``), so the cache
+        janitor keeps it until its refresh is due.
+        """
+        now = now or datetime.now(timezone.utc)
+        if now >= mts_release(fiscal_year, 10):
+            return float("inf")
+        until_release = (next_mts_release(now) - now).total_seconds() / 3600
+        return min(until_release, self.CURRENT_YEAR_MAX_AGE_HOURS)
+    
     def format_currency(self, amount: float) -> str:
         """Format large numbers for display."""
         if amount >= 1_000_000_000_000:  # Trillions
@@ -0,0 +1,579 @@
+"""
+Cache primitives shared by the government data services.
+
+``BaseGovService`` layers these in front of its file-based JSON cache.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+
+# ---------------------------------------------------------------------------
+# On-disk format
+# ---------------------------------------------------------------------------
+#
+# Cache files start with a header: ``MAGIC`` + format version + codec id.
+# Version 2 follows that with a 2-byte big-endian length and a compact JSON
+# metadata object (``service``, ``ttl`` in hours) so the cache directory can
+# be indexed without decoding payloads.  Version 1 files (no metadata) and
+# files written before the header existed (plain indented JSON) are still
+# readable, so old and new entries coexist until each key is rewritten.
+
+CACHE_MAGIC = b"LTSC"
+CACHE_FORMAT_VERSION = 2
+_PREFIX_LEN = len(CACHE_MAGIC) + 2
+_MAX_META_LEN = 0xFFFF
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Compact JSON (no indentation or padding) as UTF-8 bytes."""
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
+class CacheCodec:
+    """Compact JSON codec; subclasses transform the encoded bytes."""
+
+    name = "json"
+    codec_id = 1
+
+    def compress(self, raw_json: bytes) -> bytes:
+        return raw_json
+
+    def decompress(self, payload: bytes) -> bytes:
+        return payload
+
+    def encode(self, data: Any) -> bytes:
+        return self.compress(_json_bytes(data))
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(self.decompress(payload))
+
+
+class ZlibCodec(CacheCodec):
+    """Compact JSON compressed with zlib — smaller files, a little more CPU."""
+
+    name = "zlib"
+    codec_id = 2
+    LEVEL = 6
+
+    def compress(self, raw_json: bytes) -> bytes:
+        return zlib.compress(raw_json, self.LEVEL)
+
+    def decompress(self, payload: bytes) -> bytes:
+        return zlib.decompress(payload)
+
+
+CODECS: dict[str, CacheCodec] = {c.name: c for c in (CacheCodec(), ZlibCodec())}
+_CODECS_BY_ID: dict[int, CacheCodec] = {c.codec_id: c for c in CODECS.values()}
+
+
+def get_codec(name: str) -> CacheCodec:
+    """Return the registered codec called *name*."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown cache codec {name!r}; expected one of {sorted(CODECS)}")
+
+
+def encode_cache_entry(
+    data: Any,
+    codec: str = "json",
+    meta: Optional[dict[str, Any]] = None,
+) -> tuple[bytes, int]:
+    """
+    Return ``(file_bytes, json_size)`` for *data*.
+
+    *json_size* is the length of the uncompressed JSON — the figure the
+    in-memory tier budgets by, since it holds decoded objects rather than
+    the (possibly compressed) file.
+    """
+    c = get_codec(codec)
+    meta_bytes = _json_bytes(meta or {})
+    if len(meta_bytes) > _MAX_META_LEN:
+        raise ValueError("Cache metadata too large")
+    raw_json = _json_bytes(data)
+    payload = (
+        CACHE_MAGIC
+        + bytes((CACHE_FORMAT_VERSION, c.codec_id))
+        + len(meta_bytes).to_bytes(2, "big")
+        + meta_bytes
+        + c.compress(raw_json)
+    )
+    return payload, len(raw_json)
+
+
+def encode_cache_payload(
+    data: Any,
+    codec: str = "json",
+    meta: Optional[dict[str, Any]] = None,
+) -> bytes:
+    """Serialize *data* with the named codec, prefixed by the format header and *meta*."""
+    return encode_cache_entry(data, codec, meta)[0]
+
+
+def _parse_header(raw: bytes) -> tuple[Optional[CacheCodec], dict[str, Any], int]:
+    """
+    Return ``(codec, meta, payload_offset)`` for a cache file's leading bytes.
+
+    ``codec`` is *None* for legacy header-less JSON.
+    """
+    if not raw.startswith(CACHE_MAGIC):
+        return None, {}, 0
+
+    version, codec_id = raw[len(CACHE_MAGIC)], raw[len(CACHE_MAGIC) + 1]
+    codec = _CODECS_BY_ID.get(codec_id)
+    if codec is None:
+        raise ValueError(f"Unknown cache codec id {codec_id}")
+    if version == 1:
+        return codec, {}, _PREFIX_LEN
+    if version == 2:
+        meta_len = int.from_bytes(raw[_PREFIX_LEN:_PREFIX_LEN + 2], "big")
+        meta_end = _PREFIX_LEN + 2 + meta_len
+        if len(raw) < meta_end:
+            raise ValueError("Truncated cache header")
+        return codec, json.loads(raw[_PREFIX_LEN + 2:meta_end]), meta_end
+    raise ValueError(f"Unsupported cache format version {version}")
+
+
+def decode_cache_payload(raw: bytes) -> Any:
+    """
+    Deserialize a cache file's contents.
+
+    Raises ``ValueError`` for unknown versions/codecs or corrupt payloads
+    (``json.JSONDecodeError`` is a ``ValueError``; zlib errors are re-raised
+    as one).
+    """
+    return decode_cache_entry(raw)[0]
+
+
+def decode_cache_entry(raw: bytes) -> tuple[Any, int]:
+    """``decode_cache_payload`` plus the uncompressed JSON length (see ``encode_cache_entry``)."""
+    codec, _, offset = _parse_header(raw)
+    if codec is None:
+        return json.loads(raw), len(raw)  # legacy pre-header JSON file
+    try:
+        raw_json = codec.decompress(raw[offset:])
+    except zlib.error as exc:
+        raise ValueError(f"Corrupt {codec.name} cache payload: {exc}") from exc
+    return json.loads(raw_json), len(raw_json)
+
+
+def read_cache_meta(path: Path) -> dict[str, Any]:
+    """Return the metadata block of the cache file at *path* without reading its payload."""
+    with open(path, "rb") as f:
+        head = f.read(_PREFIX_LEN + 2)
+        if head.startswith(CACHE_MAGIC) and len(head) == _PREFIX_LEN + 2 and head[len(CACHE_MAGIC)] == 2:
+            head += f.read(int.from_bytes(head[_PREFIX_LEN:], "big"))
+    try:
+        return _parse_header(head)[1]
+    except ValueError:
+        return {}
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Write *payload* to *path* so readers only ever see the old or new file.
+
+    Data goes to a temp file in the same directory, is fsync'd, then
+    ``os.replace``'d over *path*.  Safe against crashes mid-write and against
+    concurrent writers of the same key (last replace wins).
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# ---------------------------------------------------------------------------
+# In-memory tier
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _MemoryEntry:
+    data: Any
+    written_at: float
+    size: int
+
+
+class MemoryCache:
+    """
+    Bounded in-process LRU cache (the L1 tier in front of the file cache).
+
+    Entries remember when their payload was written to disk so freshness is
+    judged exactly like the file tier: a caller passes the same ``max_age``
+    it would apply to the file's mtime.  The cache is capped both by entry
+    count and by the approximate serialized size of its payloads.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, max_age: float) -> Optional[Any]:
+        """Return the payload for *key* if present and younger than *max_age* seconds."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if time.time() - entry.written_at >= max_age:
+            # Stale for this caller; leave it for the file tier to decide.
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+
+    def peek(self, key: str) -> Optional[tuple[Any, float]]:
+        """Return ``(data, written_at)`` for *key* regardless of age, without touching counters."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry.data, entry.written_at
+
+    def set(self, key: str, data: Any, written_at: float, size: int) -> None:
+        """Store *data* under *key*, evicting least-recently-used entries as needed."""
+        if size > self.max_bytes:
+            # Never let one oversized payload flush the whole tier.
+            self.invalidate(key)
+            return
+        self.invalidate(key)
+        self._entries[key] = _MemoryEntry(data=data, written_at=written_at, size=size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop *key* from the cache (no-op if absent)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing
+# ---------------------------------------------------------------------------
+
+class SingleFlight:
+    """
+    Per-key request coalescing.
+
+    The first caller for a key runs *fn*; concurrent callers for the same key
+    await that same task instead of starting their own.  The shared task is
+    shielded so a cancelled waiter never cancels the fetch for everyone else.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    def start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Return the in-flight task for *key*, starting *fn* if there is none."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        self.calls += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+            # Mark the exception retrieved so an unawaited failure doesn't log noise.
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run *fn* once per key at a time and return its result to every caller."""
+        return await asyncio.shield(self.start(key, fn))
+
+    def stats(self) -> dict[str, int]:
+        """Return fetch and coalesced-waiter counters."""
+        return {
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Cache index
+# ---------------------------------------------------------------------------
+
+UNKNOWN_SERVICE = "unknown"
+
+
+@dataclass
+class ManifestEntry:
+    key: str
+    service: str
+    size: int
+    created: float
+    expires: float
+    last_access: float
+    hits: int = 0
+
+
+class CacheManifest:
+    """
+    In-memory index of one cache directory.
+
+    Rebuilt from disk once (at startup, reading only file headers) and then
+    kept current by ``BaseGovService`` on every write, so diagnostics never
+    need to glob or stat the directory.  Totals and per-service sizes are
+    maintained incrementally; hit/miss counters are per service.
+
+    Updates may come from worker threads (cache writes run off the event
+    loop), so mutations take a lock.
+    """
+
+    def __init__(self, cache_dir: Path, default_ttl_hours: float = 48) -> None:
+        self.cache_dir = cache_dir
+        self.default_ttl_hours = default_ttl_hours
+        self.loaded = False
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = {}
+        self._total_bytes = 0
+        self._oldest: Optional[float] = None
+        self._service_files: dict[str, int] = defaultdict(int)
+        self._service_bytes: dict[str, int] = defaultdict(int)
+        self._service_hits: dict[str, int] = defaultdict(int)
+        self._service_stale: dict[str, int] = defaultdict(int)
+        self._service_misses: dict[str, int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[ManifestEntry]:
+        return self._entries.get(key)
+
+    def entries(self) -> list[ManifestEntry]:
+        """Snapshot of all entries."""
+        with self._lock:
+            return list(self._entries.values())
+
+    # -- Maintenance -----------------------------------------------------------
+
+    def _expires(self, created: float, ttl_hours: Optional[float]) -> float:
+        hours = ttl_hours if ttl_hours is not None else self.default_ttl_hours
+        return created + hours * 3600
+
+    def _add(self, entry: ManifestEntry) -> None:
+        self._discard(entry.key)
+        self._entries[entry.key] = entry
+        self._total_bytes += entry.size
+        self._service_files[entry.service] += 1
+        self._service_bytes[entry.service] += entry.size
+        if self._oldest is None or entry.created < self._oldest:
+            self._oldest = entry.created
+
+    def _discard(self, key: str) -> Optional[ManifestEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._total_bytes -= entry.size
+        self._service_files[entry.service] -= 1
+        self._service_bytes[entry.service] -= entry.size
+        if entry.created == self._oldest:
+            self._oldest = min((e.created for e in self._entries.values()), default=None)
+        return entry
+
+    def record_write(
+        self,
+        key: str,
+        service: str,
+        size: int,
+        ttl_hours: Optional[float] = None,
+        created: Optional[float] = None,
+    ) -> None:
+        """Index (or re-index) *key* after its file was written."""
+        created = created if created is not None else time.time()
+        with self._lock:
+            previous = self._entries.get(key)
+            self._add(ManifestEntry(
+                key=key,
+                service=service,
+                size=size,
+                created=created,
+                expires=self._expires(created, ttl_hours),
+                last_access=created,
+                hits=previous.hits if previous else 0,
+            ))
+
+    def remove(self, key: str) -> Optional[ManifestEntry]:
+        """Drop *key* from the index (after its file was deleted)."""
+        with self._lock:
+            return self._discard(key)
+
+    def evict(self, entry: ManifestEntry) -> bool:
+        """
+        Delete *entry*'s file and drop it from the index.
+
+        Skipped (returns False) if the key was rewritten since *entry* was
+        snapshotted, so a janitor pass never removes a fresh write.
+        """
+        with self._lock:
+            if self._entries.get(entry.key) is not entry:
+                return False
+            try:
+                (self.cache_dir / f"{entry.key}.json").unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                return False
+            self._discard(entry.key)
+            return True
+
+    def record_hit(self, service: str, key: str, stale: bool = False) -> None:
+        """Count a cache hit for *service* and mark *key* as recently used."""
+        with self._lock:
+            if stale:
+                self._service_stale[service] += 1
+            else:
+                self._service_hits[service] += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.hits += 1
+                entry.last_access = time.time()
+
+    def record_miss(self, service: str) -> None:
+        """Count a cache miss (upstream fetch) for *service*."""
+        with self._lock:
+            self._service_misses[service] += 1
+
+    def rebuild(self) -> None:
+        """
+        Scan the cache directory once and index every entry.
+
+        Only file headers are read.  Entries recorded while the scan runs are
+        newer than what is on disk and are kept as-is.
+        """
+        scanned: list[ManifestEntry] = []
+        if self.cache_dir.exists():
+            with os.scandir(self.cache_dir) as it:
+                for dirent in it:
+                    if not dirent.name.endswith(".json") or not dirent.is_file():
+                        continue
+                    try:
+                        stat = dirent.stat()
+                        meta = read_cache_meta(Path(dirent.path))
+                    except OSError:
+                        continue
+                    scanned.append(ManifestEntry(
+                        key=dirent.name[:-len(".json")],
+                        service=meta.get("service") or UNKNOWN_SERVICE,
+                        size=stat.st_size,
+                        created=stat.st_mtime,
+                        expires=self._expires(stat.st_mtime, meta.get("ttl")),
+                        last_access=stat.st_mtime,
+                    ))
+        with self._lock:
+            for entry in scanned:
+                if entry.key not in self._entries:
+                    self._add(entry)
+            self.loaded = True
+
+    # -- Reporting -------------------------------------------------------------
+
+    def summary(self) -> dict[str, Any]:
+        """Directory totals plus per-service sizes and hit ratios."""
+        with self._lock:
+            services = set(self._service_files) | set(self._service_misses) | set(self._service_hits)
+            by_service = {}
+            for svc in sorted(services):
+                hits = self._service_hits[svc] + self._service_stale[svc]
+                lookups = hits + self._service_misses[svc]
+                by_service[svc] = {
+                    "files": self._service_files[svc],
+                    "size_mb": round(self._service_bytes[svc] / 1048576, 2),
+                    "hits": self._service_hits[svc],
+                    "stale_hits": self._service_stale[svc],
+                    "misses": self._service_misses[svc],
+                    "hit_ratio": round(hits / lookups, 4) if lookups else None,
+                }
+            return {
+                "files": len(self._entries),
+                "size_mb": round(self._total_bytes / 1048576, 2),
+                "oldest_entry": (
+                    datetime.fromtimestamp(self._oldest).isoformat() if self._oldest else None
+                ),
+                "by_service": by_service,
+            }
+
+
+_manifests: dict[Path, CacheManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def get_cache_manifest(cache_dir: Path, default_ttl_hours: float = 48) -> CacheManifest:
+    """Return the process-wide manifest for *cache_dir* (created on first use)."""
+    cache_dir = Path(cache_dir)
+    with _manifests_lock:
+        manifest = _manifests.get(cache_dir)
+        if manifest is None:
+            manifest = _manifests[cache_dir] = CacheManifest(cache_dir, default_ttl_hours)
+        return manifest
@@ -0,0 +1,188 @@
+"""
+Cache janitor: keeps ``data/cache`` within a byte budget.
+
+Every distinct query parameter (``days``, ``fiscal_year``, ``cycle``, ...)
+gets its own cache file, so without cleanup the directory grows without
+bound.  Each pass works from the ``CacheManifest`` (no directory scan):
+
+1. Entries past their TTL *and* the stale-while-revalidate window are
+   removed — they can never be served again.
+2. If the directory is still over ``settings.cache_max_bytes``, entries are
+   evicted by policy until it fits: ``"lru"`` (least recently accessed) or
+   ``"lfu"`` (fewest hits, then least recently accessed).
+
+Entries written with an infinite TTL are permanent: stores that later
+refreshes build on (the debt history, closed BLS years) rather than
+disposable responses.  They never expire and are never evicted; they count
+toward the total but the budget is enforced on the other entries.
+
+The janitor runs periodically from the FastAPI lifespan and on demand via
+``scripts/cache_janitor.py``.
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from app.config import get_settings
+from app.services.cache import CacheManifest, ManifestEntry, get_cache_manifest
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+EVICTION_POLICIES = ("lru", "lfu")
+
+
+@dataclass
+class JanitorReport:
+    """Outcome of one janitor pass."""
+
+    policy: str
+    budget_bytes: int
+    dry_run: bool = False
+    files_before: int = 0
+    bytes_before: int = 0
+    expired: int = 0
+    evicted: int = 0
+    freed_bytes: int = 0
+    bytes_after: int = 0
+    evicted_keys: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        report = asdict(self)
+        report.pop("evicted_keys")
+        return report
+
+
+class CacheJanitor:
+    """Removes dead cache entries and enforces a total byte budget."""
+
+    def __init__(
+        self,
+        manifest: CacheManifest,
+        max_bytes: int,
+        policy: str = "lru",
+        stale_ttl_hours: float = 0,
+    ) -> None:
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown cache eviction policy {policy!r}; expected one of {EVICTION_POLICIES}"
+            )
+        self.manifest = manifest
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.stale_ttl_hours = stale_ttl_hours
+        self.runs = 0
+        self.total_evicted = 0
+        self.total_freed_bytes = 0
+        self.last_report: Optional[JanitorReport] = None
+
+    def _victim_order(self, entries: list[ManifestEntry]) -> list[ManifestEntry]:
+        if self.policy == "lfu":
+            return sorted(entries, key=lambda e: (e.hits, e.last_access))
+        return sorted(entries, key=lambda e: e.last_access)
+
+    def run_once(self, dry_run: bool = False) -> JanitorReport:
+        """
+        Run one pass and return what was (or, with *dry_run*, would be) removed.
+
+        Blocking (unlinks files); call via ``asyncio.to_thread`` from async code.
+        """
+        started = time.perf_counter()
+        if not self.manifest.loaded:
+            self.manifest.rebuild()
+
+        entries = self.manifest.entries()
+        report = JanitorReport(
+            policy=self.policy,
+            budget_bytes=self.max_bytes,
+            dry_run=dry_run,
+            files_before=len(entries),
+            bytes_before=sum(e.size for e in entries),
+        )
+        remaining = report.bytes_before
+
+        def _remove(entry: ManifestEntry) -> bool:
+            nonlocal remaining
+            if not dry_run and not self.manifest.evict(entry):
+                return False
+            remaining -= entry.size
+            report.freed_bytes += entry.size
+            report.evicted_keys.append(entry.key)
+            return True
+
+        dead_before = time.time() - self.stale_ttl_hours * 3600
+        live = []
+        for entry in entries:
+            if math.isinf(entry.expires):
+                continue  # permanent
+            if entry.expires < dead_before:
+                if _remove(entry):
+                    report.expired += 1
+            else:
+                live.append(entry)
+
+        if remaining > self.max_bytes:
+            for entry in self._victim_order(live):
+                if remaining <= self.max_bytes:
+                    break
+                if _remove(entry):
+                    report.evicted += 1
+
+        report.bytes_after = remaining
+        report.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        if not dry_run:
+            self.runs += 1
+            self.total_evicted += report.expired + report.evicted
+            self.total_freed_bytes += report.freed_bytes
+            self.last_report = report
+        if report.evicted_keys:
+            logger.info(
+                "Cache janitor%s: removed %d expired + %d over-budget entries (%.1f MB freed, %.1f MB remain, policy=%s)",
+                " (dry run)" if dry_run else "",
+                report.expired, report.evicted,
+                report.freed_bytes / 1048576, report.bytes_after / 1048576, self.policy,
+            )
+        return report
+
+    async def run_forever(self, interval_seconds: float) -> None:
+        """Run a pass every *interval_seconds* until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.warning("Cache janitor pass failed: %s", e)
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """Cumulative counters plus the most recent pass, for diagnostics."""
+        return {
+            "policy": self.policy,
+            "budget_mb": round(self.max_bytes / 1048576, 2),
+            "runs": self.runs,
+            "evicted": self.total_evicted,
+            "freed_mb": round(self.total_freed_bytes / 1048576, 2),
+            "last_run": self.last_report.as_dict() if self.last_report else None,
+        }
+
+
+_janitor: Optional[CacheJanitor] = None
+
+
+def get_cache_janitor() -> CacheJanitor:
+    """Return the janitor for ``settings.data_dir / "cache"``."""
+    global _janitor
+    if _janitor is None:
+        manifest = get_cache_manifest(settings.data_dir / "cache", settings.cache_ttl_hours)
+        _janitor = CacheJanitor(
+            manifest,
+            max_bytes=settings.cache_max_bytes,
+            policy=settings.cache_eviction_policy,
+            stale_ttl_hours=settings.cache_stale_ttl_hours,
+        )
+    return _janitor
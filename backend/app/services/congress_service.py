@@ -5,11 +5,16 @@ Fetches congressional stock trading data from the Capitol Trades API.
 API: https://trades.telep.io
 """
 
+import asyncio
+import math
 import os
+import time
 import httpx
 from typing import Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 
+from app.services.cache import SingleFlight
+from app.services.http_client import get_http_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,15 +22,26 @@ logger = get_logger(__name__)
 # Capitol Trades API base URL
 CAPITOL_TRADES_API = os.getenv("CAPITOL_TRADES_API", "https://trades.telep.io")
 
+# Local copy of the trade list, for aggregates the API does not serve
+# (trade counts per ticker).  Pages are newest first, so the page cap keeps
+# the most recent trades.
+TRADES_PAGE_SIZE = 500
+TRADES_MAX_PAGES = int(os.getenv("CAPITOL_TRADES_MAX_PAGES", "40"))
+TRADES_DATASET_TTL = int(os.getenv("CAPITOL_TRADES_DATASET_TTL", str(6 * 3600)))  # seconds
+TRADES_RETRY_SECONDS = int(os.getenv("CAPITOL_TRADES_RETRY_SECONDS", "300"))
+
+_trades_dataset: Optional[tuple[float, list[dict]]] = None  # (fetched at, trades)
+_trades_retry_at = 0.0  # no refresh before this time after a failed one
+_dataset_flight = SingleFlight()
+
 
 async def _fetch_trades(endpoint: str, params: dict = None) -> dict:
     """Fetch data from Capitol Trades API"""
     url = f"{CAPITOL_TRADES_API}/api{endpoint}"
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Error fetching from Capitol Trades API: {e}")
         return {}
@@ -272,19 +288,69 @@ async def get_all_transactions(
     }
 
 
+async def _fetch_trades_page(page: int) -> dict:
+    return await _fetch_trades("/trades", {
+        "per_page": TRADES_PAGE_SIZE,
+        "page": page,
+        "sort_by": "transaction_date",
+        "sort_order": "desc",
+    })
+
+
+async def _load_trades_dataset() -> list[dict]:
+    """
+    Download the trade list: page 1 for the total, the rest concurrently.
+
+    Kept only if every page arrived; on failure the previous copy (however
+    old) is served, or an empty list if there is none, and the next attempt
+    waits ``TRADES_RETRY_SECONDS``.
+    """
+    global _trades_dataset, _trades_retry_at
+    first = await _fetch_trades_page(1)
+    trades = list(first.get("trades", []))
+    pages = min(math.ceil(first.get("total", 0) / TRADES_PAGE_SIZE), TRADES_MAX_PAGES)
+    rest = await asyncio.gather(*(_fetch_trades_page(p) for p in range(2, pages + 1)))
+
+    if not first or not all(rest):
+        logger.warning("Capitol Trades dataset refresh incomplete, keeping previous copy")
+        _trades_retry_at = time.time() + TRADES_RETRY_SECONDS
+        return _trades_dataset[1] if _trades_dataset else []
+
+    for data in rest:
+        trades.extend(data.get("trades", []))
+    _trades_dataset = (time.time(), trades)
+    logger.info(f"Loaded {len(trades)} congressional trades ({pages} pages)")
+    return trades
+
+
+async def _get_trades_dataset() -> list[dict]:
+    """The cached trade list, refreshed every ``TRADES_DATASET_TTL`` seconds."""
+    now = time.time()
+    if _trades_dataset is not None and now - _trades_dataset[0] < TRADES_DATASET_TTL:
+        return _trades_dataset[1]
+    if now < _trades_retry_at:
+        return _trades_dataset[1] if _trades_dataset else []
+    return await _dataset_flight.do("trades", _load_trades_dataset)
+
+
 async def get_popular_tickers(limit: int = 10) -> list[dict]:
-    """Get most traded stock tickers"""
-    data = await _fetch_trades("/trades/tickers")
-    tickers = data.get("tickers", [])[:limit]
-    
-    # Need to get trade counts per ticker
-    results = []
-    for ticker in tickers:
-        ticker_data = await _fetch_trades("/trades", {"ticker": ticker, "per_page": 1})
-        results.append({
-            "ticker": ticker,
-            "name": "",
-            "trades": ticker_data.get("total", 0)
-        })
-    
-    return sorted(results, key=lambda x: x["trades"], reverse=True)
+    """
+    Get most traded stock tickers.
+
+    Counts cover the newest ``TRADES_MAX_PAGES * TRADES_PAGE_SIZE`` trades
+    (20,000 by default), not the full history.
+    """
+    # Counted from the local trade list, so the upstream cost does not grow with limit
+    counts: Counter = Counter()
+    names: dict[str, str] = {}
+    for tx in await _get_trades_dataset():
+        ticker = tx.get("ticker")
+        if not ticker or ticker == "N/A":
+            continue
+        counts[ticker] += 1
+        names.setdefault(ticker, tx.get("asset_name") or "")
+
+    return [
+        {"ticker": ticker, "name": names[ticker], "trades": trades}
+        for ticker, trades in counts.most_common(limit)
+    ]
@@ -316,7 +316,7 @@ class DebtDeepDiveService(BaseGovService):
 
         async def _fetch() -> dict:
             client = await self._get_client()
-            resp = await client.get(TIC_URL, headers={"Accept": "text/plain"})
+            resp = await client.get(TIC_URL, headers={"Accept": "text/plain"}, timeout=self.TIMEOUT)
             resp.raise_for_status()
             text = resp.text
 
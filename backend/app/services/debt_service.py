@@ -14,6 +14,7 @@ No API key required - public API.
 """
 
 import asyncio
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -21,6 +22,9 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
+from app.services.base import ServiceError
+from app.services.gov_data import get_gov_data_service
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -54,24 +58,12 @@ class TreasuryDebtService:
         "debt_by_holder": "/v2/accounting/od/schedules/debt_to_penny",
     }
     
-    def __init__(self):
-        """Initialize the Treasury Debt service."""
-        self.client = None
-        
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers={"Accept": "application/json"}
-            )
-        return self.client
+        """Return the process-wide shared HTTP client (looked up per request)."""
+        return get_http_client()
     
     async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        """Nothing to release; the shared client is closed in the app lifespan."""
 
     # =========================================================================
     # DEBT TO THE PENNY (Latest)
@@ -102,7 +94,7 @@ class TreasuryDebtService:
         
         try:
             client = await self._get_client()
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -144,7 +136,7 @@ class TreasuryDebtService:
         """
         Get historical debt data.
         
-        API: /v2/accounting/od/debt_to_penny
+        API: /v2/accounting/od/debt_to_penny (via ``GovDataService.get_debt_history``)
         
         Args:
             start_date: Start date (YYYY-MM-DD)
@@ -154,51 +146,43 @@ class TreasuryDebtService:
         Returns:
             List of historical debt records
         """
-        url = f"{self.BASE_URL}{self.ENDPOINTS['debt_to_penny']}"
-        
         # Default to last 10 years of monthly data
         if not start_date:
             start_date = (datetime.now() - timedelta(days=3650)).strftime("%Y-%m-%d")
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d")
         
-        params = {
-            "filter": f"record_date:gte:{start_date},record_date:lte:{end_date}",
-            "sort": "-record_date",
-            "page[size]": 10000,  # Max
-            "format": "json"
-        }
-        
+        # Sliced from the shared, incrementally refreshed debt_to_penny history
+        # instead of re-downloading the date range from Treasury.
         try:
-            client = await self._get_client()
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            records = data.get("data", [])
-            
-            # Process records
-            results = []
-            for record in records:
-                results.append({
-                    "record_date": record.get("record_date"),
-                    "total_public_debt": self._parse_amount(record.get("tot_pub_debt_out_amt")),
-                    "debt_held_by_public": self._parse_amount(record.get("debt_held_public_amt")),
-                    "intragov_holdings": self._parse_amount(record.get("intragov_hold_amt")),
-                })
-            
-            # Apply frequency filter
-            if frequency == "monthly":
-                results = self._filter_monthly(results)
-            elif frequency == "yearly":
-                results = self._filter_yearly(results)
-            
-            logger.info(f"Fetched {len(results)} historical debt records")
-            return results
-            
-        except httpx.HTTPError as e:
+            history = await get_gov_data_service().get_debt_history()
+        except ServiceError as e:
             logger.error(f"Failed to fetch historical debt: {e}")
             raise DebtServiceError(f"Failed to fetch historical debt: {e}")
+        
+        dates = history["dates"]
+        lo = bisect_left(dates, start_date)
+        hi = bisect_right(dates, end_date)
+        
+        # Newest first, as the API's "-record_date" sort returned them
+        results = [
+            {
+                "record_date": dates[i],
+                "total_public_debt": self._parse_amount(history["total_debt"][i]),
+                "debt_held_by_public": self._parse_amount(history["debt_held_public"][i]),
+                "intragov_holdings": self._parse_amount(history["intragov_holdings"][i]),
+            }
+            for i in range(hi - 1, lo - 1, -1)
+        ]
+        
+        # Apply frequency filter
+        if frequency == "monthly":
+            results = self._filter_monthly(results)
+        elif frequency == "yearly":
+            results = self._filter_yearly(results)
+        
+        logger.info(f"Fetched {len(results)} historical debt records")
+        return results
     
     async def get_debt_by_year(
         self,
@@ -272,7 +256,7 @@ class TreasuryDebtService:
         
         try:
             client = await self._get_client()
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
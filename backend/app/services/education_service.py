@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -66,10 +67,11 @@ class EducationDataService:
             if self.api_key:
                 params['api_key'] = self.api_key
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/schools", params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = await get_http_client().get(
+                f"{self.base_url}/schools", params=params, timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
             
             # Process enrollment data
             schools = data.get('results', [])
@@ -164,10 +166,11 @@ class EducationDataService:
             if self.api_key:
                 params['api_key'] = self.api_key
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/schools", params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = await get_http_client().get(
+                f"{self.base_url}/schools", params=params, timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
             
             # Process outcomes data
             schools = data.get('results', [])
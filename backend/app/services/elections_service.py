@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -77,22 +78,13 @@ class FECElectionsService:
             api_key: FEC/data.gov API key (register at https://api.data.gov/signup/)
         """
         self.api_key = api_key or getattr(settings, 'fec_api_key', None)
-        self.client = None
         
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers={"Accept": "application/json"}
-            )
-        return self.client
+        """Return the process-wide shared HTTP client (looked up per request)."""
+        return get_http_client()
     
     async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        """Nothing to release; the shared client is closed in the app lifespan."""
 
     # =========================================================================
     # STATIC DATA (doesn't require API)
@@ -223,7 +215,7 @@ class FECElectionsService:
         
         try:
             client = await self._get_client()
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -262,7 +254,7 @@ class FECElectionsService:
         
         try:
             client = await self._get_client()
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -313,7 +305,7 @@ class FECElectionsService:
         
         try:
             client = await self._get_client()
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             return response.json()
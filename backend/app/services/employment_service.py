@@ -12,27 +12,40 @@ Data includes:
 
 API v2 registration (free): https://data.bls.gov/registrationEngine/
 For higher rate limits, get an API key.
+
+Extends ``BaseGovService`` for the HTTP client, retries and file-based
+caching.  Observations are stored per (series, year), so any request is
+assembled from the store and only missing or outdated years go to BLS.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from app.config import get_settings
+from app.services.base import BaseGovService, ServiceError
 from app.utils.logger import get_logger
+from app.utils.schedules import (
+    next_employment_release,
+    next_state_release,
+    previous_annual_revision,
+    previous_employment_release,
+    previous_state_release,
+)
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 
-class EmploymentServiceError(Exception):
+class EmploymentServiceError(ServiceError):
     """Custom exception for employment service errors."""
     pass
 
 
-class BLSEmploymentService:
+class BLSEmploymentService(BaseGovService):
     """
     Service for fetching employment data from Bureau of Labor Statistics.
     
@@ -49,6 +62,7 @@ class BLSEmploymentService:
     - LNS13000000: Unemployment Level
     """
     
+    SERVICE_NAME = "bls_employment"
     BASE_URL = "https://api.bls.gov/publicAPI/v2"
     TIMEOUT = 30  # seconds
     
@@ -96,7 +110,7 @@ class BLSEmploymentService:
         "government": "CES9000000001",
     }
     
-    # State unemployment rate series (LAUST prefixes)
+    # State (plus DC and Puerto Rico) unemployment rate series (LASST prefixes)
     STATE_CODES = {
         "AL": "01", "AK": "02", "AZ": "04", "AR": "05", "CA": "06",
         "CO": "08", "CT": "09", "DE": "10", "DC": "11", "FL": "12",
@@ -108,7 +122,46 @@ class BLSEmploymentService:
         "OH": "39", "OK": "40", "OR": "41", "PA": "42", "RI": "44",
         "SC": "45", "SD": "46", "TN": "47", "TX": "48", "UT": "49",
         "VT": "50", "VA": "51", "WA": "53", "WV": "54", "WI": "55",
-        "WY": "56"
+        "WY": "56", "PR": "72"
+    }
+
+    # BLS v2 per-request limits (registered key vs. anonymous)
+    MAX_SERIES_PER_REQUEST = 50
+    MAX_SERIES_PER_REQUEST_NO_KEY = 25
+    MAX_YEARS_PER_REQUEST = 20
+    MAX_YEARS_PER_REQUEST_NO_KEY = 10
+
+    # Recent years are re-checked at least this often even if no release
+    # is due, in case a release slipped past the first Friday.
+    RECENT_YEAR_MAX_AGE_HOURS = 24 * 7
+
+    # Series each report section reads (keys into SERIES_IDS)
+    SUMMARY_SERIES = (
+        "unemployment_rate", "labor_force", "employed",
+        "unemployed", "participation_rate", "nonfarm_employment",
+    )
+    DEMOGRAPHIC_SERIES = {
+        "Adult Men (20+)": "unemployment_men",
+        "Adult Women (20+)": "unemployment_women",
+        "Teenagers (16-19)": "unemployment_teen",
+        "White": "unemployment_white",
+        "Black or African American": "unemployment_black",
+        "Asian": "unemployment_asian",
+        "Hispanic or Latino": "unemployment_hispanic",
+    }
+    SECTOR_SERIES = {
+        "Mining and Logging": "mining",
+        "Construction": "construction",
+        "Manufacturing": "manufacturing",
+        "Wholesale Trade": "wholesale_trade",
+        "Retail Trade": "retail_trade",
+        "Transportation": "transportation",
+        "Information": "information",
+        "Financial Activities": "financial",
+        "Professional & Business Services": "professional_services",
+        "Education & Health Services": "education_health",
+        "Leisure & Hospitality": "leisure_hospitality",
+        "Government": "government",
     }
     
     def __init__(self, api_key: Optional[str] = None):
@@ -118,56 +171,38 @@ class BLSEmploymentService:
         Args:
             api_key: Optional BLS API key for higher rate limits
         """
+        super().__init__()
         self.api_key = api_key or getattr(settings, 'bls_api_key', None)
-        self.client = None
-        
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
-            )
-        return self.client
-    
-    async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
 
     # =========================================================================
     # CORE API METHODS
     # =========================================================================
-    
-    async def fetch_series(
+
+    @property
+    def max_series_per_request(self) -> int:
+        """Series per BLS request: 50 with an API key, 25 without."""
+        return self.MAX_SERIES_PER_REQUEST if self.api_key else self.MAX_SERIES_PER_REQUEST_NO_KEY
+
+    @property
+    def max_years_per_request(self) -> int:
+        """Year span per BLS request: 20 with an API key, 10 without."""
+        return self.MAX_YEARS_PER_REQUEST if self.api_key else self.MAX_YEARS_PER_REQUEST_NO_KEY
+
+    async def _request_series(
         self,
         series_ids: List[str],
-        start_year: Optional[int] = None,
-        end_year: Optional[int] = None
+        start_year: int,
+        end_year: int
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Fetch time series data from BLS API.
+        One BLS API request (no store involved).
         
         API: POST /publicAPI/v2/timeseries/data/
-        
-        Args:
-            series_ids: List of BLS series IDs
-            start_year: Starting year
-            end_year: Ending year
             
         Returns:
-            Dict mapping series IDs to their data
+            Dict mapping series IDs to their data, newest first
         """
         url = f"{self.BASE_URL}/timeseries/data/"
-        
-        # Default to last 5 years
-        end_year = end_year or datetime.now().year
-        start_year = start_year or (end_year - 5)
-        
         payload = {
             "seriesid": series_ids,
             "startyear": str(start_year),
@@ -179,37 +214,214 @@ class BLSEmploymentService:
             payload["registrationkey"] = self.api_key
         
         try:
-            client = await self._get_client()
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get("status") != "REQUEST_SUCCEEDED":
-                raise EmploymentServiceError(f"BLS API error: {data.get('message', 'Unknown error')}")
+            data = await self._fetch_json(url, method="POST", json_body=payload)
+        except ServiceError as e:
+            logger.error(f"Failed to fetch BLS data: {e}")
+            raise EmploymentServiceError(f"Failed to fetch BLS data: {e}", source=self.SERVICE_NAME, url=url) from e
+        
+        if data.get("status") != "REQUEST_SUCCEEDED":
+            raise EmploymentServiceError(
+                f"BLS API error: {data.get('message', 'Unknown error')}", source=self.SERVICE_NAME, url=url,
+            )
+        
+        # Parse results into dict by series ID
+        results = {}
+        for series in data.get("Results", {}).get("series", []):
+            series_id = series.get("seriesID")
+            series_data = []
             
-            # Parse results into dict by series ID
-            results = {}
-            for series in data.get("Results", {}).get("series", []):
-                series_id = series.get("seriesID")
-                series_data = []
-                
-                for item in series.get("data", []):
-                    series_data.append({
-                        "year": int(item.get("year")),
-                        "period": item.get("period"),  # M01-M12 for months
-                        "value": float(item.get("value")),
-                        "footnotes": item.get("footnotes", [])
-                    })
-                
-                results[series_id] = series_data
+            for item in series.get("data", []):
+                series_data.append({
+                    "year": int(item.get("year")),
+                    "period": item.get("period"),  # M01-M12 for months
+                    "value": float(item.get("value")),
+                    "footnotes": item.get("footnotes", [])
+                })
             
-            logger.info(f"Fetched {len(results)} BLS series")
-            return results
+            results[series_id] = series_data
+        
+        logger.info(f"Fetched {len(results)} BLS series ({start_year}-{end_year})")
+        return results
+
+    async def _fetch_upstream(
+        self,
+        series_ids: List[str],
+        start_year: int,
+        end_year: int
+    ) -> Dict[str, Dict[int, List[Dict[str, Any]]]]:
+        """
+        Fetch *series_ids* over the year range in the fewest BLS requests.
+
+        Series are split into chunks of ``max_series_per_request`` and the
+        range into spans of ``max_years_per_request``; the requests run
+        concurrently (the shared client's BLS token bucket still paces
+        them) and identical requests already in flight are joined.
+
+        Returns:
+            ``{series_id: {year: rows}}``
+        """
+        size = self.max_series_per_request
+        span = self.max_years_per_request
+        jobs = [
+            (series_ids[i:i + size], lo, min(lo + span - 1, end_year))
+            for i in range(0, len(series_ids), size)
+            for lo in range(start_year, end_year + 1, span)
+        ]
+        results = await asyncio.gather(*(
+            self._inflight.do(
+                self._cache_key("request", *chunk, lo, hi),
+                partial(self._request_series, chunk, lo, hi),
+            )
+            for chunk, lo, hi in jobs
+        ))
+        by_year: Dict[str, Dict[int, List[Dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
+        for result in results:
+            for series_id, rows in result.items():
+                for row in rows:
+                    by_year[series_id][row["year"]].append(row)
+        return by_year
+
+    # -- Series store ---------------------------------------------------------
+
+    def _year_max_age(self, year: int, now: datetime) -> float:
+        """
+        Seconds a stored (series, year) stays fresh.
+
+        Recent years change with every monthly release (capped so a release
+        that slipped past the first Friday is picked up within days); older
+        years only change with the February annual revision.
+        """
+        if year >= now.year - 1:
+            since = (now - previous_employment_release(now)).total_seconds()
+            return min(since, self.RECENT_YEAR_MAX_AGE_HOURS * 3600)
+        return (now - previous_annual_revision(now)).total_seconds()
+
+    def _year_ttl_hours(self, year: int, now: datetime) -> float:
+        """
+        TTL recorded with a (series, year) written *now*.
+
+        Recent years expire at the next release.  Closed years are stored
+        permanently (out of the cache janitor's reach): they are what
+        later requests skip fetching and what is served when BLS is down.
+        The February revision still refreshes them through
+        ``_year_max_age``.
+        """
+        if year >= now.year - 1:
+            return (next_employment_release(now) - now).total_seconds() / 3600
+        return float("inf")
+
+    async def _load_year(
+        self,
+        series_id: str,
+        year: int,
+        max_age: float
+    ) -> tuple[Optional[List[Dict[str, Any]]], bool]:
+        """Return ``(rows, fresh)`` for a stored (series, year); rows is *None* if absent."""
+        key = self._cache_key("series", series_id, year)
+        cached = self._memory.get(key, max_age)
+        if cached is not None:
+            self._manifest.record_hit(self.SERVICE_NAME, key)
+            return cached["data"], True
+        entry = await self._aload_cache_entry(key)
+        if entry is None:
+            self._manifest.record_miss(self.SERVICE_NAME)
+            return None, False
+        data, written_at, size = entry
+        if time.time() - written_at < max_age:
+            self._memory.set(key, data, written_at, size)
+            self._manifest.record_hit(self.SERVICE_NAME, key)
+            return data["data"], True
+        self._manifest.record_miss(self.SERVICE_NAME)
+        return data["data"], False
+
+    async def _store_year(self, series_id: str, year: int, rows: List[Dict[str, Any]], ttl: float) -> None:
+        key = self._cache_key("series", series_id, year)
+        data = {"series_id": series_id, "year": year, "data": rows}
+        size = await self._awrite_cache(key, data, ttl)
+        self._memory.set(key, data, time.time(), size)
+
+    async def fetch_series(
+        self,
+        series_ids: List[str],
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch time series data for any number of series.
+
+        Observations are kept in a local store with one entry per
+        (series, year).  Pairs that are stored and still current for the
+        BLS release calendar are served locally; only the rest are
+        requested from BLS, grouped so series missing the same years share
+        requests.  If BLS fails, outdated stored pairs are served instead
+        when every missing pair has one.
+        
+        Args:
+            series_ids: List of BLS series IDs
+            start_year: Starting year (default: five years before end_year)
+            end_year: Ending year (default: current year)
             
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch BLS data: {e}")
-            raise EmploymentServiceError(f"Failed to fetch BLS data: {e}")
+        Returns:
+            Dict mapping series IDs to their data, newest first
+        """
+        end_year = end_year or datetime.now().year
+        start_year = start_year or (end_year - 5)
+        unique = list(dict.fromkeys(series_ids))
+        years = range(start_year, end_year + 1)
+        now = datetime.now(timezone.utc)
+        pairs = [(sid, year) for sid in unique for year in years]
+
+        loaded = await asyncio.gather(*(
+            self._load_year(sid, year, self._year_max_age(year, now)) for sid, year in pairs
+        ))
+        stored: Dict[tuple[str, int], List[Dict[str, Any]]] = {}
+        stale: Dict[tuple[str, int], List[Dict[str, Any]]] = {}
+        missing: Dict[str, List[int]] = defaultdict(list)
+        for (sid, year), (rows, fresh) in zip(pairs, loaded):
+            if fresh:
+                stored[(sid, year)] = rows
+            else:
+                missing[sid].append(year)
+                if rows is not None:
+                    stale[(sid, year)] = rows
+
+        if missing:
+            # Series missing the same year range share requests.
+            plan: Dict[tuple[int, int], List[str]] = defaultdict(list)
+            for sid, missing_years in missing.items():
+                plan[(min(missing_years), max(missing_years))].append(sid)
+            try:
+                fetched = await asyncio.gather(*(
+                    self._fetch_upstream(ids, lo, hi) for (lo, hi), ids in plan.items()
+                ))
+            except EmploymentServiceError:
+                needed = [(sid, y) for sid, ys in missing.items() for y in ys]
+                if not all(pair in stale for pair in needed):
+                    raise
+                logger.warning("BLS unavailable; serving %d outdated series-years from the store", len(needed))
+                stored.update(stale)
+            else:
+                writes = []
+                for ((lo, hi), ids), by_year in zip(plan.items(), fetched):
+                    for sid in ids:
+                        for year in range(lo, hi + 1):
+                            rows = by_year.get(sid, {}).get(year, [])
+                            stored[(sid, year)] = rows
+                            writes.append(self._store_year(sid, year, rows, self._year_ttl_hours(year, now)))
+                await asyncio.gather(*writes)
+
+        return {
+            sid: [row for year in reversed(years) for row in stored[(sid, year)]]
+            for sid in unique
+        }
+
+    def _ids(self, keys) -> List[str]:
+        return [self.SERIES_IDS[k] for k in keys]
+
+    @staticmethod
+    def _trend_start_year(months: int, end_year: int) -> int:
+        """First year needed for a *months*-long monthly trend."""
+        return end_year - ((months // 12) + 2)
 
     # =========================================================================
     # UNEMPLOYMENT DATA
@@ -228,16 +440,15 @@ class BLSEmploymentService:
         Returns:
             Monthly unemployment rate data
         """
-        years_needed = (months // 12) + 2
         end_year = datetime.now().year
-        start_year = end_year - years_needed
-        
         data = await self.fetch_series(
             [self.SERIES_IDS["unemployment_rate"]],
-            start_year,
+            self._trend_start_year(months, end_year),
             end_year
         )
-        
+        return self._unemployment_trend_from(data, months)
+
+    def _unemployment_trend_from(self, data: Dict[str, List[Dict[str, Any]]], months: int) -> List[Dict[str, Any]]:
         series = data.get(self.SERIES_IDS["unemployment_rate"], [])
         
         # Convert to standard format and limit
@@ -260,23 +471,14 @@ class BLSEmploymentService:
         Returns:
             Dict of demographic group -> unemployment rate
         """
-        demographic_series = {
-            "Adult Men (20+)": self.SERIES_IDS["unemployment_men"],
-            "Adult Women (20+)": self.SERIES_IDS["unemployment_women"],
-            "Teenagers (16-19)": self.SERIES_IDS["unemployment_teen"],
-            "White": self.SERIES_IDS["unemployment_white"],
-            "Black or African American": self.SERIES_IDS["unemployment_black"],
-            "Asian": self.SERIES_IDS["unemployment_asian"],
-            "Hispanic or Latino": self.SERIES_IDS["unemployment_hispanic"],
-        }
-        
-        series_ids = list(demographic_series.values())
-        data = await self.fetch_series(series_ids)
-        
+        data = await self.fetch_series(self._ids(self.DEMOGRAPHIC_SERIES.values()))
+        return self._demographics_from(data)
+
+    def _demographics_from(self, data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, float]:
         # Get most recent value for each
         result = {}
-        for name, series_id in demographic_series.items():
-            series_data = data.get(series_id, [])
+        for name, key in self.DEMOGRAPHIC_SERIES.items():
+            series_data = data.get(self.SERIES_IDS[key], [])
             if series_data:
                 result[name] = series_data[0]["value"]
         
@@ -287,38 +489,63 @@ class BLSEmploymentService:
         Get unemployment rates by state.
         
         Note: BLS state data uses different series format.
-        Uses LAUST (Local Area Unemployment Statistics).
+        Uses LASST (Local Area Unemployment Statistics, statewide).
+
+        Every entry in ``STATE_CODES`` is fetched: the series are split into
+        request-sized chunks fetched concurrently, and the merged result is
+        cached as one snapshot until the next state release is due.  The
+        snapshot bypasses the per-series store, whose freshness follows the
+        national release calendar.
         
         Returns:
             List of states with unemployment rates
         """
+        now = datetime.now(timezone.utc)
+        cap = self.RECENT_YEAR_MAX_AGE_HOURS
+        # Fresh if written after the latest release; a new snapshot stays
+        # current until the next one.
+        since_release = (now - previous_state_release(now)).total_seconds() / 3600
+        until_release = (next_state_release(now) - now).total_seconds() / 3600
+        snapshot = await self._cached_fetch(
+            self._cache_key("state_unemployment"),
+            self._fetch_state_snapshot,
+            ttl=min(since_release, cap),
+            store_ttl=min(until_release, cap),
+        )
+        return snapshot["states"]
+
+    async def _fetch_state_snapshot(self) -> Dict[str, Any]:
         # State unemployment series: LASST{state_code}0000000000003
-        series_ids = []
-        state_mapping = {}
-        
-        for state_abbr, state_code in self.STATE_CODES.items():
-            series_id = f"LASST{state_code}0000000000003"
-            series_ids.append(series_id)
-            state_mapping[series_id] = state_abbr
+        state_mapping = {
+            f"LASST{state_code}0000000000003": state_abbr
+            for state_abbr, state_code in self.STATE_CODES.items()
+        }
         
-        # BLS API limits to 50 series per request
-        data = await self.fetch_series(series_ids[:50])
+        # Previous year too: in January the latest data is December's.
+        end_year = datetime.now().year
+        data = await self._fetch_upstream(list(state_mapping), end_year - 1, end_year)
         
         results = []
-        for series_id, series_data in data.items():
-            if series_data:
-                state_abbr = state_mapping.get(series_id, "Unknown")
-                results.append({
-                    "state": state_abbr,
-                    "unemployment_rate": series_data[0]["value"],
-                    "year": series_data[0]["year"],
-                    "month": series_data[0]["period"]
-                })
+        for series_id, state_abbr in state_mapping.items():
+            by_year = data.get(series_id)
+            if not by_year:
+                continue
+            latest = by_year[max(by_year)][0]
+            results.append({
+                "state": state_abbr,
+                "unemployment_rate": latest["value"],
+                "year": latest["year"],
+                "month": latest["period"]
+            })
+        
+        missing = len(state_mapping) - len(results)
+        if missing:
+            logger.warning(f"BLS returned no state data for {missing} of {len(state_mapping)} series")
         
         # Sort by unemployment rate
         results.sort(key=lambda x: x["unemployment_rate"])
         
-        return results
+        return {"states": results, "fetched_at": datetime.utcnow().isoformat()}
 
     # =========================================================================
     # EMPLOYMENT DATA
@@ -331,17 +558,10 @@ class BLSEmploymentService:
         Returns:
             Summary including unemployment rate, labor force, employed, etc.
         """
-        series_ids = [
-            self.SERIES_IDS["unemployment_rate"],
-            self.SERIES_IDS["labor_force"],
-            self.SERIES_IDS["employed"],
-            self.SERIES_IDS["unemployed"],
-            self.SERIES_IDS["participation_rate"],
-            self.SERIES_IDS["nonfarm_employment"],
-        ]
-        
-        data = await self.fetch_series(series_ids)
-        
+        data = await self.fetch_series(self._ids(self.SUMMARY_SERIES))
+        return self._summary_from(data)
+
+    def _summary_from(self, data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         def get_latest(series_id):
             series = data.get(series_id, [])
             return series[0] if series else None
@@ -375,27 +595,13 @@ class BLSEmploymentService:
         Returns:
             List of sectors with employment counts
         """
-        sector_series = {
-            "Mining and Logging": self.SERIES_IDS["mining"],
-            "Construction": self.SERIES_IDS["construction"],
-            "Manufacturing": self.SERIES_IDS["manufacturing"],
-            "Wholesale Trade": self.SERIES_IDS["wholesale_trade"],
-            "Retail Trade": self.SERIES_IDS["retail_trade"],
-            "Transportation": self.SERIES_IDS["transportation"],
-            "Information": self.SERIES_IDS["information"],
-            "Financial Activities": self.SERIES_IDS["financial"],
-            "Professional & Business Services": self.SERIES_IDS["professional_services"],
-            "Education & Health Services": self.SERIES_IDS["education_health"],
-            "Leisure & Hospitality": self.SERIES_IDS["leisure_hospitality"],
-            "Government": self.SERIES_IDS["government"],
-        }
-        
-        series_ids = list(sector_series.values())
-        data = await self.fetch_series(series_ids)
-        
+        data = await self.fetch_series(self._ids(self.SECTOR_SERIES.values()))
+        return self._sectors_from(data)
+
+    def _sectors_from(self, data: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         results = []
-        for name, series_id in sector_series.items():
-            series_data = data.get(series_id, [])
+        for name, key in self.SECTOR_SERIES.items():
+            series_data = data.get(self.SERIES_IDS[key], [])
             if series_data and len(series_data) >= 2:
                 current = series_data[0]["value"]
                 previous = series_data[1]["value"]
@@ -427,16 +633,15 @@ class BLSEmploymentService:
         Returns:
             Monthly jobs added data
         """
-        years_needed = (months // 12) + 2
         end_year = datetime.now().year
-        start_year = end_year - years_needed
-        
         data = await self.fetch_series(
             [self.SERIES_IDS["nonfarm_employment"]],
-            start_year,
+            self._trend_start_year(months, end_year),
             end_year
         )
-        
+        return self._jobs_added_from(data, months)
+
+    def _jobs_added_from(self, data: Dict[str, List[Dict[str, Any]]], months: int) -> List[Dict[str, Any]]:
         series = data.get(self.SERIES_IDS["nonfarm_employment"], [])
         
         results = []
@@ -463,23 +668,32 @@ class BLSEmploymentService:
     async def get_full_employment_report(self) -> Dict[str, Any]:
         """
         Get comprehensive employment report combining all metrics.
+
+        Every series the five sections read is fetched in one batched plan
+        (see ``fetch_series``) over a year range covering all of them; each
+        section is then computed from the shared result.
         
         Returns:
             Full employment report
         """
+        months = 12
+        end_year = datetime.now().year
+        # Default fetch_series window (5 years) or the trend window, whichever is longer
+        start_year = min(end_year - 5, self._trend_start_year(months, end_year))
+        series_ids = self._ids([
+            *self.SUMMARY_SERIES,
+            *self.DEMOGRAPHIC_SERIES.values(),
+            *self.SECTOR_SERIES.values(),
+        ])
         try:
-            summary = await self.get_employment_summary()
-            unemployment_trend = await self.get_unemployment_rate(months=12)
-            demographics = await self.get_unemployment_by_demographic()
-            sectors = await self.get_jobs_by_sector()
-            jobs_added = await self.get_jobs_added(months=12)
+            data = await self.fetch_series(series_ids, start_year, end_year)
             
             return {
-                "summary": summary,
-                "unemployment_trend": unemployment_trend,
-                "demographics": demographics,
-                "sectors": sectors,
-                "jobs_added": jobs_added,
+                "summary": self._summary_from(data),
+                "unemployment_trend": self._unemployment_trend_from(data, months),
+                "demographics": self._demographics_from(data),
+                "sectors": self._sectors_from(data),
+                "jobs_added": self._jobs_added_from(data, months),
                 "source": "Bureau of Labor Statistics",
                 "fetched_at": datetime.utcnow().isoformat()
             }
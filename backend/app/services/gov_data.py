@@ -3,26 +3,26 @@ Unified government data service.
 
 Simple approach:
 1. Fetch from government APIs
-2. Cache responses as JSON files
+2. Cache responses in memory and as files (via ``BaseGovService``)
 3. Serve from cache when fresh, re-fetch when stale
 
 No Redis. No Celery. No PostgreSQL. Just files.
 """
 
-import json
-import hashlib
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any, Optional
-
-import httpx
+from datetime import datetime
+from typing import Optional
 
 from app.config import get_settings
+from app.services.base import BaseGovService, ServiceError
 
 settings = get_settings()
 
+# Legacy name kept so existing ``except DataFetchError`` handlers keep working;
+# fetch failures are raised as ``ServiceError`` by ``BaseGovService``.
+DataFetchError = ServiceError
+
 
-class GovDataService:
+class GovDataService(BaseGovService):
     """
     Unified service for fetching and caching government data.
     
@@ -31,143 +31,221 @@ class GovDataService:
     - BLS: Employment statistics  
     - Census: Population data
     - FEC: Election/campaign finance data
+
+    Extends ``BaseGovService`` for the HTTP client, retries, and the
+    memory + file cache tiers.
     """
-    
-    def __init__(self):
-        self.cache_dir = settings.data_dir / "cache"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.client = httpx.AsyncClient(timeout=30.0)
-    
-    def _cache_path(self, key: str) -> Path:
-        """Get cache file path for a given key."""
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{safe_key}.json"
-    
-    def _is_cache_fresh(self, cache_path: Path, ttl_hours: int = None) -> bool:
-        """Check if cached data is still fresh."""
-        if not cache_path.exists():
-            return False
-        
-        ttl = ttl_hours or settings.cache_ttl_hours
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        return datetime.now() - mtime < timedelta(hours=ttl)
-    
-    def _read_cache(self, key: str) -> Optional[dict]:
-        """Read data from cache if fresh."""
-        cache_path = self._cache_path(key)
-        if self._is_cache_fresh(cache_path):
-            return json.loads(cache_path.read_text())
-        return None
-    
-    def _write_cache(self, key: str, data: dict) -> None:
-        """Write data to cache."""
-        cache_path = self._cache_path(key)
-        cache_path.write_text(json.dumps(data, indent=2, default=str))
-    
-    async def _fetch_json(self, url: str, params: dict = None) -> dict:
-        """Fetch JSON from URL with error handling."""
-        try:
-            resp = await self.client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPError as e:
-            raise DataFetchError(f"Failed to fetch {url}: {e}")
+
+    SERVICE_NAME = "gov_data"
+    TIMEOUT = 30
     
     # ==================== TREASURY (Debt) ====================
     
-    async def get_national_debt(self, days: int = 365) -> dict:
+    DEBT_TO_PENNY_URL = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/debt_to_penny"
+    DEBT_TO_PENNY_FIELDS = "record_date,tot_pub_debt_out_amt,debt_held_public_amt,intragov_hold_amt"
+    DEBT_TO_PENNY_PAGE_SIZE = 10000
+
+    @staticmethod
+    def _amount(value: Optional[str]) -> Optional[float]:
+        """Parse a Treasury amount string (``"null"``/empty → *None*)."""
+        if value in (None, "", "null"):
+            return None
+        return float(value)
+
+    DEBT_HISTORY_COLUMNS = {
+        "total_debt": "tot_pub_debt_out_amt",
+        "debt_held_public": "debt_held_public_amt",
+        "intragov_holdings": "intragov_hold_amt",
+    }
+
+    async def _fetch_debt_to_penny(self, after: Optional[str] = None) -> list[dict]:
         """
-        Get national debt data from Treasury API.
-        
-        Source: https://fiscaldata.treasury.gov/
-        Updates: Daily (but historical data is static)
+        Fetch ``debt_to_penny`` records oldest first, following pagination.
+
+        With *after* (``YYYY-MM-DD``) only records dated later are requested.
         """
-        cache_key = f"treasury_debt_{days}"
-        
-        if cached := self._read_cache(cache_key):
-            return cached
-        
-        # Treasury Fiscal Data API
-        url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/debt_to_penny"
-        params = {
-            "sort": "-record_date",
-            "page[size]": min(days, 10000),
-            "fields": "record_date,tot_pub_debt_out_amt"
+        records: list[dict] = []
+        page = 1
+        while True:
+            params = {
+                "sort": "record_date",
+                "fields": self.DEBT_TO_PENNY_FIELDS,
+                "page[size]": self.DEBT_TO_PENNY_PAGE_SIZE,
+                "page[number]": page,
+            }
+            if after:
+                params["filter"] = f"record_date:gt:{after}"
+            data = await self._fetch_json(self.DEBT_TO_PENNY_URL, params=params)
+            records.extend(data.get("data", []))
+            total_pages = data.get("meta", {}).get("total-pages") or 1
+            if page >= total_pages:
+                return records
+            page += 1
+
+    def _extend_debt_history(self, history: Optional[dict], records: list[dict]) -> dict:
+        """
+        Return a new history with *records* appended after *history*.
+
+        Records not strictly newer than the last stored date are ignored, so
+        the series stays sorted and free of duplicates.  *history* itself is
+        not modified (it may be the shared in-memory cache entry).
+        """
+        dates = list(history["dates"]) if history else []
+        columns = {
+            name: list(history[name]) if history else []
+            for name in self.DEBT_HISTORY_COLUMNS
         }
-        
-        data = await self._fetch_json(url, params)
-        
-        # Simplify response
-        result = {
+        last = dates[-1] if dates else ""
+        for record in sorted(records, key=lambda r: r["record_date"]):
+            if record["record_date"] <= last:
+                continue
+            dates.append(record["record_date"])
+            for name, field in self.DEBT_HISTORY_COLUMNS.items():
+                columns[name].append(self._amount(record.get(field)))
+            last = record["record_date"]
+        return {
             "source": "U.S. Treasury Fiscal Data",
             "fetched_at": datetime.now().isoformat(),
+            "dates": dates,
+            **columns,
+        }
+
+    async def get_debt_history(self) -> dict:
+        """
+        Get the full ``debt_to_penny`` history as one canonical cached series.
+
+        Stored column-wise and sorted by date ascending, so every ``days``
+        window and the latest point are cheap slices of the same entry::
+
+            {"source", "fetched_at", "dates": [...], "total_debt": [...],
+             "debt_held_public": [...], "intragov_holdings": [...]}
+
+        Published records never change, so a refresh only asks Treasury for
+        records after the last stored date and appends them; the full series
+        is downloaded only when nothing usable is cached.  The entry is
+        permanent so the cache janitor cannot remove the base it extends.
+
+        Source: https://fiscaldata.treasury.gov/
+        Updates: Daily (but historical data is static)
+        """
+        cache_key = self._cache_key("treasury_debt_history")
+
+        async def _fetch() -> dict:
+            entry = await self._aload_cache_entry(cache_key)
+            previous = entry[0] if entry else (self._memory.peek(cache_key) or (None,))[0]
+            usable = (
+                isinstance(previous, dict)
+                and previous.get("dates")
+                and all(name in previous for name in self.DEBT_HISTORY_COLUMNS)
+            )
+            if not usable:
+                return self._extend_debt_history(None, await self._fetch_debt_to_penny())
+            records = await self._fetch_debt_to_penny(after=previous["dates"][-1])
+            return self._extend_debt_history(previous, records)
+
+        return await self._cached_fetch(cache_key, _fetch, permanent=True)
+
+    async def get_national_debt(self, days: int = 365, columnar: bool = False) -> dict:
+        """
+        Get the most recent *days* national debt records, newest first.
+
+        Sliced from ``get_debt_history`` — every window shares one cache
+        entry and one upstream fetch.  With *columnar*, the window is
+        returned as parallel ``dates``/``values`` (total debt) arrays sliced
+        straight from the cached columns.
+        """
+        history = await self.get_debt_history()
+        dates, totals = history["dates"], history["total_debt"]
+        start = max(len(dates) - days, 0)
+        if columnar:
+            return {
+                "source": history["source"],
+                "fetched_at": history["fetched_at"],
+                "dates": dates[start:][::-1],
+                "values": totals[start:][::-1],
+            }
+        return {
+            "source": history["source"],
+            "fetched_at": history["fetched_at"],
             "data": [
-                {
-                    "date": record["record_date"],
-                    "total_debt": float(record["tot_pub_debt_out_amt"])
-                }
-                for record in data.get("data", [])
-            ]
+                {"date": dates[i], "total_debt": totals[i]}
+                for i in range(len(dates) - 1, start - 1, -1)
+            ],
+        }
+
+    async def get_latest_debt(self) -> Optional[dict]:
+        """Get the most recent debt record (*None* if the history is empty)."""
+        history = await self.get_debt_history()
+        if not history["dates"]:
+            return None
+        return {
+            "date": history["dates"][-1],
+            "total_debt": history["total_debt"][-1],
+            "source": history["source"],
         }
-        
-        self._write_cache(cache_key, result)
-        return result
     
     # ==================== BLS (Employment) ====================
     
-    async def get_unemployment_rate(self, years: int = 5) -> dict:
+    async def get_unemployment_rate(self, years: int = 5, columnar: bool = False) -> dict:
         """
         Get unemployment rate from Bureau of Labor Statistics.
         
         Source: https://www.bls.gov/
         Updates: Monthly
         Series: LNS14000000 (Unemployment Rate)
+
+        With *columnar*, ``data`` is replaced by parallel ``dates``
+        (``YYYY-MM``) and ``values`` (rate) arrays.
         """
-        cache_key = f"bls_unemployment_{years}"
-        
-        if cached := self._read_cache(cache_key):
-            return cached
-        
-        # BLS Public Data API (no key needed for basic access)
-        url = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
-        
-        end_year = datetime.now().year
-        start_year = end_year - years
-        
-        payload = {
-            "seriesid": ["LNS14000000"],  # Unemployment rate
-            "startyear": str(start_year),
-            "endyear": str(end_year),
-        }
-        
-        # Add API key if available for higher rate limits
-        if settings.bls_api_key:
-            payload["registrationkey"] = settings.bls_api_key
-        
-        resp = await self.client.post(url, json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-        
-        # Parse BLS response format
-        series_data = data.get("Results", {}).get("series", [{}])[0].get("data", [])
-        
-        result = {
-            "source": "Bureau of Labor Statistics",
-            "series": "LNS14000000",
-            "fetched_at": datetime.now().isoformat(),
-            "data": [
-                {
-                    "year": int(item["year"]),
-                    "month": int(item["period"].replace("M", "")),
-                    "rate": float(item["value"])
-                }
-                for item in series_data
-                if item["period"].startswith("M") and item["value"] != "-"  # Monthly data only, skip missing values
-            ]
+        cache_key = self._cache_key("bls_unemployment", years)
+        
+        async def _fetch() -> dict:
+            # BLS Public Data API (no key needed for basic access)
+            url = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+        
+            end_year = datetime.now().year
+            start_year = end_year - years
+        
+            payload = {
+                "seriesid": ["LNS14000000"],  # Unemployment rate
+                "startyear": str(start_year),
+                "endyear": str(end_year),
+            }
+        
+            # Add API key if available for higher rate limits
+            if settings.bls_api_key:
+                payload["registrationkey"] = settings.bls_api_key
+        
+            data = await self._fetch_json(url, method="POST", json_body=payload)
+        
+            # Parse BLS response format
+            series_data = data.get("Results", {}).get("series", [{}])[0].get("data", [])
+        
+            result = {
+                "source": "Bureau of Labor Statistics",
+                "series": "LNS14000000",
+                "fetched_at": datetime.now().isoformat(),
+                "data": [
+                    {
+                        "year": int(item["year"]),
+                        "month": int(item["period"].replace("M", "")),
+                        "rate": float(item["value"])
+                    }
+                    for item in series_data
+                    if item["period"].startswith("M") and item["value"] != "-"  # Monthly data only, skip missing values
+                ]
+            }
+            return result
+
+        result = await self._cached_fetch(cache_key, _fetch)
+        if not columnar:
+            return result
+        rows = result["data"]
+        return {
+            **{k: v for k, v in result.items() if k != "data"},
+            "dates": [f"{r['year']}-{r['month']:02d}" for r in rows],
+            "values": [r["rate"] for r in rows],
         }
-        
-        self._write_cache(cache_key, result)
-        return result
     
     # ==================== CENSUS (Population) ====================
     
@@ -179,43 +257,41 @@ class GovDataService:
         Updates: Annually
         """
         year = year or datetime.now().year - 1  # Previous year usually has data
-        cache_key = f"census_population_{year}"
-        
-        if cached := self._read_cache(cache_key):
-            return cached
-        
-        # Census Population Estimates API
-        url = f"https://api.census.gov/data/{year}/pep/population"
-        params = {
-            "get": "NAME,POP",
-            "for": "state:*"
-        }
-        
-        if settings.census_api_key:
-            params["key"] = settings.census_api_key
-        
-        data = await self._fetch_json(url, params)
-        
-        # First row is headers
-        headers = data[0]
-        rows = data[1:]
-        
-        result = {
-            "source": "U.S. Census Bureau",
-            "year": year,
-            "fetched_at": datetime.now().isoformat(),
-            "data": [
-                {
-                    "state": row[0],
-                    "population": int(row[1]),
-                    "fips": row[2]
-                }
-                for row in rows
-            ]
-        }
-        
-        self._write_cache(cache_key, result)
-        return result
+        cache_key = self._cache_key("census_population", year)
+        
+        async def _fetch() -> dict:
+            # Census Population Estimates API
+            url = f"https://api.census.gov/data/{year}/pep/population"
+            params = {
+                "get": "NAME,POP",
+                "for": "state:*"
+            }
+        
+            if settings.census_api_key:
+                params["key"] = settings.census_api_key
+        
+            data = await self._fetch_json(url, params=params)
+        
+            # First row is headers
+            headers = data[0]
+            rows = data[1:]
+        
+            result = {
+                "source": "U.S. Census Bureau",
+                "year": year,
+                "fetched_at": datetime.now().isoformat(),
+                "data": [
+                    {
+                        "state": row[0],
+                        "population": int(row[1]),
+                        "fips": row[2]
+                    }
+                    for row in rows
+                ]
+            }
+            return result
+
+        return await self._cached_fetch(cache_key, _fetch)
     
     # ==================== FEC (Elections) ====================
     
@@ -227,46 +303,44 @@ class GovDataService:
         Updates: Varies (filings-based)
         """
         cycle = cycle or (datetime.now().year if datetime.now().year % 2 == 0 else datetime.now().year - 1)
-        cache_key = f"fec_candidates_{cycle}"
-        
-        if cached := self._read_cache(cache_key):
-            return cached
-        
-        # FEC OpenFEC API
-        url = "https://api.open.fec.gov/v1/candidates/totals/"
-        params = {
-            "cycle": cycle,
-            "sort": "-receipts",
-            "per_page": 100,
-            "is_active_candidate": True,
-        }
-        
-        if settings.fec_api_key:
-            params["api_key"] = settings.fec_api_key
-        else:
-            params["api_key"] = "DEMO_KEY"  # FEC allows demo key for limited access
-        
-        data = await self._fetch_json(url, params)
-        
-        result = {
-            "source": "Federal Election Commission",
-            "cycle": cycle,
-            "fetched_at": datetime.now().isoformat(),
-            "data": [
-                {
-                    "name": c.get("name"),
-                    "party": c.get("party"),
-                    "office": c.get("office"),
-                    "state": c.get("state"),
-                    "receipts": c.get("receipts"),
-                    "disbursements": c.get("disbursements"),
-                }
-                for c in data.get("results", [])
-            ]
-        }
-        
-        self._write_cache(cache_key, result)
-        return result
+        cache_key = self._cache_key("fec_candidates", cycle)
+        
+        async def _fetch() -> dict:
+            # FEC OpenFEC API
+            url = "https://api.open.fec.gov/v1/candidates/totals/"
+            params = {
+                "cycle": cycle,
+                "sort": "-receipts",
+                "per_page": 100,
+                "is_active_candidate": True,
+            }
+        
+            if settings.fec_api_key:
+                params["api_key"] = settings.fec_api_key
+            else:
+                params["api_key"] = "DEMO_KEY"  # FEC allows demo key for limited access
+        
+            data = await self._fetch_json(url, params=params)
+        
+            result = {
+                "source": "Federal Election Commission",
+                "cycle": cycle,
+                "fetched_at": datetime.now().isoformat(),
+                "data": [
+                    {
+                        "name": c.get("name"),
+                        "party": c.get("party"),
+                        "office": c.get("office"),
+                        "state": c.get("state"),
+                        "receipts": c.get("receipts"),
+                        "disbursements": c.get("disbursements"),
+                    }
+                    for c in data.get("results", [])
+                ]
+            }
+            return result
+
+        return await self._cached_fetch(cache_key, _fetch)
     
     async def get_budget_data(self, fiscal_year: int = None) -> dict:
         """
@@ -275,39 +349,28 @@ class GovDataService:
         Source: https://fiscaldata.treasury.gov/
         """
         fiscal_year = fiscal_year or datetime.now().year
-        cache_key = f"treasury_budget_{fiscal_year}"
-        
-        if cached := self._read_cache(cache_key):
-            return cached
-        
-        # Monthly Treasury Statement
-        url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v1/accounting/mts/mts_table_5"
-        params = {
-            "filter": f"record_fiscal_year:eq:{fiscal_year}",
-            "sort": "-record_date",
-            "page[size]": 1000,
-        }
-        
-        data = await self._fetch_json(url, params)
-        
-        result = {
-            "source": "U.S. Treasury Monthly Statement",
-            "fiscal_year": fiscal_year,
-            "fetched_at": datetime.now().isoformat(),
-            "data": data.get("data", [])
-        }
-        
-        self._write_cache(cache_key, result)
-        return result
-    
-    async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
-
+        cache_key = self._cache_key("treasury_budget", fiscal_year)
+        
+        async def _fetch() -> dict:
+            # Monthly Treasury Statement
+            url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v1/accounting/mts/mts_table_5"
+            params = {
+                "filter": f"record_fiscal_year:eq:{fiscal_year}",
+                "sort": "-record_date",
+                "page[size]": 1000,
+            }
+        
+            data = await self._fetch_json(url, params=params)
+        
+            result = {
+                "source": "U.S. Treasury Monthly Statement",
+                "fiscal_year": fiscal_year,
+                "fetched_at": datetime.now().isoformat(),
+                "data": data.get("data", [])
+            }
+            return result
 
-class DataFetchError(Exception):
-    """Raised when data fetching fails."""
-    pass
+        return await self._cached_fetch(cache_key, _fetch)
 
 
 # Singleton instance
@@ -3,17 +3,28 @@ Housing data read-side service.
 
 Queries Postgres for housing observations and series metadata.
 Does NOT extend BaseGovService — no HTTP calls, only DB reads.
+
+Housing data only changes when a sync run finishes, so query results are
+kept in an in-process cache tagged with the data version (the newest
+``housing.sync_log`` id).  A dedicated connection LISTENs for the sync's
+notification and drops the cache as soon as a run is logged; without a
+listener, readers poll the version instead.  If the listening connection
+dies it is handed back to the pool and LISTEN is retried with backoff.
 """
 
-from collections import defaultdict
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional
 
 import asyncpg
 
-from app.db.pool import get_pool
+from app.config import get_settings
+from app.db.pool import MeteredPool, get_pool
 from app.db import queries as Q
 from app.services.housing.series_config import CATEGORIES, SERIES_BY_ID
+from app.utils.downsample import lttb_indices
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +35,41 @@ def _parse_date(val: Optional[str]) -> Optional[date]:
     return date.fromisoformat(val) if val else None
 
 
+# Periods ``frequency`` may aggregate to (Postgres ``date_trunc`` units)
+RESAMPLE_FREQUENCIES = ("week", "month", "quarter", "year")
+RESAMPLE_AGGREGATIONS = ("avg", "last")
+
+
+def _check_resample(frequency: Optional[str], aggregation: str) -> None:
+    if frequency is not None and frequency not in RESAMPLE_FREQUENCIES:
+        raise ValueError(f"frequency must be one of {', '.join(RESAMPLE_FREQUENCIES)}")
+    if aggregation not in RESAMPLE_AGGREGATIONS:
+        raise ValueError(f"aggregation must be one of {', '.join(RESAMPLE_AGGREGATIONS)}")
+
+
+def _columns(rows: list, max_points: Optional[int]) -> tuple[list[str], list[float]]:
+    """``(dates, values)`` from ``(date, value)`` rows, LTTB-downsampled to *max_points*."""
+    dates = [r["date"] for r in rows]
+    values = [float(r["value"]) for r in rows]
+    if max_points and len(rows) > max_points:
+        keep = lttb_indices([d.toordinal() for d in dates], values, max_points)
+        dates = [dates[i] for i in keep]
+        values = [values[i] for i in keep]
+    return [d.isoformat() for d in dates], values
+
+
+def _series_points(rows: list, max_points: Optional[int], columnar: bool) -> dict[str, list]:
+    """
+    Serialise rows as ``{"observations": [{date, value}, ...]}`` or, when
+    *columnar*, as parallel ``{"dates": [...], "values": [...]}`` arrays
+    (no per-point dicts).
+    """
+    dates, values = _columns(rows, max_points)
+    if columnar:
+        return {"dates": dates, "values": values}
+    return {"observations": [{"date": d, "value": v} for d, v in zip(dates, values)]}
+
+
 # Headline series — one per category for the dashboard view
 _HEADLINE_SERIES = [
     "RHORUSQ156N",   # Homeownership Rate
@@ -38,15 +84,169 @@ _HEADLINE_SERIES = [
 class HousingService:
     """Read-side service for housing data stored in Postgres."""
 
-    def get_pool(self) -> asyncpg.Pool:
+    # Backoff between attempts to re-LISTEN after the connection is lost
+    LISTENER_RETRY_INITIAL_SECONDS = 1.0
+    LISTENER_RETRY_MAX_SECONDS = 60.0
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self._cache_enabled = settings.housing_read_cache_enabled
+        self._cache_max_entries = settings.housing_read_cache_max_entries
+        self._poll_seconds = settings.housing_read_cache_poll_seconds
+        self._max_points = settings.housing_max_points
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        # Newest sync_log id the cached results belong to (None = unknown).
+        self._data_version: Optional[int] = None
+        self._version_checked_at = 0.0
+        # Bumped on every invalidation so loads that straddle one are not stored.
+        self._generation = 0
+        self._listener: Optional[asyncpg.Connection] = None
+        self._relisten_task: Optional[asyncio.Task] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.invalidations = 0
+
+    def get_pool(self) -> MeteredPool:
         return get_pool()
 
+    # ------------------------------------------------------------------
+    # Read cache
+    # ------------------------------------------------------------------
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached result."""
+        self._cache.clear()
+        self._generation += 1
+        self.invalidations += 1
+
+    def _set_data_version(self, version: int) -> None:
+        if version != self._data_version:
+            if self._data_version is not None or self._cache:
+                logger.info("Housing data version %s -> %s; read cache cleared",
+                            self._data_version, version)
+                self.invalidate_cache()
+            self._data_version = version
+
+    async def _check_data_version(self) -> None:
+        """Poll ``sync_log`` unless the listener is keeping the version current."""
+        if self._data_version is not None:
+            if self._listener is not None:
+                return
+            if time.monotonic() - self._version_checked_at < self._poll_seconds:
+                return
+        version = await self.get_pool().fetchval(Q.SELECT_SYNC_VERSION)
+        self._version_checked_at = time.monotonic()
+        self._set_data_version(version)
+
+    async def _cached(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for *key*, running *load* on a miss."""
+        if not self._cache_enabled:
+            return await load()
+        await self._check_data_version()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return self._cache[key]
+        self.cache_misses += 1
+        generation = self._generation
+        result = await load()
+        if generation == self._generation:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def _on_sync_notify(self, conn: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            self._set_data_version(int(payload))
+        except ValueError:
+            self.invalidate_cache()
+            self._data_version = None
+
+    def _on_listener_lost(self, conn: Any) -> None:
+        logger.warning("Housing sync listener connection lost; polling sync_log until it is back")
+        self._listener = None
+        self._data_version = None
+        if self._relisten_task is None or self._relisten_task.done():
+            self._relisten_task = asyncio.ensure_future(self._relisten(conn))
+
+    async def _relisten(self, lost: Any) -> None:
+        """Return the dead connection to the pool, then retry LISTEN with backoff."""
+        try:
+            # The pool replaces a closed connection on release.
+            await self.get_pool().release(lost)
+        except Exception as e:
+            logger.warning("Releasing lost housing listener connection failed: %s", e)
+            lost.terminate()
+        delay = self.LISTENER_RETRY_INITIAL_SECONDS
+        while not await self.start_cache_listener():
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.LISTENER_RETRY_MAX_SECONDS)
+        logger.info("Housing sync listener re-established")
+
+    async def start_cache_listener(self) -> bool:
+        """
+        LISTEN for sync notifications on a dedicated pool connection.
+
+        Returns *False* (readers keep polling) if the cache is disabled or
+        the listener cannot be set up.
+        """
+        if not self._cache_enabled or self._listener is not None:
+            return self._listener is not None
+        pool = self.get_pool()
+        try:
+            conn = await pool.acquire()
+        except Exception as e:
+            logger.warning("Housing sync listener unavailable: %s", e)
+            return False
+        try:
+            await conn.add_listener(Q.SYNC_NOTIFY_CHANNEL, self._on_sync_notify)
+        except Exception as e:
+            await pool.release(conn)
+            logger.warning("Housing sync listener unavailable: %s", e)
+            return False
+        conn.add_termination_listener(self._on_listener_lost)
+        self._listener = conn
+        # Re-read the version once: a sync logged before LISTEN sent no
+        # notification this connection could see.
+        self._data_version = None
+        return True
+
+    async def stop_cache_listener(self) -> None:
+        """Stop listening (and any reconnect attempts) and return the connection to the pool."""
+        task, self._relisten_task = self._relisten_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        conn, self._listener = self._listener, None
+        if conn is None:
+            return
+        try:
+            conn.remove_termination_listener(self._on_listener_lost)
+            await conn.remove_listener(Q.SYNC_NOTIFY_CHANNEL, self._on_sync_notify)
+            await self.get_pool().release(conn)
+        except Exception as e:
+            logger.warning("Housing sync listener shutdown failed: %s", e)
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self._cache_enabled,
+            "entries": len(self._cache),
+            "data_version": self._data_version,
+            "listening": self._listener is not None,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "invalidations": self.invalidations,
+        }
+
     # ------------------------------------------------------------------
     # Categories & series listing
     # ------------------------------------------------------------------
 
     async def get_categories(self) -> list[dict[str, Any]]:
         """Return all categories with their series counts."""
+        return await self._cached(("categories",), self._load_categories)
+
+    async def _load_categories(self) -> list[dict[str, Any]]:
         rows = await self.get_pool().fetch(Q.SELECT_ALL_ACTIVE_SERIES)
 
         # Group by category
@@ -69,6 +269,9 @@ class HousingService:
         category: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """Return series metadata, optionally filtered by category."""
+        return await self._cached(("series", category), lambda: self._load_series_list(category))
+
+    async def _load_series_list(self, category: Optional[str]) -> list[dict[str, Any]]:
         if category:
             rows = await self.get_pool().fetch(Q.SELECT_SERIES_BY_CATEGORY, category)
         else:
@@ -79,29 +282,64 @@ class HousingService:
     # Observations
     # ------------------------------------------------------------------
 
+    def _point_limit(self, max_points: Optional[int]) -> Optional[int]:
+        """Requested point limit, capped by ``housing_max_points``."""
+        cap = self._max_points
+        if not cap:
+            return max_points
+        return min(max_points, cap) if max_points else cap
+
     async def get_observations(
         self,
         series_id: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        frequency: Optional[str] = None,
+        aggregation: str = "avg",
+        max_points: Optional[int] = None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
-        """Return time-series observations for a single series."""
-        rows = await self.get_pool().fetch(
-            Q.SELECT_OBSERVATIONS_RANGE,
-            series_id,
-            _parse_date(start_date),
-            _parse_date(end_date),
+        """
+        Return time-series observations for a single series.
+
+        *frequency* aggregates to weekly/monthly/quarterly/yearly periods in
+        SQL (period average, or the period's last value with
+        ``aggregation="last"``).  The result is then LTTB-downsampled to at
+        most *max_points* points (and never more than ``housing_max_points``).
+        With *columnar*, points come back as ``dates``/``values`` arrays
+        instead of an ``observations`` list.
+        """
+        _check_resample(frequency, aggregation)
+        limit = self._point_limit(max_points)
+        return await self._cached(
+            ("observations", series_id, start_date, end_date, frequency, aggregation, limit, columnar),
+            lambda: self._load_observations(
+                series_id, start_date, end_date, frequency, aggregation, limit, columnar,
+            ),
         )
+
+    async def _load_observations(
+        self,
+        series_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        frequency: Optional[str],
+        aggregation: str,
+        max_points: Optional[int],
+        columnar: bool,
+    ) -> dict[str, Any]:
+        args = [series_id, _parse_date(start_date), _parse_date(end_date)]
+        if frequency:
+            rows = await self.get_pool().fetch(Q.SELECT_OBSERVATIONS_RESAMPLED, *args, frequency, aggregation)
+        else:
+            rows = await self.get_pool().fetch(Q.SELECT_OBSERVATIONS_RANGE, *args)
         meta = SERIES_BY_ID.get(series_id, {})
         return {
             "series_id": series_id,
             "title": meta.get("title", series_id),
             "units": meta.get("units", ""),
             "frequency": meta.get("frequency", ""),
-            "observations": [
-                {"date": r["date"].isoformat(), "value": float(r["value"])}
-                for r in rows
-            ],
+            **_series_points(rows, max_points, columnar),
         }
 
     async def get_compare(
@@ -109,21 +347,45 @@ class HousingService:
         series_ids: list[str],
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        frequency: Optional[str] = None,
+        aggregation: str = "avg",
+        max_points: Optional[int] = None,
+        columnar: bool = False,
     ) -> list[dict[str, Any]]:
-        """Return observations for multiple series, grouped by series_id."""
-        rows = await self.get_pool().fetch(
-            Q.SELECT_OBSERVATIONS_MULTI,
-            series_ids,
-            _parse_date(start_date),
-            _parse_date(end_date),
+        """
+        Return observations for multiple series, grouped by series_id.
+
+        *frequency*, *aggregation*, *max_points* and *columnar* apply to
+        each series as in ``get_observations``.
+        """
+        _check_resample(frequency, aggregation)
+        limit = self._point_limit(max_points)
+        return await self._cached(
+            ("compare", tuple(series_ids), start_date, end_date, frequency, aggregation, limit, columnar),
+            lambda: self._load_compare(
+                series_ids, start_date, end_date, frequency, aggregation, limit, columnar,
+            ),
         )
 
-        grouped: dict[str, list[dict]] = defaultdict(list)
+    async def _load_compare(
+        self,
+        series_ids: list[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        frequency: Optional[str],
+        aggregation: str,
+        max_points: Optional[int],
+        columnar: bool,
+    ) -> list[dict[str, Any]]:
+        args = [series_ids, _parse_date(start_date), _parse_date(end_date)]
+        if frequency:
+            rows = await self.get_pool().fetch(Q.SELECT_OBSERVATIONS_MULTI_RESAMPLED, *args, frequency, aggregation)
+        else:
+            rows = await self.get_pool().fetch(Q.SELECT_OBSERVATIONS_MULTI, *args)
+
+        grouped: dict[str, list] = defaultdict(list)
         for r in rows:
-            grouped[r["series_id"]].append({
-                "date": r["date"].isoformat(),
-                "value": float(r["value"]),
-            })
+            grouped[r["series_id"]].append(r)
 
         result = []
         for sid in series_ids:
@@ -132,7 +394,7 @@ class HousingService:
                 "series_id": sid,
                 "title": meta.get("title", sid),
                 "units": meta.get("units", ""),
-                "observations": grouped.get(sid, []),
+                **_series_points(grouped.get(sid, []), max_points, columnar),
             })
         return result
 
@@ -140,11 +402,36 @@ class HousingService:
     # Dashboard
     # ------------------------------------------------------------------
 
+    async def get_latest_observations(self, series_ids: list[str]) -> dict[str, Any]:
+        """
+        Return ``{series_id: row}`` with the latest observation per series.
+
+        Reads the sync-maintained ``housing.latest_observation`` table in one
+        query; series it lacks (or every series, if the table does not exist
+        yet) are looked up from ``housing.observations`` in a second batched
+        query.
+        """
+        pool = self.get_pool()
+        try:
+            rows = await pool.fetch(Q.SELECT_LATEST_OBSERVATIONS_MULTI, series_ids)
+        except asyncpg.exceptions.UndefinedTableError:
+            rows = []
+        latest = {r["series_id"]: r for r in rows}
+        missing = [sid for sid in series_ids if sid not in latest]
+        if missing:
+            for r in await pool.fetch(Q.SELECT_LATEST_OBSERVATIONS_MULTI_LIVE, missing):
+                latest[r["series_id"]] = r
+        return latest
+
     async def get_dashboard(self) -> list[dict[str, Any]]:
         """Return latest observation for each headline series."""
+        return await self._cached(("dashboard",), self._load_dashboard)
+
+    async def _load_dashboard(self) -> list[dict[str, Any]]:
+        latest = await self.get_latest_observations(_HEADLINE_SERIES)
         items = []
         for sid in _HEADLINE_SERIES:
-            row = await self.get_pool().fetchrow(Q.SELECT_LATEST_OBSERVATION, sid)
+            row = latest.get(sid)
             meta = SERIES_BY_ID.get(sid, {})
             items.append({
                 "series_id": sid,
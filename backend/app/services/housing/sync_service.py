@@ -8,8 +8,11 @@ client and retry logic.
 
 import asyncio
 import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import asyncpg
 
@@ -22,6 +25,10 @@ from app.utils.logger import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Set once ``ENSURE_SYNC_SCHEMA`` has succeeded in this process.  Its ALTERs
+# take ACCESS EXCLUSIVE locks on the observations table, so later syncs skip it.
+_schema_ensured = False
+
 
 class HousingSyncService(BaseGovService):
     """Sync FRED housing series into Postgres."""
@@ -30,12 +37,32 @@ class HousingSyncService(BaseGovService):
     BASE_URL = "https://api.stlouisfed.org/fred"
     TIMEOUT = 45
 
-    # FRED free tier: 120 requests / minute ≈ 2 req/sec
-    REQUEST_DELAY = 0.5
-
-    def __init__(self, pool: asyncpg.Pool) -> None:
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        fetch_concurrency: Optional[int] = None,
+        db_concurrency: Optional[int] = None,
+    ) -> None:
         super().__init__()
         self._pool = pool
+        # Pipeline stage limits: FRED fetches (further paced by the shared
+        # rate limiter) and DB work (each holds one pool connection).
+        self._fetch_slots = asyncio.Semaphore(fetch_concurrency or settings.housing_sync_fetch_concurrency)
+        self._db_slots = asyncio.Semaphore(db_concurrency or settings.housing_sync_db_concurrency)
+        self._stage_seconds: dict[str, float] = defaultdict(float)
+        # Set by ``ensure_sync_schema``; until then every series is synced.
+        self._schema_ready = False
+        self._track_changes = False
+        self._series_stats: dict[str, dict[str, Any]] = {}
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        """Add the time spent in the block to *stage*'s running total."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stage_seconds[stage] += time.perf_counter() - started
 
     # ------------------------------------------------------------------
     # FRED helpers
@@ -106,16 +133,75 @@ class HousingSyncService(BaseGovService):
         series_id: str,
         observations: list[dict[str, str]],
     ) -> int:
-        """Bulk-upsert observations. Returns the number of rows affected."""
+        """
+        Bulk-upsert observations. Returns the number of rows affected.
+
+        Small batches (typical incremental syncs) use ``executemany``;
+        batches of ``settings.housing_copy_threshold`` rows or more (backfills)
+        go through ``copy_upsert_observations``.
+        """
         if not observations:
             return 0
         rows = [
             (series_id, date.fromisoformat(obs["date"]), float(obs["value"]))
             for obs in observations
         ]
-        await self._pool.executemany(Q.UPSERT_OBSERVATIONS, rows)
+        if len(rows) >= settings.housing_copy_threshold:
+            await self.copy_upsert_observations(rows)
+        else:
+            await self._pool.executemany(Q.UPSERT_OBSERVATIONS, rows)
         return len(rows)
 
+    async def copy_upsert_observations(self, rows: list[tuple[str, date, float]]) -> None:
+        """
+        Upsert *rows* with ``COPY`` into a staging table plus one merge.
+
+        Both steps run in a single transaction on one connection: either the
+        whole batch lands or none of it does.
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(Q.CREATE_OBSERVATIONS_STAGING)
+                await conn.copy_records_to_table(
+                    Q.OBSERVATIONS_STAGING_TABLE,
+                    records=rows,
+                    columns=Q.OBSERVATIONS_STAGING_COLUMNS,
+                )
+                await conn.execute(Q.MERGE_OBSERVATIONS_STAGING)
+
+    async def ensure_sync_schema(self) -> bool:
+        """
+        Create the sync-maintained columns and tables if missing.
+
+        Enables skip-unchanged (unless ``settings.housing_skip_unchanged`` is
+        off) and the ``housing.latest_observation`` refresh.  Returns whether
+        the schema is in place.  If the DDL fails (e.g. the DB user may not
+        ``ALTER``), every series is synced as before and the dashboard reads
+        the observations table directly.
+
+        The DDL runs once per process; later calls reuse the result.
+        """
+        global _schema_ensured
+        try:
+            if not _schema_ensured:
+                await self._pool.execute(Q.ENSURE_SYNC_SCHEMA)
+                _schema_ensured = True
+            self._schema_ready = True
+        except Exception as exc:
+            logger.warning("Sync schema unavailable, syncing every series: %s", exc)
+            self._schema_ready = False
+        self._track_changes = self._schema_ready and settings.housing_skip_unchanged
+        return self._schema_ready
+
+    async def refresh_latest_observations(self, series_ids: list[str]) -> None:
+        """Recompute ``housing.latest_observation`` rows for *series_ids*."""
+        if series_ids:
+            await self._pool.execute(Q.REFRESH_LATEST_OBSERVATIONS, series_ids)
+
+    async def get_sync_state(self, series_id: str) -> Optional[asyncpg.Record]:
+        """Return ``last_synced_at`` and ``fred_last_updated`` for *series_id*, or None."""
+        return await self._pool.fetchrow(Q.SELECT_SYNC_STATE, series_id)
+
     async def get_last_synced_at(self, series_id: str) -> Optional[datetime]:
         """Return the ``last_synced_at`` timestamp for *series_id*, or None."""
         row = await self._pool.fetchrow(Q.SELECT_LAST_SYNCED_AT, series_id)
@@ -129,17 +215,22 @@ class HousingSyncService(BaseGovService):
         observations_upserted: int,
         errors: list[str],
         status: str,
+        series_stats: Optional[dict[str, Any]] = None,
     ) -> int:
         """Insert a row into ``housing.sync_log`` and return its id."""
-        row = await self._pool.fetchrow(
-            Q.INSERT_SYNC_LOG,
+        args = [
             run_started_at,
             run_finished_at,
             series_synced,
             observations_upserted,
             json.dumps(errors),  # jsonb column needs a JSON string
             status,
-        )
+        ]
+        query = Q.INSERT_SYNC_LOG
+        if series_stats is not None and self._track_changes:
+            query = Q.INSERT_SYNC_LOG_WITH_STATS
+            args.append(json.dumps(series_stats))
+        row = await self._pool.fetchrow(query, *args)
         return row["id"]
 
     # ------------------------------------------------------------------
@@ -154,27 +245,64 @@ class HousingSyncService(BaseGovService):
         """
         Sync one series: determine start date, fetch, upsert.
 
+        Each stage waits for a slot of its own kind, so many series can be
+        in flight at once without exceeding the fetch or DB concurrency.
+
+        With change tracking on (see ``ensure_sync_schema``), FRED's
+        ``series.last_updated`` is compared with the value stored at the
+        last sync; an unchanged series is skipped entirely — no observation
+        fetch, no upsert, and ``last_synced_at`` is left alone.
+
         Returns ``(observation_count, error_message_or_none)``.
         """
         series_id = series_def["series_id"]
         try:
             # Determine start date
+            state = None
             if full_backfill:
                 start = "1900-01-01"
             else:
-                last_synced = await self.get_last_synced_at(series_id)
+                async with self._db_slots:
+                    with self._timed("plan"):
+                        if self._track_changes:
+                            state = await self.get_sync_state(series_id)
+                            last_synced = state["last_synced_at"] if state else None
+                        else:
+                            last_synced = await self.get_last_synced_at(series_id)
                 if last_synced is None:
                     start = "1900-01-01"
                 else:
                     start = (last_synced.date() - timedelta(days=7)).isoformat()
 
-            observations = await self.fetch_observations(series_id, observation_start=start)
-            await self.upsert_series_registry(series_def)
-            count = await self.upsert_observations(series_id, observations)
+            fred_updated = None
+            if self._track_changes:
+                async with self._fetch_slots:
+                    with self._timed("check"):
+                        meta = await self.validate_series(series_id)
+                fred_updated = meta.get("last_updated") if meta else None
+                if fred_updated and state and state["fred_last_updated"] == fred_updated:
+                    self._series_stats[series_id] = {
+                        "status": "unchanged", "observations": 0, "fred_last_updated": fred_updated,
+                    }
+                    return 0, None
+
+            async with self._fetch_slots:
+                with self._timed("fetch"):
+                    observations = await self.fetch_observations(series_id, observation_start=start)
+            async with self._db_slots:
+                with self._timed("upsert"):
+                    await self.upsert_series_registry(series_def)
+                    count = await self.upsert_observations(series_id, observations)
+                    if fred_updated:
+                        await self._pool.execute(Q.UPDATE_SERIES_FRED_LAST_UPDATED, series_id, fred_updated)
+            self._series_stats[series_id] = {
+                "status": "updated", "observations": count, "fred_last_updated": fred_updated,
+            }
             return count, None
         except Exception as exc:
             msg = f"{series_id}: {exc}"
             logger.error("sync_series failed — %s", msg)
+            self._series_stats[series_id] = {"status": "failed", "observations": 0, "error": str(exc)}
             return 0, msg
 
     async def sync_all(
@@ -182,29 +310,62 @@ class HousingSyncService(BaseGovService):
         full_backfill: bool = False,
     ) -> dict[str, Any]:
         """
-        Iterate every series in ``HOUSING_SERIES``, honouring rate limits.
+        Sync every series in ``HOUSING_SERIES`` concurrently.
 
-        Returns a summary dict with counts and errors.
+        All series go through ``sync_series`` at once; its stage semaphores
+        bound how many fetch or hold a DB connection at a time, and FRED's
+        quota is enforced by the shared per-host rate limiter.  A failing
+        series is reported in ``errors`` without holding up the rest.
+
+        Series whose FRED ``last_updated`` has not moved since the last
+        sync are skipped (``series_unchanged``); per-series outcomes are
+        stored in ``housing.sync_log.series_stats``.  Afterwards the
+        ``housing.latest_observation`` rows of changed series are refreshed.
+
+        Returns a summary dict with counts, errors and per-stage timings
+        (``stage_seconds`` sums time spent in each stage across series).
         """
         run_started = datetime.utcnow()
+        self._stage_seconds.clear()
+        self._series_stats.clear()
+        await self.ensure_sync_schema()
         total_obs = 0
         total_synced = 0
         errors: list[str] = []
-
-        for i, series_def in enumerate(HOUSING_SERIES):
-            sid = series_def["series_id"]
-            logger.info("[%d/%d] syncing %s …", i + 1, len(HOUSING_SERIES), sid)
-
-            count, err = await self.sync_series(series_def, full_backfill=full_backfill)
+        done = 0
+
+        async def _run(series_def: dict[str, Any]) -> tuple[int, Optional[str]]:
+            nonlocal done
+            result = await self.sync_series(series_def, full_backfill=full_backfill)
+            done += 1
+            logger.info("[%d/%d] synced %s", done, len(HOUSING_SERIES), series_def["series_id"])
+            return result
+
+        results = await asyncio.gather(
+            *(_run(series_def) for series_def in HOUSING_SERIES),
+            return_exceptions=True,
+        )
+        for series_def, result in zip(HOUSING_SERIES, results):
+            if isinstance(result, BaseException):
+                result = (0, f"{series_def['series_id']}: {result}")
+            count, err = result
             total_obs += count
             if err:
                 errors.append(err)
             else:
                 total_synced += 1
 
-            # Rate-limit pause between FRED requests
-            if i < len(HOUSING_SERIES) - 1:
-                await asyncio.sleep(self.REQUEST_DELAY)
+        if self._schema_ready:
+            changed = [
+                sid for sid, st in self._series_stats.items()
+                if st["status"] == "updated" and st["observations"]
+            ]
+            try:
+                with self._timed("refresh_latest"):
+                    await self.refresh_latest_observations(changed)
+            except Exception as exc:
+                errors.append(f"latest_observation refresh: {exc}")
+                logger.error("latest_observation refresh failed — %s", exc)
 
         run_finished = datetime.utcnow()
         status = "success" if not errors else ("partial" if total_synced > 0 else "failure")
@@ -216,16 +377,25 @@ class HousingSyncService(BaseGovService):
             observations_upserted=total_obs,
             errors=errors,
             status=status,
+            series_stats=self._series_stats,
         )
+        try:
+            # Readers drop their cached query results when they see this.
+            await self._pool.execute(Q.NOTIFY_SYNC, Q.SYNC_NOTIFY_CHANNEL, str(log_id))
+        except Exception as exc:
+            logger.warning("sync notification failed — %s", exc)
+        unchanged = sum(1 for st in self._series_stats.values() if st["status"] == "unchanged")
 
         summary = {
             "sync_log_id": log_id,
             "status": status,
             "series_synced": total_synced,
             "series_total": len(HOUSING_SERIES),
+            "series_unchanged": unchanged,
             "observations_upserted": total_obs,
             "errors": errors,
             "duration_seconds": (run_finished - run_started).total_seconds(),
+            "stage_seconds": {k: round(v, 3) for k, v in self._stage_seconds.items()},
         }
         logger.info("sync_all complete: %s", summary)
         return summary
@@ -0,0 +1,232 @@
+"""
+Process-wide HTTP client shared by all government data services.
+
+Call ``init_http_client`` at application startup and ``close_http_client``
+at shutdown; services obtain the client with ``get_http_client`` (created
+lazily if the lifespan has not run, e.g. in scripts and tests).
+
+One ``httpx.AsyncClient`` sits on a ``PerHostTransport`` that keeps a
+separate keep-alive connection pool per upstream host, so a slow or busy
+API cannot exhaust connections another one needs.  HTTP/2 is negotiated
+when the optional ``h2`` package is installed (hosts that only speak
+HTTP/1.1 fall back transparently).  Each host's pool reports in-flight,
+peak and total requests for ``/health``.
+
+Requests also pass through the per-host token buckets in
+``app.services.rate_limit`` before they are sent, so every caller of an
+upstream shares that upstream's quota.
+
+httpx ignores ``HTTP(S)_PROXY`` / ``ALL_PROXY`` / ``NO_PROXY`` once a
+custom transport is passed, so ``PerHostTransport`` applies them itself
+when each host's pool is created (``HTTP_TRUST_ENV=false`` turns that off).
+"""
+
+import importlib.util
+import urllib.request
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+import httpx
+
+from app.config import get_settings
+from app.services.rate_limit import RateLimiter, get_rate_limiter
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_HEADERS = {"Accept": "application/json"}
+
+
+@dataclass
+class HostStats:
+    """Request counters for one upstream host."""
+
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Response body wrapper that reports when the connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+def _env_proxy(url: httpx.URL) -> Optional[str]:
+    """Proxy URL the environment configures for *url*, if any (``NO_PROXY`` honoured)."""
+    proxies = urllib.request.getproxies()
+    proxy = proxies.get(url.scheme) or proxies.get("all")
+    if not proxy or urllib.request.proxy_bypass(url.host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+class PerHostTransport(httpx.AsyncBaseTransport):
+    """
+    Route each request to a connection pool dedicated to its host.
+
+    Pools are created on first use with the configured per-host limits.
+    A request counts as in flight until its response body is closed, which
+    is when httpx hands the connection back to the pool.  With a
+    *rate_limiter*, each request first waits for its host's token, and a
+    429 response pauses that host's bucket.  With *trust_env*, a host's
+    pool goes through the proxy the environment sets for it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        trust_env: bool = True,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.rate_limiter = rate_limiter
+        self.trust_env = trust_env
+        self._pools: dict[str, httpx.AsyncHTTPTransport] = {}
+        self._stats: dict[str, HostStats] = {}
+
+    def _pool_for(self, url: httpx.URL) -> tuple[str, httpx.AsyncHTTPTransport, HostStats]:
+        host = url.host if url.port is None else f"{url.host}:{url.port}"
+        pool = self._pools.get(host)
+        if pool is None:
+            pool = self._pools[host] = httpx.AsyncHTTPTransport(
+                limits=self._limits,
+                http2=self.http2,
+                trust_env=self.trust_env,
+                proxy=_env_proxy(url) if self.trust_env else None,
+            )
+            self._stats[host] = HostStats()
+        return host, pool, self._stats[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host, pool, stats = self._pool_for(request.url)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(request.url.host)
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+        def _release() -> None:
+            stats.in_flight -= 1
+
+        try:
+            response = await pool.handle_async_request(request)
+        except Exception:
+            stats.errors += 1
+            _release()
+            raise
+        if response.status_code == 429 and self.rate_limiter is not None:
+            stats.rate_limited += 1
+            self.rate_limiter.backoff(request.url.host, response.headers.get("retry-after"))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_MeteredStream(response.stream, _release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-host request counters and open/idle connection counts."""
+        hosts = {}
+        for host, counters in sorted(self._stats.items()):
+            entry = asdict(counters)
+            # httpcore's pool is not part of httpx's public API; report
+            # connection counts only when it is reachable.
+            connections = getattr(getattr(self._pools.get(host), "_pool", None), "connections", None)
+            if connections is not None:
+                entry["connections"] = len(connections)
+                entry["idle_connections"] = sum(1 for c in connections if c.is_idle())
+            hosts[host] = entry
+        return {
+            "http2": self.http2,
+            "max_connections_per_host": self._limits.max_connections,
+            "max_keepalive_per_host": self._limits.max_keepalive_connections,
+            "hosts": hosts,
+            "rate_limits": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+        }
+
+
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[PerHostTransport] = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    global _client, _transport
+    settings = get_settings()
+    _transport = PerHostTransport(
+        max_connections=settings.http_max_connections_per_host,
+        max_keepalive_connections=settings.http_max_keepalive_per_host,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        http2=settings.http_http2,
+        rate_limiter=get_rate_limiter() if settings.rate_limit_enabled else None,
+        trust_env=settings.http_trust_env,
+    )
+    _client = httpx.AsyncClient(
+        transport=_transport,
+        timeout=settings.http_timeout_seconds,
+        headers=DEFAULT_HEADERS,
+    )
+    return _client
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """Create the shared client (no-op if it already exists)."""
+    if _client is None:
+        _create_client()
+        logger.info("Shared HTTP client initialised (http2=%s)", _transport.http2)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and all per-host pools (no-op if not initialised)."""
+    global _client, _transport
+    if _client is not None:
+        await _client.aclose()
+        logger.info("Shared HTTP client closed")
+        _client = None
+        _transport = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    if _client is None:
+        return _create_client()
+    return _client
+
+
+def http_client_stats() -> Optional[dict[str, Any]]:
+    """Pool-utilisation metrics for the shared client (*None* before first use)."""
+    if _transport is None:
+        return None
+    return _transport.stats()
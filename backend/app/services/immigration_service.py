@@ -25,6 +25,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
 from app.utils.logger import get_logger
 
 settings = get_settings()
@@ -96,26 +97,12 @@ class ImmigrationService:
         {"category": "Other", "count": 45202, "percent": 4.4},
     ]
     
-    def __init__(self):
-        """Initialize the immigration service."""
-        self.client = None
-        
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.TIMEOUT,
-                headers={
-                    "Accept": "application/json"
-                }
-            )
-        return self.client
+        """Return the process-wide shared HTTP client (looked up per request)."""
+        return get_http_client()
     
     async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        """Nothing to release; the shared client is closed in the app lifespan."""
     
     # =========================================================================
     # BTS BORDER CROSSING DATA
@@ -161,7 +148,7 @@ class ImmigrationService:
             if where_clauses:
                 params["$where"] = " AND ".join(where_clauses)
             
-            response = await client.get(self.BTS_BASE_URL, params=params)
+            response = await client.get(self.BTS_BASE_URL, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -242,7 +229,7 @@ class ImmigrationService:
                 "$order": "date DESC"
             }
             
-            response = await client.get(self.BTS_BASE_URL, params=params)
+            response = await client.get(self.BTS_BASE_URL, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
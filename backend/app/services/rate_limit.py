@@ -0,0 +1,154 @@
+"""
+Per-upstream token-bucket rate limiting.
+
+Every outbound request goes through the shared HTTP client, whose
+``PerHostTransport`` asks the ``RateLimiter`` for a token before sending.
+Limits are keyed by host, so a background FRED sync and live FRED requests
+draw from one bucket and together stay under FRED's quota instead of each
+pacing itself with fixed sleeps.
+
+Buckets hand out reservations rather than taking a lock: a caller that
+finds the bucket empty takes a token "on credit" (the balance goes
+negative) and sleeps until that token would have been refilled.  Waiters
+are therefore served in arrival order, and the limiter needs no asyncio
+primitives tied to a particular event loop.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``requests`` per ``per_seconds``, allowing bursts of up to ``burst``."""
+
+    requests: int
+    per_seconds: float
+    burst: int
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.per_seconds
+
+
+# Published (or, where none is published, conservative) upstream quotas.
+DEFAULT_LIMITS: dict[str, RateLimit] = {
+    # FRED: 120 requests/minute per API key
+    "api.stlouisfed.org": RateLimit(120, 60, 10),
+    # BLS API v2: 50 requests per 10 seconds
+    "api.bls.gov": RateLimit(50, 10, 10),
+    # Treasury Fiscal Data: no published limit
+    "api.fiscaldata.treasury.gov": RateLimit(300, 60, 20),
+    # OpenFEC (api.data.gov key): 1,000 requests/hour
+    "api.open.fec.gov": RateLimit(1000, 3600, 20),
+    # BTS Socrata without an app token: throttled per IP, ~1,000/hour
+    "data.bts.gov": RateLimit(1000, 3600, 20),
+    # College Scorecard (api.data.gov key): 1,000 requests/hour
+    "api.data.gov": RateLimit(1000, 3600, 20),
+}
+
+
+class TokenBucket:
+    """Token bucket that refills continuously at ``limit.rate`` tokens/second."""
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.limit.burst, self._tokens + (now - self._updated) * self.limit.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        self.acquired += 1
+        if self._tokens >= 0:
+            return 0.0
+        wait = -self._tokens / self.limit.rate
+        self.throttled += 1
+        self.wait_seconds += wait
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new requests for *seconds* (e.g. after an HTTP 429)."""
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.limit.rate)
+
+    def stats(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "limit_per_minute": round(self.limit.rate * 60, 2),
+            "burst": self.limit.burst,
+            "available": round(max(self._tokens, 0.0), 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+class RateLimiter:
+    """Token buckets keyed by upstream host; hosts without a limit pass through."""
+
+    def __init__(self, limits: Optional[dict[str, RateLimit]] = None) -> None:
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limit = self.limits.get(host)
+            if limit is None:
+                return None
+            bucket = self._buckets[host] = TokenBucket(limit)
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """Wait for a request slot for *host*."""
+        bucket = self.bucket(host)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def backoff(self, host: str, retry_after: Optional[str]) -> None:
+        """
+        React to a 429 from *host*: pause its bucket for ``Retry-After``
+        seconds, or for one token's refill interval if the header is
+        missing or not a number of seconds.
+        """
+        bucket = self.bucket(host)
+        if bucket is None:
+            return
+        try:
+            seconds = float(retry_after) if retry_after else 1 / bucket.limit.rate
+        except ValueError:
+            seconds = 1 / bucket.limit.rate
+        bucket.pause(seconds)
+
+    def stats(self) -> dict[str, Any]:
+        return {host: bucket.stats() for host, bucket in sorted(self._buckets.items())}
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter."""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter()
+    return _limiter
@@ -0,0 +1,45 @@
+"""
+Point-count reduction for chart series.
+
+``lttb_indices`` implements Largest-Triangle-Three-Buckets (Steinarsson,
+2013): the first and last points are kept, the rest are split into equal
+buckets, and from each bucket the point forming the largest triangle with
+the previously kept point and the next bucket's average is chosen.  Peaks
+and troughs survive, which plain striding or averaging would flatten.
+"""
+
+from typing import Sequence
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], max_points: int) -> list[int]:
+    """
+    Return the indices of at most *max_points* points to keep, in order.
+
+    *xs* must be ascending.  Series already within the limit (or a limit
+    below 3, where LTTB is undefined) are returned whole.
+    """
+    n = len(xs)
+    if max_points >= n or max_points < 3:
+        return list(range(n))
+
+    every = (n - 2) / (max_points - 2)
+    kept = [0]
+    a = 0
+    for i in range(max_points - 2):
+        # Average of the next bucket is the triangle's third vertex.
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / span
+        avg_y = sum(ys[avg_start:avg_end]) / span
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = a + 1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
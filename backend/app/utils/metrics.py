@@ -0,0 +1,75 @@
+"""
+Lightweight in-process latency histograms.
+
+Fixed millisecond buckets, so recording an observation is a bisect and an
+increment and a snapshot is cheap enough to build on every ``/health``
+request.  Quantiles are estimated from the bucket bounds (the upper bound
+of the bucket holding the requested rank), which is plenty to spot a
+pool that is starved or a query that has slowed down.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+# Upper bounds in milliseconds; observations above the last bound go to +Inf.
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class Histogram:
+    """Cumulative-style latency histogram over fixed bucket bounds (ms)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self._counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time spent in the block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - started) * 1000)
+
+    def quantile(self, q: float) -> float:
+        """Estimated *q*-quantile: the upper bound of the bucket holding it."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self._counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self, buckets: bool = True) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.50), 3),
+            "p95_ms": round(self.quantile(0.95), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+        if buckets:
+            cumulative, running = {}, 0
+            for bound, n in zip(self.buckets, self._counts):
+                running += n
+                cumulative[f"le_{bound:g}"] = running
+            cumulative["le_inf"] = self.count
+            out["buckets"] = cumulative
+        return out
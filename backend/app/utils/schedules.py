@@ -0,0 +1,169 @@
+"""
+Upstream data release calendars.
+
+Cached government data only changes when the agency publishes, so cache
+freshness can follow the publication calendar instead of a fixed TTL:
+an entry is fresh if it was written after the most recent release that
+could have changed it.
+
+Times are UTC.  Releases at 8:30 a.m. Eastern are taken as 13:30 UTC,
+the later of the EST/EDT offsets, so "after the release" is never
+claimed too early; ``SETTLE`` adds a margin for the API to catch up with
+the published tables.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Optional
+
+SETTLE = timedelta(hours=1)
+
+# 8:30 a.m., 10:00 a.m. and 2:00 p.m. Eastern, at the EST offset (the later
+# of the two in UTC)
+_MORNING_RELEASE_UTC = time(13, 30, tzinfo=timezone.utc)
+_TEN_AM_RELEASE_UTC = time(15, 0, tzinfo=timezone.utc)
+_AFTERNOON_RELEASE_UTC = time(19, 0, tzinfo=timezone.utc)
+
+FRIDAY = 4
+
+
+def first_weekday(year: int, month: int, weekday: int) -> date:
+    """First *weekday* (Monday = 0) of *year*-*month*."""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7)
+
+
+def business_day(year: int, month: int, n: int) -> date:
+    """*n*-th weekday (Monday-Friday) of *year*-*month*; holidays are not skipped."""
+    day = date(year, month, 1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    for _ in range(n - 1):
+        day += timedelta(days=3 if day.weekday() == FRIDAY else 1)
+    return day
+
+
+def _shift_month(year: int, month: int, delta: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def _utcnow(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(timezone.utc)
+    return now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+
+
+def _previous_monthly(release: Callable[[int, int], datetime], now: datetime) -> datetime:
+    """Latest *release(year, month)* at or before *now*."""
+    latest = release(now.year, now.month)
+    if latest > now:
+        latest = release(*_shift_month(now.year, now.month, -1))
+    return latest
+
+
+def _next_monthly(release: Callable[[int, int], datetime], now: datetime) -> datetime:
+    """First *release(year, month)* after *now*."""
+    upcoming = release(now.year, now.month)
+    if upcoming <= now:
+        upcoming = release(*_shift_month(now.year, now.month, 1))
+    return upcoming
+
+
+# ---------------------------------------------------------------------------
+# BLS Employment Situation (CPS / CES national series)
+# ---------------------------------------------------------------------------
+
+def employment_release(year: int, month: int) -> datetime:
+    """
+    When the Employment Situation for the previous month is usable.
+
+    BLS publishes on the first Friday of the month at 8:30 a.m. ET.  The
+    odd month it slips to the second Friday (holidays, an early first
+    Friday) is covered by callers capping the age of recent data.
+    """
+    day = first_weekday(year, month, FRIDAY)
+    return datetime.combine(day, _MORNING_RELEASE_UTC) + SETTLE
+
+
+def previous_employment_release(now: Optional[datetime] = None) -> datetime:
+    """Most recent Employment Situation release at or before *now*."""
+    return _previous_monthly(employment_release, _utcnow(now))
+
+
+def next_employment_release(now: Optional[datetime] = None) -> datetime:
+    """First Employment Situation release after *now*."""
+    return _next_monthly(employment_release, _utcnow(now))
+
+
+def previous_annual_revision(now: Optional[datetime] = None) -> datetime:
+    """
+    Most recent February Employment Situation at or before *now*.
+
+    The February release (January data) carries the annual CES benchmark
+    and the CPS seasonal-factor revisions, which rewrite earlier years.
+    """
+    now = _utcnow(now)
+    release = employment_release(now.year, 2)
+    if release > now:
+        release = employment_release(now.year - 1, 2)
+    return release
+
+
+def next_annual_revision(now: Optional[datetime] = None) -> datetime:
+    """First February Employment Situation after *now*."""
+    now = _utcnow(now)
+    release = employment_release(now.year, 2)
+    if release <= now:
+        release = employment_release(now.year + 1, 2)
+    return release
+
+
+# ---------------------------------------------------------------------------
+# BLS State Employment and Unemployment (LAUS state series)
+# ---------------------------------------------------------------------------
+
+def state_employment_release(year: int, month: int) -> datetime:
+    """
+    When the State Employment and Unemployment release is usable.
+
+    Published at 10:00 a.m. ET about two weeks after the national
+    release, most months on the third Friday; the exact date varies more
+    than the national one, so callers cap the age of state data too.
+    """
+    day = first_weekday(year, month, FRIDAY) + timedelta(weeks=2)
+    return datetime.combine(day, _TEN_AM_RELEASE_UTC) + SETTLE
+
+
+def previous_state_release(now: Optional[datetime] = None) -> datetime:
+    """Most recent state release at or before *now*."""
+    return _previous_monthly(state_employment_release, _utcnow(now))
+
+
+def next_state_release(now: Optional[datetime] = None) -> datetime:
+    """First state release after *now*."""
+    return _next_monthly(state_employment_release, _utcnow(now))
+
+
+# ---------------------------------------------------------------------------
+# Treasury Monthly Treasury Statement (federal receipts and outlays)
+# ---------------------------------------------------------------------------
+
+def mts_release(year: int, month: int) -> datetime:
+    """
+    When the Monthly Treasury Statement for the previous month is usable.
+
+    Treasury publishes on the eighth business day of the month at 2:00 p.m.
+    ET.  Federal holidays are not skipped, so this can fall a day or two
+    before the real release; callers cap the age of current-year data.
+    """
+    return datetime.combine(business_day(year, month, 8), _AFTERNOON_RELEASE_UTC) + SETTLE
+
+
+def previous_mts_release(now: Optional[datetime] = None) -> datetime:
+    """Most recent Monthly Treasury Statement at or before *now*."""
+    return _previous_monthly(mts_release, _utcnow(now))
+
+
+def next_mts_release(now: Optional[datetime] = None) -> datetime:
+    """First Monthly Treasury Statement after *now*."""
+    return _next_monthly(mts_release, _utcnow(now))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark cache writes under concurrent writers.
+
+Compares the old behaviour — encoding and ``write_bytes`` straight on the
+event loop — with the atomic, thread-offloaded writes ``BaseGovService``
+now uses.  While writers hammer a handful of keys, a 1 ms heartbeat task
+measures how late the event loop lets it run (p50/p99/max stall) and
+readers count torn/undecodable files.
+
+Usage:
+    python scripts/bench_cache_writes.py
+    python scripts/bench_cache_writes.py --writers 32 --rows 10000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.cache import atomic_write_bytes, decode_cache_payload, encode_cache_payload
+
+
+def _payload(rows: int) -> dict:
+    """A ``debt_to_penny``-sized payload."""
+    return {
+        "source": "U.S. Treasury Fiscal Data",
+        "data": [
+            {"date": f"{2000 + i // 365}-01-{i % 28 + 1:02d}", "total_debt": 3.4e13 + i}
+            for i in range(rows)
+        ],
+    }
+
+
+def _blocking_write(path: Path, data: dict, codec: str) -> None:
+    path.write_bytes(encode_cache_payload(data, codec))
+
+
+def _atomic_write(path: Path, data: dict, codec: str) -> None:
+    atomic_write_bytes(path, encode_cache_payload(data, codec))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(mode: str, args: argparse.Namespace, cache_dir: Path) -> dict:
+    data = _payload(args.rows)
+    paths = [cache_dir / f"{mode}_{i}.json" for i in range(args.keys)]
+    for p in paths:
+        _atomic_write(p, data, args.codec)
+
+    stalls: list[float] = []
+    write_latencies: list[float] = []
+    torn_reads = 0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - start - 0.001)
+
+    async def writer(n: int) -> None:
+        path = paths[n % len(paths)]
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            if mode == "blocking":
+                _blocking_write(path, data, args.codec)
+            else:
+                await asyncio.to_thread(_atomic_write, path, data, args.codec)
+            write_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    async def reader(n: int) -> None:
+        nonlocal torn_reads
+        path = paths[n % len(paths)]
+        while not done.is_set():
+            try:
+                decode_cache_payload(await asyncio.to_thread(path.read_bytes))
+            except (ValueError, OSError):
+                torn_reads += 1
+            await asyncio.sleep(0)
+
+    beat = asyncio.create_task(heartbeat())
+    readers = [asyncio.create_task(reader(i)) for i in range(args.keys)]
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(i) for i in range(args.writers)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await asyncio.gather(beat, *readers)
+
+    ms = 1000
+    return {
+        "mode": mode,
+        "writes": len(write_latencies),
+        "elapsed_s": round(elapsed, 2),
+        "write_p50_ms": round(statistics.median(write_latencies) * ms, 1),
+        "write_p99_ms": round(_percentile(write_latencies, 0.99) * ms, 1),
+        "loop_stall_p50_ms": round(statistics.median(stalls) * ms, 2),
+        "loop_stall_p99_ms": round(_percentile(stalls, 0.99) * ms, 2),
+        "loop_stall_max_ms": round(max(stalls) * ms, 2),
+        "torn_reads": torn_reads,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("blocking", "atomic-threaded"):
+            result = await run(mode, args, Path(tmp))
+            print("  ".join(f"{k}={v}" for k, v in result.items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cache writes under concurrent writers")
+    parser.add_argument("--writers", type=int, default=16, help="Concurrent writer tasks")
+    parser.add_argument("--keys", type=int, default=4, help="Distinct cache keys written")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per payload")
+    parser.add_argument("--rounds", type=int, default=10, help="Writes per writer")
+    parser.add_argument("--codec", default="json", help="Cache codec (json or zlib)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
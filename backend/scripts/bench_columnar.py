@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Compare row and columnar response formats for the time-series endpoints.
+
+Builds each payload with the services' own code from synthetic data sized
+like the largest real series, then serializes it the way FastAPI does for
+a plain ``dict`` return (``jsonable_encoder`` + ``JSONResponse``).  Reports
+the response size (raw and gzipped, as the GZip middleware would send it)
+and the CPU time to build plus serialize.
+
+Usage:
+    python scripts/bench_columnar.py
+    python scripts/bench_columnar.py --points 20000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.services.gov_data import GovDataService
+from app.services.housing.housing_service import _series_points
+from app.services.http_client import close_http_client
+
+
+def _housing_rows(n: int) -> list[dict]:
+    # Weekly 30-year mortgage rate from 1971 is ~2,800 rows; daily series are longer.
+    start = date(1971, 4, 2)
+    return [{"date": start + timedelta(weeks=i), "value": 7.0 + (i % 300) / 100} for i in range(n)]
+
+
+def _debt_history(n: int) -> dict:
+    start = date(1993, 4, 1)
+    return {
+        "source": "U.S. Treasury Fiscal Data",
+        "fetched_at": "2024-06-03T00:00:00",
+        "dates": [(start + timedelta(days=i)).isoformat() for i in range(n)],
+        "total_debt": [4.2e12 + i * 1e9 for i in range(n)],
+        "debt_held_public": [3.1e12 + i * 1e9 for i in range(n)],
+        "intragov_holdings": [1.1e12 for _ in range(n)],
+    }
+
+
+def _measure(build, repeat: int) -> tuple[float, int, int]:
+    best = float("inf")
+    body = b""
+    for _ in range(repeat):
+        started = time.process_time()
+        body = JSONResponse(content=jsonable_encoder(build())).body
+        best = min(best, time.process_time() - started)
+    return best, len(body), len(gzip.compress(body))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Row vs columnar payload size and serialization CPU")
+    parser.add_argument("--points", type=int, default=8000, help="points in the series")
+    parser.add_argument("--repeat", type=int, default=10, help="runs per case (best is reported)")
+    args = parser.parse_args()
+
+    rows = _housing_rows(args.points)
+    service = GovDataService()
+    history = _debt_history(args.points)
+
+    def debt(columnar: bool):
+        with patch.object(service, "get_debt_history", new_callable=AsyncMock, return_value=history):
+            return asyncio.run(service.get_national_debt(days=args.points, columnar=columnar))
+
+    cases = {
+        "housing observations": lambda columnar: {
+            "series_id": "MORTGAGE30US", **_series_points(rows, None, columnar),
+        },
+        "debt history": debt,
+    }
+
+    print(f"{args.points} points, best of {args.repeat}\n")
+    print(f"{'endpoint':<22} {'format':<9} {'cpu ms':>8} {'bytes':>10} {'gzip':>9}")
+    try:
+        for name, build in cases.items():
+            for fmt in ("rows", "columnar"):
+                cpu, raw, packed = _measure(lambda: build(fmt == "columnar"), args.repeat)
+                print(f"{name:<22} {fmt:<9} {cpu * 1000:8.2f} {raw:10,} {packed:9,}")
+    finally:
+        asyncio.run(service.close())
+        asyncio.run(close_http_client())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark ``HousingSyncService.sync_all`` against a local FRED stub.
+
+Starts a small HTTP/1.1 server on 127.0.0.1 that answers
+``/fred/series/observations`` after a configurable latency, and a fake
+asyncpg pool whose calls sleep for a configurable time.  The full
+``HOUSING_SERIES`` list is synced twice:
+
+* ``sequential`` — one series at a time with the old 0.5 s pause between
+  series (the pre-pipeline behaviour);
+* ``pipelined``  — the concurrent pipeline with the configured fetch/DB
+  concurrency.
+
+Both runs go through the shared HTTP client with FRED's 120 req/min token
+bucket applied to the stub host, so the comparison respects the quota.
+
+Usage:
+    python scripts/bench_housing_sync.py
+    python scripts/bench_housing_sync.py --fred-latency 0.3 --db-latency 0.05 --fetch-concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+# Compare raw fetch/upsert throughput; skip-unchanged would make reruns no-ops.
+os.environ.setdefault("HOUSING_SKIP_UNCHANGED", "false")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.housing.series_config import HOUSING_SERIES
+from app.services.housing.sync_service import HousingSyncService
+from app.services.http_client import close_http_client, init_http_client
+from app.services.rate_limit import DEFAULT_LIMITS, get_rate_limiter
+
+
+class FredStub:
+    """Minimal keep-alive HTTP server returning fake FRED observations."""
+
+    def __init__(self, latency: float, observations: int) -> None:
+        self.latency = latency
+        self.observations = observations
+        self.requests = 0
+
+    def _body(self, target: str) -> bytes:
+        query = parse_qs(urlsplit(target).query)
+        series_id = query.get("series_id", ["?"])[0]
+        return json.dumps({
+            "series_id": series_id,
+            "observations": [
+                {"date": f"{1980 + i // 12}-{i % 12 + 1:02d}-01", "value": f"{100 + i * 0.1:.1f}"}
+                for i in range(self.observations)
+            ],
+        }).encode()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                target = head.split(b" ", 2)[1].decode()
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                body = self._body(target)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class FakePool:
+    """Stands in for ``asyncpg.Pool``; every call takes ``latency`` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.rows = 0
+
+    async def execute(self, *args):
+        await asyncio.sleep(self.latency)
+
+    async def executemany(self, query, rows):
+        await asyncio.sleep(self.latency)
+        self.rows += len(rows)
+
+    async def fetchrow(self, *args):
+        await asyncio.sleep(self.latency)
+        return {"id": 1}
+
+    @asynccontextmanager
+    async def acquire(self):
+        # Large batches take the COPY path: one connection, one transaction.
+        yield _FakeConnection(self)
+
+
+class _FakeConnection:
+    def __init__(self, pool: FakePool) -> None:
+        self._pool = pool
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, *args):
+        await asyncio.sleep(self._pool.latency)
+
+    async def copy_records_to_table(self, table, records, columns):
+        await asyncio.sleep(self._pool.latency)
+        self._pool.rows += len(records)
+
+
+async def run(mode: str, args: argparse.Namespace, base_url: str) -> dict:
+    # Fresh FRED-sized token bucket for the stub host, so both modes start
+    # with the same burst allowance.
+    limiter = get_rate_limiter()
+    limiter.limits["127.0.0.1"] = DEFAULT_LIMITS["api.stlouisfed.org"]
+    limiter._buckets.pop("127.0.0.1", None)
+
+    pool = FakePool(args.db_latency)
+    if mode == "sequential":
+        service = HousingSyncService(pool, fetch_concurrency=1, db_concurrency=1)
+    else:
+        service = HousingSyncService(
+            pool, fetch_concurrency=args.fetch_concurrency, db_concurrency=args.db_concurrency,
+        )
+    service.BASE_URL = base_url
+
+    started = time.perf_counter()
+    if mode == "sequential":
+        for i, series_def in enumerate(HOUSING_SERIES):
+            await service.sync_series(series_def, full_backfill=True)
+            if i < len(HOUSING_SERIES) - 1:
+                await asyncio.sleep(0.5)
+        summary = {"stage_seconds": dict(service._stage_seconds), "errors": []}
+    else:
+        summary = await service.sync_all(full_backfill=True)
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": mode,
+        "seconds": elapsed,
+        "rows": pool.rows,
+        "errors": len(summary["errors"]),
+        "stages": summary["stage_seconds"],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fred-latency", type=float, default=0.2, help="stub response time (s)")
+    parser.add_argument("--db-latency", type=float, default=0.02, help="fake DB call time (s)")
+    parser.add_argument("--observations", type=int, default=500, help="observations per series")
+    parser.add_argument("--fetch-concurrency", type=int, default=4)
+    parser.add_argument("--db-concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    stub = FredStub(args.fred_latency, args.observations)
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    await init_http_client()
+
+    print(f"{len(HOUSING_SERIES)} series, FRED stub latency {args.fred_latency * 1000:.0f} ms, "
+          f"DB latency {args.db_latency * 1000:.0f} ms, FRED limit 120 req/min\n")
+    try:
+        async with server:
+            for mode in ("sequential", "pipelined"):
+                r = await run(mode, args, f"http://127.0.0.1:{port}/fred")
+                stages = ", ".join(f"{k} {v:.2f}s" for k, v in r["stages"].items())
+                print(f"{mode:>10}: {r['seconds']:6.2f}s  rows={r['rows']}  errors={r['errors']}  ({stages})")
+    finally:
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the two housing observation upsert paths against Postgres.
+
+Compares ``executemany`` (one ``INSERT ... ON CONFLICT`` per row) with the
+COPY-into-staging + single merge path used for large batches.  Both run on
+one connection inside an outer transaction that is rolled back at the end,
+so the benchmark leaves ``housing.observations`` untouched.
+
+Requires a reachable housing database (HOUSING_DB_* settings).
+
+Usage:
+    python scripts/bench_observation_upsert.py
+    python scripts/bench_observation_upsert.py --rows 50000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncpg
+
+from app.config import get_settings
+from app.db import queries as Q
+from app.services.housing.series_config import HOUSING_SERIES
+from app.services.housing.sync_service import HousingSyncService
+from app.services.http_client import close_http_client
+
+
+class _SingleConnectionPool:
+    """Pool-shaped wrapper so the service's own code runs on one connection."""
+
+    def __init__(self, conn: asyncpg.Connection) -> None:
+        self._conn = conn
+
+    async def executemany(self, query, rows):
+        return await self._conn.executemany(query, rows)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self._conn
+
+
+def _rows(series_id: str, n: int) -> list[tuple[str, date, float]]:
+    start = date(1950, 1, 1)
+    return [(series_id, start + timedelta(days=i), 3.0 + (i % 500) / 100) for i in range(n)]
+
+
+class _Rollback(Exception):
+    pass
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare executemany vs COPY+merge upserts")
+    parser.add_argument("--rows", type=int, default=20000, help="rows per batch")
+    parser.add_argument("--repeat", type=int, default=2, help="runs per path (best is reported)")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    conn = await asyncpg.connect(
+        host=settings.housing_db_host,
+        port=settings.housing_db_port,
+        user=settings.housing_db_user,
+        password=settings.housing_db_password or None,
+        database=settings.housing_db_name,
+    )
+    service = HousingSyncService(_SingleConnectionPool(conn))
+    # A registered series, so any foreign key on observations is satisfied.
+    rows = _rows(HOUSING_SERIES[0]["series_id"], args.rows)
+
+    paths = {
+        "executemany": lambda: conn.executemany(Q.UPSERT_OBSERVATIONS, rows),
+        "copy+merge": lambda: service.copy_upsert_observations(rows),
+    }
+    print(f"{args.rows} rows per batch, best of {args.repeat}\n")
+    try:
+        for name, run in paths.items():
+            timings = []
+            for _ in range(args.repeat):
+                try:
+                    async with conn.transaction():
+                        started = time.perf_counter()
+                        await run()
+                        timings.append(time.perf_counter() - started)
+                        raise _Rollback
+                except _Rollback:
+                    pass
+            best = min(timings)
+            print(f"{name:>12}: {best:7.3f}s  ({args.rows / best:,.0f} rows/s)")
+    finally:
+        await service.close()
+        await conn.close()
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Enforce the cache byte budget on ``data/cache`` from the command line.
+
+Runs one janitor pass (the same one the API runs in the background):
+entries past their TTL and stale window are removed, then entries are
+evicted by policy until the directory fits the budget.
+
+Usage:
+    python scripts/cache_janitor.py
+    python scripts/cache_janitor.py --dry-run --verbose
+    python scripts/cache_janitor.py --max-mb 128 --policy lfu
+
+Or via cron:
+    */30 * * * * cd /app && python scripts/cache_janitor.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import get_settings
+from app.services.cache import CacheManifest
+from app.services.cache_janitor import EVICTION_POLICIES, CacheJanitor
+
+
+def main() -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Evict cache entries over the byte budget")
+    parser.add_argument("--cache-dir", type=Path, default=settings.data_dir / "cache")
+    parser.add_argument("--max-mb", type=float, default=settings.cache_max_bytes / 1048576)
+    parser.add_argument("--policy", choices=EVICTION_POLICIES, default=settings.cache_eviction_policy)
+    parser.add_argument("--dry-run", action="store_true", help="report without deleting")
+    parser.add_argument("--verbose", "-v", action="store_true", help="list removed keys")
+    args = parser.parse_args()
+
+    manifest = CacheManifest(args.cache_dir, settings.cache_ttl_hours)
+    janitor = CacheJanitor(
+        manifest,
+        max_bytes=int(args.max_mb * 1048576),
+        policy=args.policy,
+        stale_ttl_hours=settings.cache_stale_ttl_hours,
+    )
+    report = janitor.run_once(dry_run=args.dry_run)
+
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"Cache: {report.files_before} files, {report.bytes_before / 1048576:.1f} MB "
+          f"(budget {report.budget_bytes / 1048576:.1f} MB, policy {report.policy})")
+    print(f"{verb} {report.expired} expired + {report.evicted} over-budget entries, "
+          f"{report.freed_bytes / 1048576:.1f} MB; {report.bytes_after / 1048576:.1f} MB remain "
+          f"({report.duration_ms:.0f} ms)")
+    if args.verbose:
+        for key in report.evicted_keys:
+            print(f"  {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,25 +22,10 @@ from datetime import datetime
 # Container-compatible import path
 sys.path.insert(0, "/app")
 
-from app.config import get_settings
+from app.db.pool import create_pool
 from app.services.housing.series_config import HOUSING_SERIES
 from app.services.housing.sync_service import HousingSyncService
-
-import asyncpg
-
-
-async def create_pool() -> asyncpg.Pool:
-    """Create a standalone asyncpg pool for the script."""
-    settings = get_settings()
-    return await asyncpg.create_pool(
-        host=settings.housing_db_host,
-        port=settings.housing_db_port,
-        user=settings.housing_db_user,
-        password=settings.housing_db_password or None,
-        database=settings.housing_db_name,
-        min_size=1,
-        max_size=5,
-    )
+from app.services.http_client import close_http_client
 
 
 async def run_validate() -> bool:
@@ -61,14 +46,13 @@ async def run_validate() -> bool:
             else:
                 print(f"  [{i:2d}/{len(HOUSING_SERIES)}] ✗ {sid}: NOT FOUND or invalid")
                 fail_count += 1
-            # Rate-limit
-            await asyncio.sleep(service.REQUEST_DELAY)
 
         print(f"\nResult: {ok_count} valid, {fail_count} invalid")
         return fail_count == 0
     finally:
         await service.close()
         await pool.close()
+        await close_http_client()
 
 
 async def run_sync(full_backfill: bool) -> bool:
@@ -87,9 +71,13 @@ async def run_sync(full_backfill: bool) -> bool:
         print(f"\n[{datetime.now().isoformat()}] Sync complete!")
         print(f"  Status:        {summary['status']}")
         print(f"  Series synced: {summary['series_synced']}/{summary['series_total']}")
+        print(f"  Unchanged:     {summary.get('series_unchanged', 0)} (skipped, FRED last_updated unchanged)")
         print(f"  Observations:  {summary['observations_upserted']}")
         print(f"  Errors:        {len(summary['errors'])}")
         print(f"  Duration:      {elapsed:.1f}s")
+        stages = ", ".join(f"{k} {v:.1f}s" for k, v in summary.get("stage_seconds", {}).items())
+        if stages:
+            print(f"  Stage time:    {stages} (summed across series)")
 
         if summary["errors"]:
             print("\nErrors:")
@@ -100,6 +88,7 @@ async def run_sync(full_backfill: bool) -> bool:
     finally:
         await service.close()
         await pool.close()
+        await close_http_client()
 
 
 def main() -> None:
@@ -21,6 +21,7 @@ sys.path.insert(0, '/app')
 
 from app.services.gov_data import get_gov_data_service
 from app.services.debt_deep_dive_service import get_debt_deep_dive_service
+from app.services.http_client import close_http_client
 
 
 async def warm_cache():
@@ -78,6 +79,7 @@ async def warm_cache():
 
     await service.close()
     await deep_dive.close()
+    await close_http_client()
 
     return success_count == len(tasks)
 
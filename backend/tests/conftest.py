@@ -6,6 +6,7 @@ from typing import AsyncGenerator, Generator
 import pytest
 from httpx import AsyncClient
 
+from app.config import get_settings
 from app.main import app
 
 
@@ -22,3 +23,22 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client."""
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture
+def isolated_settings(request, tmp_path, monkeypatch):
+    """
+    Point ``BaseGovService`` at a temporary cache directory.
+
+    Overrides come from indirect parametrisation::
+
+        @pytest.mark.parametrize("isolated_settings", [{"cache_codec": "zlib"}], indirect=True)
+
+    Returns the patched settings object.
+    """
+    overrides = getattr(request, "param", {})
+    settings = get_settings().model_copy(
+        update={"data_dir": tmp_path, "cache_ttl_hours": 48, **overrides},
+    )
+    monkeypatch.setattr("app.services.base.settings", settings)
+    return settings
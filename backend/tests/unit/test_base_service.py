@@ -9,6 +9,7 @@ import httpx
 import pytest
 
 from app.services.base import BaseGovService, ServiceError
+from app.services.http_client import close_http_client
 
 
 class ConcreteService(BaseGovService):
@@ -20,24 +21,28 @@ class ConcreteService(BaseGovService):
 
 
 @pytest.fixture
-def service(tmp_path, monkeypatch):
+def service(isolated_settings):
     """Create a service with a temporary cache directory."""
-    monkeypatch.setattr(
-        "app.services.base.settings",
-        type("S", (), {"data_dir": tmp_path, "cache_ttl_hours": 48})(),
-    )
     return ConcreteService()
 
 
+async def _drain(service, key):
+    """Wait for any in-flight (background) fetch of *key* to finish."""
+    import asyncio
+    for _ in range(200):
+        if key not in service._inflight:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"fetch for {key} still in flight")
+
+
 # ── Client lifecycle ────────────────────────────────────────────────────────
 
 
 class TestClientLifecycle:
     @pytest.mark.asyncio
     async def test_lazy_init(self, service):
-        assert service._client is None
         client = await service._get_client()
-        assert client is not None
         assert isinstance(client, httpx.AsyncClient)
 
     @pytest.mark.asyncio
@@ -47,16 +52,24 @@ class TestClientLifecycle:
         assert c1 is c2
 
     @pytest.mark.asyncio
-    async def test_close(self, service):
-        await service._get_client()
-        assert service._client is not None
-        await service.close()
-        assert service._client is None
+    async def test_recreated_client_picked_up(self, service):
+        old = await service._get_client()
+        await close_http_client()
+        new = await service._get_client()
+        assert new is not old
+        assert not new.is_closed
 
     @pytest.mark.asyncio
     async def test_close_when_no_client(self, service):
         await service.close()  # should not raise
 
+    @pytest.mark.asyncio
+    async def test_client_shared_between_services(self, service):
+        other = ConcreteService()
+        assert await service._get_client() is await other._get_client()
+        await service.close()
+        assert not (await other._get_client()).is_closed
+
 
 # ── Cache key ───────────────────────────────────────────────────────────────
 
@@ -104,6 +117,60 @@ class TestCacheReadWrite:
 
         assert service._read_cache(key) is None  # default 48h TTL
 
+    def test_reads_legacy_indented_json(self, service):
+        key = service._cache_key("legacy")
+        service._cache_path(key).write_text(json.dumps({"v": 1}, indent=2))
+        assert service._read_cache(key) == {"v": 1}
+
+    @pytest.mark.parametrize("isolated_settings", [{"cache_codec": "zlib"}], indirect=True)
+    def test_zlib_codec(self, service):
+        key = service._cache_key("zlib")
+        service._write_cache(key, {"v": [1] * 1000})
+        assert service._cache_path(key).stat().st_size < 200
+        assert service._read_cache(key) == {"v": [1] * 1000}
+
+    @pytest.mark.parametrize("isolated_settings", [{"cache_codec": "zlib"}], indirect=True)
+    def test_memory_size_is_uncompressed(self, service):
+        key = service._cache_key("zlib")
+        size = service._write_cache(key, {"v": [1] * 1000})
+        assert size == len('{"v":[' + ",".join(["1"] * 1000) + "]}")
+        assert service._load_cache_entry(key)[2] == size
+        assert service._manifest.get(key).size == service._cache_path(key).stat().st_size < 200
+
+    def test_unknown_codec_rejected_at_startup(self):
+        from pydantic import ValidationError
+        from app.config import Settings
+        with pytest.raises(ValidationError):
+            Settings(cache_codec="msgpack")
+
+    def test_write_is_atomic(self, service):
+        key = service._cache_key("atomic")
+        service._write_cache(key, {"v": 1})
+        service._write_cache(key, {"v": 2})
+        leftovers = [p.name for p in service._cache_dir.iterdir() if p.name.endswith(".tmp")]
+        assert leftovers == []
+        assert service._read_cache(key) == {"v": 2}
+
+    def test_failed_write_keeps_previous_file(self, service, monkeypatch):
+        key = service._cache_key("atomic_fail")
+        service._write_cache(key, {"v": 1})
+
+        def boom(src, dst):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr("app.services.cache.os.replace", boom)
+            with pytest.raises(OSError):
+                service._write_cache(key, {"v": 2})
+
+        assert service._read_cache(key) == {"v": 1}
+        assert not [p for p in service._cache_dir.iterdir() if p.name.endswith(".tmp")]
+
+    def test_corrupt_file_is_a_miss(self, service):
+        key = service._cache_key("corrupt")
+        service._cache_path(key).write_bytes(b'{"truncated": ')
+        assert service._read_cache(key) is None
+
     def test_custom_ttl(self, service):
         key = service._cache_key("c")
         service._write_cache(key, {"v": 1})
@@ -139,6 +206,129 @@ class TestCachedFetch:
         assert data == {"result": "cached"}
         fetch.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesced(self, service):
+        import asyncio
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return {"result": "fresh"}
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        key = service._cache_key("burst")
+        results = await asyncio.gather(
+            *(service._cached_fetch(key, fetch) for _ in range(5))
+        )
+        assert all(r == {"result": "fresh"} for r in results)
+        fetch.assert_awaited_once()
+        assert service.cache_stats()["single_flight"]["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_disk_hit_promoted_to_memory(self, service):
+        key = service._cache_key("promote")
+        service._write_cache(key, {"result": "cached"})
+        fetch = AsyncMock(return_value={"result": "fresh"})
+        await service._cached_fetch(key, fetch)
+
+        # Second lookup is served from memory even if the file disappears
+        service._cache_path(key).unlink()
+        data = await service._cached_fetch(key, fetch)
+        assert data == {"result": "cached"}
+        fetch.assert_not_awaited()
+        assert service.cache_stats()["memory"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_memory(self, service):
+        key = service._cache_key("invalidate")
+        await service._cached_fetch(key, AsyncMock(return_value={"v": 1}))
+        service._write_cache(key, {"v": 2})
+        data = await service._cached_fetch(key, AsyncMock(return_value={"v": 3}))
+        assert data == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_memory_respects_ttl(self, service):
+        key = service._cache_key("mem_ttl")
+        await service._cached_fetch(key, AsyncMock(return_value={"v": 1}))
+
+        # Backdate the file; the in-memory copy shares its write time
+        import os
+        old_time = time.time() - (2 * 3600)
+        os.utime(service._cache_path(key), (old_time, old_time))
+        service._memory._entries[key].written_at = old_time
+
+        fetch = AsyncMock(return_value={"v": 2})
+        data = await service._cached_fetch(key, fetch, ttl=1, stale_ttl=0)
+        assert data == {"v": 2}
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_refreshing(self, service):
+        import asyncio
+        import os
+
+        key = service._cache_key("swr")
+        service._write_cache(key, {"v": "stale"})
+        old_time = time.time() - (2 * 3600)
+        os.utime(service._cache_path(key), (old_time, old_time))
+
+        fetch = AsyncMock(return_value={"v": "fresh"})
+        data = await service._cached_fetch(key, fetch, ttl=1, stale_ttl=24)
+        assert data == {"v": "stale"}
+
+        # Let the background refresh finish, then the fresh value is served
+        await _drain(service, key)
+        fetch.assert_awaited_once()
+        assert service._read_cache(key, ttl=1) == {"v": "fresh"}
+        assert await service._cached_fetch(key, fetch, ttl=1) == {"v": "fresh"}
+
+    @pytest.mark.asyncio
+    async def test_past_stale_window_blocks_on_fetch(self, service):
+        import os
+
+        key = service._cache_key("hard_expired")
+        service._write_cache(key, {"v": "ancient"})
+        old_time = time.time() - (30 * 3600)
+        os.utime(service._cache_path(key), (old_time, old_time))
+
+        fetch = AsyncMock(return_value={"v": "fresh"})
+        data = await service._cached_fetch(key, fetch, ttl=1, stale_ttl=24)
+        assert data == {"v": "fresh"}
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_stale(self, service):
+        import asyncio
+        import os
+
+        key = service._cache_key("swr_fail")
+        service._write_cache(key, {"v": "stale"})
+        old_time = time.time() - (2 * 3600)
+        os.utime(service._cache_path(key), (old_time, old_time))
+
+        fetch = AsyncMock(side_effect=ServiceError("down"))
+        assert await service._cached_fetch(key, fetch, ttl=1) == {"v": "stale"}
+        await _drain(service, key)
+        assert await service._cached_fetch(key, fetch, ttl=1) == {"v": "stale"}
+
+
+class TestCacheManifest:
+    @pytest.mark.asyncio
+    async def test_writes_and_lookups_recorded(self, service):
+        fetch_fn = AsyncMock(return_value={"v": 1})
+        await service._cached_fetch("k", fetch_fn, ttl=6)
+        await service._cached_fetch("k", fetch_fn, ttl=6)
+
+        entry = service._manifest.get("k")
+        assert entry.service == "test_service"
+        assert entry.size == service._cache_path("k").stat().st_size
+        stats = service._manifest.summary()["by_service"]["test_service"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_header_carries_service_and_ttl(self, service):
+        from app.services.cache import read_cache_meta
+        service._write_cache("k", {"v": 1}, ttl=6)
+        assert read_cache_meta(service._cache_path("k")) == {"service": "test_service", "ttl": 6}
+
 
 # ── _fetch_json ─────────────────────────────────────────────────────────────
 
@@ -0,0 +1,153 @@
+"""Tests for USASpendingService's per-fiscal-year overview cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.base import ServiceError
+from app.services.budget_service import BudgetServiceError, USASpendingService
+from app.services.cache_janitor import CacheJanitor
+from app.utils.schedules import mts_release, next_mts_release, previous_mts_release
+
+FUNCTIONS = [{"budget_function_code": "050", "budget_function_title": "National Defense"}]
+
+
+@pytest.fixture
+def service(isolated_settings):
+    return USASpendingService()
+
+
+def _patch_sections(service, totals=None, functions=None):
+    return (
+        patch.object(service, "_fetch_budget_totals", new_callable=AsyncMock,
+                     side_effect=totals, return_value={"total": 6.1e12}),
+        patch.object(service, "get_spending_by_budget_function", new_callable=AsyncMock,
+                     side_effect=functions, return_value=FUNCTIONS),
+    )
+
+
+class TestBudgetOverview:
+    @pytest.mark.asyncio
+    async def test_sections_fetched_concurrently(self, service):
+        started = []
+
+        async def slow_totals(fy):
+            started.append("totals")
+            await asyncio.sleep(0.05)
+            assert "functions" in started  # the other section began meanwhile
+            return {"total": 1}
+
+        async def slow_functions(fy):
+            started.append("functions")
+            await asyncio.sleep(0.05)
+            return FUNCTIONS
+
+        patch_totals, patch_functions = _patch_sections(service, slow_totals, slow_functions)
+        with patch_totals, patch_functions:
+            overview = await service.get_budget_overview(2020)
+        assert overview["totals"] == {"total": 1}
+        assert overview["by_function"] == FUNCTIONS
+
+    @pytest.mark.asyncio
+    async def test_closed_year_cached_without_refetch(self, service):
+        patch_totals, patch_functions = _patch_sections(service)
+        with patch_totals as totals, patch_functions as functions:
+            first = await service.get_budget_overview(2020)
+            second = await service.get_budget_overview(2020)
+            await service.get_budget_overview(2021)
+        assert first["by_function"] == second["by_function"] == FUNCTIONS
+        assert [c.args[0] for c in totals.await_args_list] == [2020, 2021]
+        assert functions.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_totals_failure_is_not_cached(self, service):
+        failing = httpx.ConnectError("down")
+        patch_totals, patch_functions = _patch_sections(service, totals=failing)
+        with patch_totals as totals, patch_functions:
+            overview = await service.get_budget_overview(2020)
+            assert overview["totals"] == {}
+            totals.side_effect = None
+            overview = await service.get_budget_overview(2020)
+        assert overview["totals"] == {"total": 6.1e12}
+
+    @pytest.mark.asyncio
+    async def test_totals_upstream_error_tolerated(self, service):
+        patch_totals, patch_functions = _patch_sections(service, totals=ServiceError("down"))
+        with patch_totals, patch_functions:
+            assert (await service.get_budget_overview(2020))["totals"] == {}
+
+    @pytest.mark.asyncio
+    async def test_totals_programming_error_propagates(self, service):
+        patch_totals, patch_functions = _patch_sections(service, totals=KeyError("total"))
+        with patch_totals, patch_functions, pytest.raises(KeyError):
+            await service.get_budget_overview(2020)
+
+    @pytest.mark.asyncio
+    async def test_totals_cancellation_propagates(self, service):
+        patch_totals, patch_functions = _patch_sections(service, totals=asyncio.CancelledError())
+        with patch_totals, patch_functions, pytest.raises(asyncio.CancelledError):
+            await service.get_budget_overview(2020)
+
+    @pytest.mark.asyncio
+    async def test_totals_fetched_through_fetch_json(self, service):
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock,
+                          return_value={"total": 1}) as mock_fetch:
+            assert await service._fetch_budget_totals(2020) == {"total": 1}
+        assert mock_fetch.await_args.kwargs == {
+            "method": "POST", "json_body": {"fiscal_year": 2020, "spending_type": "total"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_function_failure_raises(self, service):
+        patch_totals, patch_functions = _patch_sections(
+            service, functions=BudgetServiceError("Failed to fetch budget functions"),
+        )
+        with patch_totals, patch_functions, pytest.raises(BudgetServiceError):
+            await service.get_budget_overview(2020)
+
+
+class TestFiscalYearTTL:
+    def test_closed_year_never_expires(self, service):
+        now = datetime(2026, 10, 16, tzinfo=timezone.utc)
+        assert service._fiscal_year_ttl(2025, now) == float("inf")
+        assert service._fiscal_year_ttl(2026, now) == float("inf")  # September MTS is out
+
+    def test_just_ended_year_waits_for_september_statement(self, service):
+        now = datetime(2026, 10, 5, tzinfo=timezone.utc)
+        assert service._fiscal_year_ttl(2026, now) < float("inf")
+
+    def test_open_year_follows_statement(self, service):
+        now = datetime(2026, 7, 11, 20, 0, tzinfo=timezone.utc)  # a day after the July MTS
+        assert previous_mts_release(now) == mts_release(2026, 7)
+        assert service._fiscal_year_ttl(2026, now) == pytest.approx(24.0)
+
+    def test_open_year_age_is_capped(self, service):
+        now = datetime(2026, 8, 1, tzinfo=timezone.utc)
+        assert service._fiscal_year_ttl(2026, now) == service.CURRENT_YEAR_MAX_AGE_HOURS
+
+    def test_store_ttl_runs_to_next_statement(self, service):
+        now = datetime(2026, 7, 9, 20, 0, tzinfo=timezone.utc)  # a day before the July MTS
+        assert next_mts_release(now) == mts_release(2026, 7)
+        assert service._fiscal_year_store_ttl(2026, now) == pytest.approx(24.0)
+        assert service._fiscal_year_store_ttl(2025, now) == float("inf")
+
+    @pytest.mark.asyncio
+    async def test_open_year_entry_survives_janitor_until_refresh(self, service):
+        fy = service._current_fiscal_year()
+        # Just after a statement the read window is tiny; the written TTL must not be.
+        since = datetime.now(timezone.utc) - timedelta(minutes=5)
+        patch_totals, patch_functions = _patch_sections(service)
+        with patch_totals, patch_functions, \
+             patch("app.services.budget_service.previous_mts_release", return_value=since):
+            await service.get_budget_overview(fy)
+
+        janitor = CacheJanitor(service._manifest, max_bytes=10**9, stale_ttl_hours=0)
+        janitor.run_once()
+        assert service._cache_path(service._cache_key("overview_totals", fy)).exists()
+        entry = service._manifest.get(service._cache_key("overview_totals", fy))
+        with patch("time.time", return_value=entry.expires + 1):
+            janitor.run_once()
+        assert not service._cache_path(entry.key).exists()
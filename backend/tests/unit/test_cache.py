@@ -0,0 +1,212 @@
+"""Tests for the cache primitives in ``app.services.cache``."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.services.cache import (
+    CACHE_MAGIC,
+    CacheManifest,
+    MemoryCache,
+    SingleFlight,
+    decode_cache_payload,
+    encode_cache_payload,
+    get_codec,
+    read_cache_meta,
+)
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", ["json", "zlib"])
+    def test_round_trip(self, codec):
+        data = {"data": [{"date": "2024-01-01", "total_debt": 1.5}] * 100}
+        raw = encode_cache_payload(data, codec)
+        assert raw.startswith(CACHE_MAGIC)
+        assert decode_cache_payload(raw) == data
+
+    def test_json_is_compact(self):
+        raw = encode_cache_payload({"a": [1, 2]}, "json")
+        assert raw.endswith(b'{"a":[1,2]}')
+
+    def test_zlib_smaller_than_legacy(self):
+        data = {"data": [{"date": f"2024-01-{d:02d}", "total_debt": 1e13} for d in range(1, 29)] * 50}
+        legacy = json.dumps(data, indent=2).encode()
+        assert len(encode_cache_payload(data, "zlib")) < len(legacy) / 4
+
+    def test_reads_legacy_json(self):
+        legacy = json.dumps({"v": 1}, indent=2).encode()
+        assert decode_cache_payload(legacy) == {"v": 1}
+
+    def test_unknown_version_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cache_payload(CACHE_MAGIC + bytes((99, 1)) + b"{}")
+
+    def test_corrupt_zlib_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cache_payload(CACHE_MAGIC + bytes((1, 2)) + b"not zlib")
+
+    def test_unknown_codec_name(self):
+        with pytest.raises(ValueError):
+            get_codec("msgpack")
+
+
+    def test_meta_readable_without_payload(self, tmp_path):
+        path = tmp_path / "k.json"
+        path.write_bytes(encode_cache_payload({"x": 1}, "zlib", meta={"service": "s", "ttl": 6}))
+        assert read_cache_meta(path) == {"service": "s", "ttl": 6}
+        assert decode_cache_payload(path.read_bytes()) == {"x": 1}
+
+    def test_legacy_file_has_no_meta(self, tmp_path):
+        path = tmp_path / "k.json"
+        path.write_text(json.dumps({"x": 1}, indent=2))
+        assert read_cache_meta(path) == {}
+
+
+class TestMemoryCache:
+    def test_set_then_get(self):
+        cache = MemoryCache()
+        cache.set("a", {"v": 1}, time.time(), 10)
+        assert cache.get("a", max_age=60) == {"v": 1}
+
+    def test_expired_entry_is_a_miss(self):
+        cache = MemoryCache()
+        cache.set("a", {"v": 1}, time.time() - 120, 10)
+        assert cache.get("a", max_age=60) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_lru_by_count(self):
+        cache = MemoryCache(max_entries=2)
+        now = time.time()
+        cache.set("a", 1, now, 1)
+        cache.set("b", 2, now, 1)
+        cache.get("a", max_age=60)  # "b" is now least recently used
+        cache.set("c", 3, now, 1)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_by_bytes(self):
+        cache = MemoryCache(max_bytes=100)
+        now = time.time()
+        cache.set("a", 1, now, 60)
+        cache.set("b", 2, now, 60)
+        assert "a" not in cache
+        assert cache.stats()["bytes"] == 60
+
+    def test_oversized_entry_not_stored(self):
+        cache = MemoryCache(max_bytes=100)
+        cache.set("a", 1, time.time(), 101)
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = MemoryCache()
+        cache.set("a", 1, time.time(), 10)
+        cache.invalidate("a")
+        assert "a" not in cache
+        assert cache.stats()["bytes"] == 0
+
+    def test_hit_ratio(self):
+        cache = MemoryCache()
+        cache.set("a", 1, time.time(), 10)
+        cache.get("a", max_age=60)
+        cache.get("missing", max_age=60)
+        assert cache.stats()["hit_ratio"] == 0.5
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"v": calls}
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"v": 1} for r in results)
+        assert flight.stats()["coalesced"] == 4
+        assert "k" not in flight
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_waiters(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_fetch(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        waiter = asyncio.ensure_future(flight.do("k", fetch))
+        survivor = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await survivor == "done"
+
+
+class TestCacheManifest:
+    def test_rebuild_reads_headers(self, tmp_path):
+        (tmp_path / "a.json").write_bytes(encode_cache_payload({"x": 1}, meta={"service": "debt", "ttl": 6}))
+        (tmp_path / "b.json").write_text(json.dumps({"legacy": True}))
+        (tmp_path / ".a.json.123.tmp").write_bytes(b"partial")
+        manifest = CacheManifest(tmp_path)
+        manifest.rebuild()
+
+        assert manifest.loaded
+        assert len(manifest) == 2
+        entry = manifest.get("a")
+        assert entry.service == "debt"
+        assert entry.expires == pytest.approx(entry.created + 6 * 3600)
+        summary = manifest.summary()
+        assert summary["files"] == 2
+        assert set(summary["by_service"]) == {"debt", "unknown"}
+        assert summary["oldest_entry"] is not None
+
+    def test_incremental_totals(self, tmp_path):
+        manifest = CacheManifest(tmp_path)
+        manifest.record_write("a", "debt", 1048576, created=100.0)
+        manifest.record_write("b", "housing", 2 * 1048576, created=200.0)
+        manifest.record_write("a", "debt", 3 * 1048576, created=300.0)
+        summary = manifest.summary()
+        assert summary["files"] == 2
+        assert summary["size_mb"] == 5.0
+        assert summary["by_service"]["debt"]["size_mb"] == 3.0
+
+        manifest.remove("b")
+        assert manifest.summary()["files"] == 1
+        assert manifest.summary()["by_service"]["housing"]["files"] == 0
+
+    def test_hit_ratio(self, tmp_path):
+        manifest = CacheManifest(tmp_path)
+        manifest.record_write("a", "debt", 10)
+        for _ in range(3):
+            manifest.record_hit("debt", "a")
+        manifest.record_miss("debt")
+        stats = manifest.summary()["by_service"]["debt"]
+        assert stats["hits"] == 3 and stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.75
+        assert manifest.get("a").hits == 3
+
+    def test_rebuild_keeps_newer_recorded_entries(self, tmp_path):
+        (tmp_path / "a.json").write_bytes(encode_cache_payload({"x": 1}, meta={"service": "old"}))
+        manifest = CacheManifest(tmp_path)
+        manifest.record_write("a", "new", 99)
+        manifest.rebuild()
+        assert manifest.get("a").service == "new"
@@ -0,0 +1,134 @@
+"""Tests for the cache janitor."""
+
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+from app.services.cache import CacheManifest, encode_cache_payload
+from app.services.cache_janitor import CacheJanitor
+
+
+def _write(manifest: CacheManifest, key: str, size: int, *, created=None, ttl=48, hits=0, last_access=None):
+    """Create a cache file of ~*size* bytes and index it."""
+    payload = encode_cache_payload({"pad": "x" * size}, meta={"service": "s", "ttl": ttl})
+    (manifest.cache_dir / f"{key}.json").write_bytes(payload)
+    manifest.record_write(key, "s", len(payload), ttl, created=created)
+    entry = manifest.get(key)
+    entry.hits = hits
+    if last_access is not None:
+        entry.last_access = last_access
+    return entry
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = CacheManifest(tmp_path)
+    m.loaded = True
+    return m
+
+
+class TestCacheJanitor:
+    def test_under_budget_is_noop(self, manifest):
+        _write(manifest, "a", 100)
+        report = CacheJanitor(manifest, max_bytes=10_000).run_once()
+        assert report.evicted == report.expired == 0
+        assert (manifest.cache_dir / "a.json").exists()
+
+    def test_dead_entries_removed_first(self, manifest):
+        now = time.time()
+        _write(manifest, "dead", 100, created=now - 100 * 3600, ttl=1)
+        _write(manifest, "stale", 100, created=now - 2 * 3600, ttl=1)
+        report = CacheJanitor(manifest, max_bytes=10_000, stale_ttl_hours=24).run_once()
+        assert report.expired == 1
+        assert "dead" not in manifest
+        assert not (manifest.cache_dir / "dead.json").exists()
+        assert "stale" in manifest
+
+    def test_permanent_entries_never_removed(self, manifest):
+        now = time.time()
+        _write(manifest, "store", 1000, created=now - 1000 * 3600, ttl=float("inf"), last_access=now - 900)
+        _write(manifest, "old", 1000, last_access=now - 300)
+        _write(manifest, "new", 1000, last_access=now - 100)
+        report = CacheJanitor(manifest, max_bytes=0, stale_ttl_hours=24).run_once()
+        assert sorted(report.evicted_keys) == ["new", "old"]
+        assert "store" in manifest
+        assert (manifest.cache_dir / "store.json").exists()
+
+    def test_lru_evicts_least_recently_used(self, manifest):
+        now = time.time()
+        _write(manifest, "old", 1000, last_access=now - 300)
+        _write(manifest, "mid", 1000, last_access=now - 200)
+        _write(manifest, "new", 1000, last_access=now - 100)
+        budget = manifest.total_bytes - 1
+        report = CacheJanitor(manifest, max_bytes=budget, policy="lru").run_once()
+        assert report.evicted_keys == ["old"]
+        assert manifest.total_bytes <= budget
+
+    def test_lfu_evicts_least_frequently_used(self, manifest):
+        now = time.time()
+        _write(manifest, "popular", 1000, hits=50, last_access=now - 300)
+        _write(manifest, "rare", 1000, hits=1, last_access=now - 100)
+        report = CacheJanitor(manifest, max_bytes=manifest.total_bytes - 1, policy="lfu").run_once()
+        assert report.evicted_keys == ["rare"]
+        assert "popular" in manifest
+
+    def test_dry_run_deletes_nothing(self, manifest):
+        _write(manifest, "a", 1000)
+        _write(manifest, "b", 1000)
+        janitor = CacheJanitor(manifest, max_bytes=0)
+        report = janitor.run_once(dry_run=True)
+        assert report.evicted == 2
+        assert len(manifest) == 2
+        assert (manifest.cache_dir / "a.json").exists()
+        assert janitor.stats()["runs"] == 0
+
+    def test_rewritten_entry_is_not_evicted(self, manifest):
+        entry = _write(manifest, "a", 1000)
+        _write(manifest, "a", 1000)
+        assert manifest.evict(entry) is False
+        assert (manifest.cache_dir / "a.json").exists()
+
+    def test_stats_accumulate(self, manifest):
+        _write(manifest, "a", 1000)
+        janitor = CacheJanitor(manifest, max_bytes=0)
+        janitor.run_once()
+        stats = janitor.stats()
+        assert stats["runs"] == 1
+        assert stats["evicted"] == 1
+        assert stats["last_run"]["bytes_after"] == 0
+
+    def test_unknown_policy_rejected(self, manifest):
+        with pytest.raises(ValueError):
+            CacheJanitor(manifest, max_bytes=0, policy="fifo")
+
+    def test_unknown_policy_rejected_at_startup(self):
+        with pytest.raises(ValidationError):
+            Settings(cache_eviction_policy="fifo")
+
+
+class TestLifespan:
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_janitor(self, tmp_path, monkeypatch):
+        import asyncio
+
+        from app import main
+        from app.config import get_settings
+
+        finished = []
+
+        class _Janitor:
+            async def run_forever(self, interval_seconds):
+                try:
+                    await asyncio.sleep(3600)
+                finally:
+                    finished.append(True)
+
+        monkeypatch.setattr(main, "settings", get_settings().model_copy(
+            update={"data_dir": tmp_path, "fred_api_key": "", "cache_janitor_interval_minutes": 1},
+        ))
+        monkeypatch.setattr(main, "get_cache_janitor", _Janitor)
+        async with main.lifespan(main.app):
+            await asyncio.sleep(0)
+        assert finished == [True]
@@ -0,0 +1,93 @@
+"""Tests for congress_service's popular tickers over the cached trade list."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import congress_service
+
+PAGE = congress_service.TRADES_PAGE_SIZE
+
+
+def _pages(tickers: list[str]):
+    """Fake ``_fetch_trades`` serving *tickers* (one trade each) in pages."""
+    async def fetch(endpoint, params=None):
+        assert endpoint == "/trades"
+        start = (params["page"] - 1) * PAGE
+        chunk = tickers[start:start + PAGE]
+        return {
+            "total": len(tickers),
+            "trades": [{"ticker": t, "asset_name": f"{t} Inc"} for t in chunk],
+        }
+    return fetch
+
+
+@pytest.fixture(autouse=True)
+def fresh_dataset(monkeypatch):
+    monkeypatch.setattr(congress_service, "_trades_dataset", None)
+    monkeypatch.setattr(congress_service, "_trades_retry_at", 0.0)
+
+
+class TestPopularTickers:
+    @pytest.mark.asyncio
+    async def test_counts_across_pages(self):
+        tickers = ["AAPL"] * 600 + ["MSFT"] * 300 + ["N/A"] * 50 + [""] * 10 + ["NVDA"] * 100
+        with patch.object(congress_service, "_fetch_trades", side_effect=_pages(tickers)) as fetch:
+            result = await congress_service.get_popular_tickers(limit=2)
+        assert result == [
+            {"ticker": "AAPL", "name": "AAPL Inc", "trades": 600},
+            {"ticker": "MSFT", "name": "MSFT Inc", "trades": 300},
+        ]
+        assert fetch.await_count == 3  # 1,060 trades in pages of 500
+
+    @pytest.mark.asyncio
+    async def test_upstream_calls_do_not_grow_with_limit(self):
+        tickers = [f"T{i}" for i in range(50)] * 30
+        with patch.object(congress_service, "_fetch_trades", side_effect=_pages(tickers)) as fetch:
+            await congress_service.get_popular_tickers(limit=5)
+            calls = fetch.await_count
+            congress_service._trades_dataset = None
+            result = await congress_service.get_popular_tickers(limit=50)
+        assert len(result) == 50
+        assert fetch.await_count == 2 * calls
+
+    @pytest.mark.asyncio
+    async def test_dataset_cached_between_calls(self):
+        with patch.object(congress_service, "_fetch_trades", side_effect=_pages(["AAPL"] * 10)) as fetch:
+            await congress_service.get_popular_tickers()
+            await congress_service.get_popular_tickers(limit=3)
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_page_cap(self, monkeypatch):
+        monkeypatch.setattr(congress_service, "TRADES_MAX_PAGES", 2)
+        with patch.object(congress_service, "_fetch_trades", side_effect=_pages(["AAPL"] * 5000)) as fetch:
+            result = await congress_service.get_popular_tickers()
+        assert fetch.await_count == 2
+        assert result[0]["trades"] == 2 * PAGE
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_copy(self, monkeypatch):
+        with patch.object(congress_service, "_fetch_trades", side_effect=_pages(["AAPL"] * 10)):
+            await congress_service.get_popular_tickers()
+        monkeypatch.setattr(congress_service, "TRADES_DATASET_TTL", 0)
+        with patch.object(congress_service, "_fetch_trades", new_callable=AsyncMock, return_value={}):
+            result = await congress_service.get_popular_tickers()
+        assert result == [{"ticker": "AAPL", "name": "AAPL Inc", "trades": 10}]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_backs_off(self, monkeypatch):
+        monkeypatch.setattr(congress_service, "TRADES_DATASET_TTL", 0)
+        with patch.object(congress_service, "_fetch_trades", new_callable=AsyncMock, return_value={}) as fetch:
+            await congress_service.get_popular_tickers()
+            await congress_service.get_popular_tickers()
+            assert fetch.await_count == 1
+            monkeypatch.setattr(congress_service, "_trades_retry_at", 0.0)
+            await congress_service.get_popular_tickers()
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unavailable_upstream_returns_empty(self):
+        with patch.object(congress_service, "_fetch_trades", new_callable=AsyncMock, return_value={}):
+            assert await congress_service.get_popular_tickers() == []
+        assert congress_service._trades_dataset is None
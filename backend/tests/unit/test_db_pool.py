@@ -0,0 +1,103 @@
+"""Tests for the metered asyncpg pool wrapper in ``app.db.pool``."""
+
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
+
+from app.db import pool as db_pool
+from app.db import queries as Q
+from app.db.pool import MeteredPool, _prepare_statements
+
+
+@pytest.fixture
+def conn():
+    c = AsyncMock()
+    c.fetch.return_value = [{"x": 1}]
+    return c
+
+
+@pytest.fixture
+def raw_pool(conn):
+    p = MagicMock()
+    p.acquire = AsyncMock(return_value=conn)
+    p.release = AsyncMock()
+    p.get_size.return_value = 4
+    p.get_idle_size.return_value = 1
+    p.get_min_size.return_value = 2
+    p.get_max_size.return_value = 10
+    return p
+
+
+class TestMeteredPool:
+    @pytest.mark.asyncio
+    async def test_query_timed_per_statement(self, raw_pool, conn):
+        pool = MeteredPool(raw_pool)
+        rows = await pool.fetch(Q.SELECT_OBSERVATIONS_RANGE, "HOUST", None, None)
+        assert rows == [{"x": 1}]
+        conn.fetch.assert_awaited_once_with(Q.SELECT_OBSERVATIONS_RANGE, "HOUST", None, None)
+        raw_pool.release.assert_awaited_once_with(conn)
+
+        stats = pool.stats()
+        assert stats["in_use"] == 3
+        assert stats["acquire_wait"]["count"] == 1
+        assert stats["query"]["count"] == 1
+        assert set(stats["statements"]) == {"SELECT_OBSERVATIONS_RANGE"}
+
+    @pytest.mark.asyncio
+    async def test_acquire_awaitable_and_context_manager(self, raw_pool, conn):
+        pool = MeteredPool(raw_pool)
+        assert await pool.acquire() is conn
+        async with pool.acquire() as c:
+            assert c is conn
+        raw_pool.release.assert_awaited_once_with(conn)
+        assert pool.acquire_wait.count == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout_counted(self, raw_pool):
+        raw_pool.acquire.side_effect = asyncio.TimeoutError
+        pool = MeteredPool(raw_pool)
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.fetchval(Q.SELECT_SYNC_VERSION)
+        assert pool.acquire_timeouts == 1
+        assert pool.query_latency.count == 0
+
+    def test_stats_none_without_pool(self, monkeypatch):
+        monkeypatch.setattr(db_pool, "_pool", None)
+        assert db_pool.pool_stats() is None
+
+
+class TestPrepareStatements:
+    @pytest.mark.asyncio
+    async def test_warms_statement_cache_and_skips_failures(self):
+        import asyncpg
+
+        async def get_statement(query, timeout):
+            if query == Q.SELECT_LATEST_OBSERVATIONS_MULTI:
+                raise asyncpg.exceptions.UndefinedTableError("missing")
+
+        conn = MagicMock()
+        conn._get_statement = AsyncMock(side_effect=get_statement)
+        await _prepare_statements(conn)
+        prepared = [c.args[0] for c in conn._get_statement.await_args_list]
+        assert prepared == list(Q.PREPARED_STATEMENTS)
+
+    def test_asyncpg_still_provides_cached_statement_path(self):
+        import inspect
+
+        import asyncpg
+
+        params = inspect.signature(asyncpg.Connection._get_statement).parameters
+        assert list(params)[1:3] == ["query", "timeout"]
+        assert params["use_cache"].default is True
+
+    @pytest.mark.asyncio
+    async def test_missing_private_api_is_logged(self, monkeypatch):
+        logger = MagicMock()
+        monkeypatch.setattr(db_pool, "logger", logger)
+        await _prepare_statements(MagicMock(spec=[]))
+        assert "warm-up disabled" in logger.warning.call_args.args[0]
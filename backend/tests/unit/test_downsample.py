@@ -0,0 +1,23 @@
+"""Tests for LTTB downsampling in ``app.utils.downsample``."""
+
+from app.utils.downsample import lttb_indices
+
+
+class TestLttb:
+    def test_short_series_untouched(self):
+        assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+        assert lttb_indices([0, 1, 2, 3], [5, 6, 7, 8], 2) == [0, 1, 2, 3]
+
+    def test_keeps_endpoints_and_count(self):
+        xs = list(range(1000))
+        ys = [float(x % 17) for x in xs]
+        keep = lttb_indices(xs, ys, 50)
+        assert len(keep) == 50
+        assert keep[0] == 0 and keep[-1] == 999
+        assert keep == sorted(set(keep))
+
+    def test_preserves_spike(self):
+        xs = list(range(500))
+        ys = [0.0] * 500
+        ys[250] = 100.0
+        assert 250 in lttb_indices(xs, ys, 20)
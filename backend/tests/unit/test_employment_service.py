@@ -0,0 +1,189 @@
+"""Tests for BLSEmploymentService: request planning and the series store."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.base import ServiceError
+from app.services.cache_janitor import CacheJanitor
+from app.services.employment_service import BLSEmploymentService, EmploymentServiceError
+from app.utils.schedules import next_state_release
+
+
+def _series(values, year=2024):
+    """Newest-first monthly BLS rows."""
+    return [
+        {"year": year, "period": f"M{12 - i:02d}", "value": v, "footnotes": []}
+        for i, v in enumerate(values)
+    ]
+
+
+def _fake_request(series_ids, start_year, end_year):
+    return {
+        sid: [row for year in range(end_year, start_year - 1, -1)
+              for row in _series([100.0 + i for i in range(12)], year)]
+        for sid in series_ids
+    }
+
+
+@pytest.fixture
+def make_service(isolated_settings):
+    """Build services sharing a temporary cache directory."""
+    return lambda api_key=None: BLSEmploymentService(api_key=api_key)
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service()
+
+
+class TestRequestPlanning:
+    @pytest.mark.asyncio
+    async def test_chunks_by_series_limit_and_dedupes(self, service):
+        ids = [f"S{i}" for i in range(60)] + ["S0", "S1"]
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            data = await service.fetch_series(ids, 2020, 2024)
+        assert len(data) == 60
+        assert [len(c.args[0]) for c in mock_request.await_args_list] == [25, 25, 10]  # anonymous limit
+
+    @pytest.mark.asyncio
+    async def test_api_key_raises_limits(self, make_service):
+        service = make_service(api_key="key")
+        ids = [f"S{i}" for i in range(60)]
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            await service.fetch_series(ids, 2000, 2024)
+        calls = [(len(c.args[0]), c.args[1], c.args[2]) for c in mock_request.await_args_list]
+        # 50-series chunks x 20-year spans
+        assert sorted(calls) == sorted([(50, 2000, 2019), (50, 2020, 2024), (10, 2000, 2019), (10, 2020, 2024)])
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_wrapped(self, service):
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock,
+                          return_value={"status": "REQUEST_NOT_PROCESSED", "message": ["quota"]}):
+            with pytest.raises(EmploymentServiceError):
+                await service.fetch_series(["LNS14000000"], 2024, 2024)
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, side_effect=ServiceError("down")):
+            with pytest.raises(EmploymentServiceError):
+                await service.fetch_series(["LNS14000000"], 2024, 2024)
+
+
+class TestSeriesStore:
+    @pytest.mark.asyncio
+    async def test_only_missing_years_requested(self, make_service):
+        with patch.object(BLSEmploymentService, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            first = await make_service().fetch_series(["A", "B"], 2019, 2021)
+            # A fresh instance reads the same on-disk store.
+            second = await make_service().fetch_series(["A", "B"], 2019, 2021)
+            assert mock_request.await_count == 1
+            assert second == first
+            assert [r["year"] for r in first["A"][::12]] == [2021, 2020, 2019]
+
+            await make_service().fetch_series(["A", "C"], 2017, 2021)
+        requested = sorted(
+            (tuple(c.args[0]), c.args[1], c.args[2]) for c in mock_request.await_args_list[1:]
+        )
+        assert requested == [(("A",), 2017, 2018), (("C",), 2017, 2021)]
+
+    @pytest.mark.asyncio
+    async def test_outdated_years_refetched_after_release(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            year = datetime.now().year
+            await service.fetch_series(["A"], year - 3, year)
+            # Pretend the next release happened: recent years age out, old ones do not.
+            with patch.object(service, "_year_max_age", side_effect=lambda y, now: 0 if y >= year - 1 else 1e9):
+                await service.fetch_series(["A"], year - 3, year)
+        last = mock_request.await_args_list[-1].args
+        assert (last[1], last[2]) == (year - 1, year)
+
+    @pytest.mark.asyncio
+    async def test_serves_outdated_store_when_bls_down(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock, side_effect=_fake_request):
+            stored = await service.fetch_series(["A"], 2020, 2021)
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=EmploymentServiceError("down")), \
+             patch.object(service, "_year_max_age", return_value=0):
+            assert await service.fetch_series(["A"], 2020, 2021) == stored
+            with pytest.raises(EmploymentServiceError):
+                await service.fetch_series(["A"], 2019, 2021)  # 2019 was never stored
+
+    @pytest.mark.asyncio
+    async def test_closed_years_survive_janitor(self, service):
+        year = datetime.now().year
+        with patch.object(service, "_request_series", new_callable=AsyncMock, side_effect=_fake_request):
+            await service.fetch_series(["A"], year - 3, year)
+        for entry in service._manifest.entries():
+            entry.created -= 1000 * 3600
+        CacheJanitor(service._manifest, max_bytes=0, stale_ttl_hours=24).run_once()
+
+        def stored(y):
+            return service._cache_path(service._cache_key("series", "A", y)).exists()
+        assert stored(year - 3) and stored(year - 2)
+        assert not stored(year - 1) and not stored(year)
+
+
+class TestFullReport:
+    @pytest.mark.asyncio
+    async def test_one_request_for_all_sections(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request, \
+             patch.object(service, "fetch_series", wraps=service.fetch_series) as plan:
+            report = await service.get_full_employment_report()
+        plan.assert_awaited_once()  # one batched plan for every section
+        mock_request.assert_awaited_once()
+        requested = mock_request.await_args.args[0]
+        assert len(requested) == len(set(requested)) == 25
+        assert report["summary"]["unemployment_rate"] == 100.0
+        assert len(report["unemployment_trend"]) == 12
+        assert len(report["demographics"]) == 7
+        assert len(report["sectors"]) == 12
+        assert report["jobs_added"][0]["jobs_added"] == -1000.0
+
+    @pytest.mark.asyncio
+    async def test_sections_served_from_report_fetch(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            report = await service.get_full_employment_report()
+            assert report["sectors"] == await service.get_jobs_by_sector()
+            assert report["demographics"] == await service.get_unemployment_by_demographic()
+            assert report["jobs_added"] == await service.get_jobs_added(months=12)
+        mock_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_wrapped(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=EmploymentServiceError("down")):
+            with pytest.raises(EmploymentServiceError):
+                await service.get_full_employment_report()
+
+
+class TestStateUnemployment:
+    @pytest.mark.asyncio
+    async def test_all_states_chunked_and_cached(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock,
+                          side_effect=_fake_request) as mock_request:
+            states = await service.get_state_unemployment()
+            again = await service.get_state_unemployment()
+        assert mock_request.await_count == 3  # 52 series in chunks of 25
+        assert len(states) == 52
+        assert {"DC", "WY", "PR"} <= {s["state"] for s in states}
+        assert again == states
+        year = datetime.now().year
+        assert states[0] == {"state": states[0]["state"], "unemployment_rate": 100.0,
+                             "year": year, "month": "M12"}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_kept_until_next_release(self, service):
+        with patch.object(service, "_request_series", new_callable=AsyncMock, side_effect=_fake_request):
+            await service.get_state_unemployment()
+        entry = service._manifest.get(service._cache_key("state_unemployment"))
+        now = datetime.now(timezone.utc)
+        due = min(next_state_release(now), now + timedelta(hours=service.RECENT_YEAR_MAX_AGE_HOURS))
+        assert entry.expires == pytest.approx(due.timestamp(), abs=60)
+
+        CacheJanitor(service._manifest, max_bytes=10**9, stale_ttl_hours=0).run_once()
+        assert service._cache_path(entry.key).exists()
@@ -0,0 +1,140 @@
+"""Tests for GovDataService."""
+
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.base import BaseGovService, ServiceError
+from app.services.cache_janitor import CacheJanitor
+from app.services.gov_data import DataFetchError, GovDataService
+
+
+@pytest.fixture
+def service(isolated_settings):
+    """Create a service with a temporary cache directory."""
+    return GovDataService()
+
+
+class TestGovDataService:
+    def test_extends_base_service(self, service):
+        assert isinstance(service, BaseGovService)
+        assert DataFetchError is ServiceError
+
+    @pytest.mark.asyncio
+    async def test_national_debt_cached(self, service):
+        treasury = {"data": [{"record_date": "2024-06-03", "tot_pub_debt_out_amt": "34600000000000.00"}]}
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=treasury) as mock_fetch:
+            first = await service.get_national_debt(days=1)
+            second = await service.get_national_debt(days=1)
+        assert first["data"][0] == {"date": "2024-06-03", "total_debt": 34600000000000.0}
+        assert second == first
+        mock_fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_debt_windows_share_one_history(self, service):
+        records = [
+            {"record_date": f"2024-06-0{d}", "tot_pub_debt_out_amt": f"{d}.0",
+             "debt_held_public_amt": "null", "intragov_hold_amt": "1.0"}
+            for d in (3, 1, 2)
+        ]
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock,
+                          return_value={"data": records, "meta": {"total-pages": 1}}) as mock_fetch:
+            two = await service.get_national_debt(days=2)
+            everything = await service.get_national_debt(days=365)
+            latest = await service.get_latest_debt()
+        mock_fetch.assert_awaited_once()
+        assert [r["date"] for r in two["data"]] == ["2024-06-03", "2024-06-02"]
+        assert [r["total_debt"] for r in everything["data"]] == [3.0, 2.0, 1.0]
+        assert latest["date"] == "2024-06-03"
+        history = await service.get_debt_history()
+        assert history["debt_held_public"] == [None, None, None]
+        columnar = await service.get_national_debt(days=2, columnar=True)
+        assert columnar["dates"] == ["2024-06-03", "2024-06-02"]
+        assert columnar["values"] == [3.0, 2.0]
+        assert "data" not in columnar
+
+    @pytest.mark.asyncio
+    async def test_debt_history_follows_pages(self, service):
+        pages = [
+            {"data": [{"record_date": "2024-06-01", "tot_pub_debt_out_amt": "1"}], "meta": {"total-pages": 2}},
+            {"data": [{"record_date": "2024-06-02", "tot_pub_debt_out_amt": "2"}], "meta": {"total-pages": 2}},
+        ]
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, side_effect=pages) as mock_fetch:
+            history = await service.get_debt_history()
+        assert mock_fetch.await_count == 2
+        assert mock_fetch.await_args.kwargs["params"]["page[number]"] == 2
+        assert history["dates"] == ["2024-06-01", "2024-06-02"]
+
+    @pytest.mark.asyncio
+    async def test_debt_history_refresh_appends_new_records(self, service):
+        first = {"data": [
+            {"record_date": "2024-06-01", "tot_pub_debt_out_amt": "1"},
+            {"record_date": "2024-06-02", "tot_pub_debt_out_amt": "2"},
+        ]}
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=first):
+            await service.get_debt_history()
+
+        key = service._cache_key("treasury_debt_history")
+        expired = time.time() - 100 * 3600
+        os.utime(service._cache_path(key), (expired, expired))
+        service._memory.clear()
+
+        newer = {"data": [
+            {"record_date": "2024-06-02", "tot_pub_debt_out_amt": "2"},
+            {"record_date": "2024-06-03", "tot_pub_debt_out_amt": "3"},
+        ]}
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=newer) as mock_fetch:
+            history = await service.get_debt_history()
+        assert mock_fetch.await_args.kwargs["params"]["filter"] == "record_date:gt:2024-06-02"
+        assert history["dates"] == ["2024-06-01", "2024-06-02", "2024-06-03"]
+        assert history["total_debt"] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_debt_history_survives_janitor(self, service):
+        page = {"data": [{"record_date": "2024-06-01", "tot_pub_debt_out_amt": "1"}]}
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=page):
+            await service.get_debt_history()
+
+        key = service._cache_key("treasury_debt_history")
+        service._manifest.get(key).created -= 1000 * 3600
+        CacheJanitor(service._manifest, max_bytes=0, stale_ttl_hours=24).run_once()
+        assert service._cache_path(key).exists()
+
+    @pytest.mark.asyncio
+    async def test_treasury_historical_debt_sliced_from_history(self, service):
+        from app.services.debt_service import TreasuryDebtService
+        records = [
+            {"record_date": d, "tot_pub_debt_out_amt": str(i)}
+            for i, d in enumerate(["2023-12-29", "2024-01-02", "2024-01-31", "2024-02-01"])
+        ]
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value={"data": records}), \
+                patch("app.services.debt_service.get_gov_data_service", return_value=service):
+            results = await TreasuryDebtService().get_historical_debt(
+                start_date="2024-01-01", end_date="2024-01-31", frequency="daily",
+            )
+        assert [r["record_date"] for r in results] == ["2024-01-31", "2024-01-02"]
+        assert results[0]["debt_held_by_public"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_unemployment_posts_through_fetch_json(self, service):
+        bls = {
+            "Results": {"series": [{"data": [
+                {"year": "2024", "period": "M05", "value": "4.0"},
+                {"year": "2024", "period": "M04", "value": "-"},
+            ]}]},
+        }
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=bls) as mock_fetch:
+            result = await service.get_unemployment_rate(years=1)
+        assert mock_fetch.await_args.kwargs["method"] == "POST"
+        assert result["data"] == [{"year": 2024, "month": 5, "rate": 4.0}]
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, return_value=bls):
+            columnar = await service.get_unemployment_rate(years=1, columnar=True)
+        assert (columnar["dates"], columnar["values"]) == (["2024-05"], [4.0])
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_raises_data_fetch_error(self, service):
+        with patch.object(service, "_fetch_json", new_callable=AsyncMock, side_effect=ServiceError("down")):
+            with pytest.raises(DataFetchError):
+                await service.get_candidate_totals(cycle=2024)
@@ -100,6 +100,31 @@ class TestObservationsEndpoint:
         resp = await client.get("/api/v1/housing/observations/MSPUS?start_date=2024-01-01&end_date=2024-12-31")
         assert resp.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_downsample_params_passed(self, client, mock_housing_service):
+        resp = await client.get(
+            "/api/v1/housing/observations/MORTGAGE30US?frequency=month&aggregation=last&max_points=200"
+        )
+        assert resp.status_code == 200
+        kwargs = mock_housing_service.get_observations.await_args.kwargs
+        assert (kwargs["frequency"], kwargs["aggregation"], kwargs["max_points"]) == ("month", "last", 200)
+
+    @pytest.mark.asyncio
+    async def test_columnar_format(self, client, mock_housing_service):
+        mock_housing_service.get_observations.return_value = {
+            "series_id": "MSPUS", "title": "Median Sales Price", "units": "dollars",
+            "frequency": "quarterly", "dates": ["2024-01-01"], "values": [420000.0],
+        }
+        resp = await client.get("/api/v1/housing/observations/MSPUS?format=columnar")
+        assert resp.status_code == 200
+        assert resp.json()["values"] == [420000.0]
+        assert mock_housing_service.get_observations.await_args.kwargs["columnar"] is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_frequency(self, client):
+        resp = await client.get("/api/v1/housing/observations/MSPUS?frequency=decade")
+        assert resp.status_code == 422
+
 
 class TestCompareEndpoint:
     @pytest.mark.asyncio
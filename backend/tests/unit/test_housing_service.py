@@ -84,6 +84,54 @@ class TestGetObservations:
         assert len(data["observations"]) == 2
         assert data["observations"][0]["value"] == 65.7
 
+    @pytest.mark.asyncio
+    async def test_frequency_aggregates_in_sql(self, service, mock_pool):
+        from app.db import queries as Q
+        mock_pool.fetch.return_value = [_row({"date": date(2024, 1, 1), "value": 6.5})]
+        await service.get_observations("MORTGAGE30US", frequency="month", aggregation="last")
+        query, *args = mock_pool.fetch.await_args.args
+        assert query == Q.SELECT_OBSERVATIONS_RESAMPLED
+        assert args[-2:] == ["month", "last"]
+
+    @pytest.mark.asyncio
+    async def test_max_points_downsamples(self, service, mock_pool):
+        from datetime import timedelta
+        mock_pool.fetch.return_value = [
+            _row({"date": date(1971, 4, 2) + timedelta(weeks=i), "value": float(i % 50)})
+            for i in range(2800)
+        ]
+        data = await service.get_observations("MORTGAGE30US", max_points=100)
+        obs = data["observations"]
+        assert len(obs) == 100
+        assert obs[0]["date"] == "1971-04-02"
+        assert obs[-1]["value"] == float(2799 % 50)
+
+    @pytest.mark.asyncio
+    async def test_points_capped_by_setting(self, service, mock_pool):
+        service._max_points = 10
+        mock_pool.fetch.return_value = [
+            _row({"date": date.fromordinal(730120 + i), "value": float(i)})
+            for i in range(50)
+        ]
+        data = await service.get_observations("X", max_points=500)
+        assert len(data["observations"]) == 10
+
+    @pytest.mark.asyncio
+    async def test_columnar(self, service, mock_pool):
+        mock_pool.fetch.return_value = [
+            _row({"date": date(2024, 1, 1), "value": 65.7}),
+            _row({"date": date(2024, 4, 1), "value": 66.1}),
+        ]
+        data = await service.get_observations("RHORUSQ156N", columnar=True)
+        assert data["dates"] == ["2024-01-01", "2024-04-01"]
+        assert data["values"] == [65.7, 66.1]
+        assert "observations" not in data
+
+    @pytest.mark.asyncio
+    async def test_invalid_frequency(self, service):
+        with pytest.raises(ValueError):
+            await service.get_observations("X", frequency="decade")
+
 
 class TestGetCompare:
     @pytest.mark.asyncio
@@ -102,13 +150,42 @@ class TestGetCompare:
 class TestGetDashboard:
     @pytest.mark.asyncio
     async def test_returns_headline_items(self, service, mock_pool):
-        mock_pool.fetchrow.return_value = _row({
-            "date": date(2024, 6, 1),
-            "value": 65.5,
-        })
+        from app.services.housing.housing_service import _HEADLINE_SERIES
+        mock_pool.fetch.return_value = [
+            _row({"series_id": sid, "date": date(2024, 6, 1), "value": 65.5})
+            for sid in _HEADLINE_SERIES
+        ]
         items = await service.get_dashboard()
         assert len(items) == 6  # One per headline series
         assert all(item["latest_value"] is not None for item in items)
+        mock_pool.fetch.assert_awaited_once()  # one batched lookup
+        mock_pool.fetchrow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_series_read_live(self, service, mock_pool):
+        from app.db import queries as Q
+        mock_pool.fetch.side_effect = [
+            [_row({"series_id": "MSPUS", "date": date(2024, 4, 1), "value": 412300.0})],
+            [_row({"series_id": "HOUST", "date": date(2024, 5, 1), "value": 1277.0})],
+        ]
+        items = {i["series_id"]: i for i in await service.get_dashboard()}
+        assert items["MSPUS"]["latest_value"] == 412300.0
+        assert items["HOUST"]["latest_date"] == "2024-05-01"
+        assert items["MSACSR"]["latest_value"] is None
+        live_query, live_ids = mock_pool.fetch.await_args_list[1].args
+        assert live_query == Q.SELECT_LATEST_OBSERVATIONS_MULTI_LIVE
+        assert "MSPUS" not in live_ids
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_table_missing(self, service, mock_pool):
+        import asyncpg
+        mock_pool.fetch.side_effect = [
+            asyncpg.exceptions.UndefinedTableError("relation does not exist"),
+            [_row({"series_id": "HOUST", "date": date(2024, 5, 1), "value": 1277.0})],
+        ]
+        items = {i["series_id"]: i for i in await service.get_dashboard()}
+        assert items["HOUST"]["latest_value"] == 1277.0
+        assert len(mock_pool.fetch.await_args_list[1].args[1]) == 6
 
 
 class TestGetSyncStatus:
@@ -132,3 +209,97 @@ class TestGetSyncStatus:
         result = await service.get_sync_status()
         assert result["status"] == "success"
         assert result["series_synced"] == 48
+
+
+class TestReadCache:
+    @pytest.mark.asyncio
+    async def test_repeat_reads_served_from_cache(self, service, mock_pool):
+        mock_pool.fetchval.return_value = 3
+        mock_pool.fetch.return_value = [_row({"date": date(2024, 1, 1), "value": 1.0})]
+        first = await service.get_observations("HOUST")
+        second = await service.get_observations("HOUST")
+        assert first is second
+        assert mock_pool.fetch.await_count == 1
+        await service.get_observations("HOUST", start_date="2020-01-01")
+        assert mock_pool.fetch.await_count == 2  # params are part of the key
+
+    @pytest.mark.asyncio
+    async def test_new_sync_version_invalidates(self, service, mock_pool):
+        service._poll_seconds = 0  # check the version on every read
+        mock_pool.fetchval.return_value = 3
+        mock_pool.fetch.return_value = [_row({"date": date(2024, 1, 1), "value": 1.0})]
+        await service.get_observations("HOUST")
+        mock_pool.fetchval.return_value = 4
+        mock_pool.fetch.return_value = [_row({"date": date(2024, 2, 1), "value": 2.0})]
+        result = await service.get_observations("HOUST")
+        assert result["observations"] == [{"date": "2024-02-01", "value": 2.0}]
+        assert service.cache_stats()["data_version"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_skip_db_between_polls_without_listener(self, service, mock_pool):
+        assert service.cache_stats()["listening"] is False
+        mock_pool.fetchval.return_value = 3
+        mock_pool.fetch.return_value = []
+        await service.get_categories()
+        calls = len(mock_pool.mock_calls)
+        for _ in range(5):
+            await service.get_categories()
+        assert len(mock_pool.mock_calls) == calls  # no version poll, no query
+
+    @pytest.mark.asyncio
+    async def test_listener_skips_polling_and_notify_invalidates(self, service, mock_pool):
+        conn = AsyncMock()
+        conn.add_termination_listener = MagicMock()
+        conn.remove_termination_listener = MagicMock()
+        mock_pool.acquire.return_value = conn
+        mock_pool.fetchval.return_value = 3
+        mock_pool.fetch.return_value = []
+        assert await service.start_cache_listener() is True
+
+        await service.get_categories()
+        await service.get_categories()
+        assert mock_pool.fetchval.await_count == 1  # only the post-LISTEN check
+        assert mock_pool.fetch.await_count == 1
+
+        service._on_sync_notify(conn, 1, "housing_sync", "4")
+        await service.get_categories()
+        assert mock_pool.fetch.await_count == 2
+        assert mock_pool.fetchval.await_count == 1
+
+        await service.stop_cache_listener()
+        mock_pool.release.assert_awaited_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_lost_listener_released_and_reestablished(self, service, mock_pool):
+        def listener_conn():
+            conn = AsyncMock()
+            conn.add_termination_listener = MagicMock()
+            conn.remove_termination_listener = MagicMock()
+            return conn
+
+        dead, fresh = listener_conn(), listener_conn()
+        service.LISTENER_RETRY_INITIAL_SECONDS = 0
+        mock_pool.acquire.side_effect = [dead, OSError("db restarting"), fresh]
+        assert await service.start_cache_listener() is True
+
+        service._on_listener_lost(dead)
+        assert service.cache_stats()["listening"] is False
+        await service._relisten_task
+
+        mock_pool.release.assert_awaited_once_with(dead)
+        assert mock_pool.acquire.await_count == 3  # one failed retry, then LISTEN again
+        fresh.add_listener.assert_awaited_once()
+        assert service.cache_stats()["listening"] is True
+        await service.stop_cache_listener()
+
+    @pytest.mark.asyncio
+    async def test_load_straddling_invalidation_not_stored(self, service, mock_pool):
+        mock_pool.fetchval.return_value = 3
+
+        async def fetch(*args):
+            service._on_sync_notify(None, 1, "housing_sync", "4")
+            return []
+
+        mock_pool.fetch.side_effect = fetch
+        await service.get_categories()
+        assert service.cache_stats()["entries"] == 0
@@ -0,0 +1,89 @@
+"""Tests for the shared HTTP client in ``app.services.http_client``."""
+
+import httpx
+import pytest
+
+from app.services import http_client
+from app.services.http_client import PerHostTransport
+
+
+def _mock(handler):
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def transport():
+    t = PerHostTransport(max_connections=4, max_keepalive_connections=2)
+    # Pre-seed the per-host pools with mock transports (no network).
+    for host in ("a.example.gov", "b.example.gov"):
+        t._pool_for(httpx.URL(f"https://{host}/"))
+        t._pools[host] = _mock(lambda request: httpx.Response(200, json={"host": request.url.host}))
+    return t
+
+
+class TestPerHostTransport:
+    @pytest.mark.asyncio
+    async def test_routes_and_counts_per_host(self, transport):
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://a.example.gov/x")
+            await client.get("https://a.example.gov/y")
+            resp = await client.get("https://b.example.gov/z")
+        assert resp.json() == {"host": "b.example.gov"}
+
+        hosts = transport.stats()["hosts"]
+        assert hosts["a.example.gov"]["requests"] == 2
+        assert hosts["b.example.gov"]["requests"] == 1
+        assert all(h["in_flight"] == 0 for h in hosts.values())
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_in_flight_until_closed(self, transport):
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with client.stream("GET", "https://a.example.gov/x") as resp:
+                assert transport.stats()["hosts"]["a.example.gov"]["in_flight"] == 1
+                await resp.aread()
+            stats = transport.stats()["hosts"]["a.example.gov"]
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_counted(self, transport):
+        def fail(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        transport._pools["a.example.gov"] = _mock(fail)
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://a.example.gov/x")
+        stats = transport.stats()["hosts"]["a.example.gov"]
+        assert stats["errors"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setattr(http_client, "HTTP2_AVAILABLE", False)
+        assert PerHostTransport(http2=True).http2 is False
+
+    def test_environment_proxy(self, monkeypatch):
+        for name in ("http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.upper(), raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost,.example.gov")
+
+        assert http_client._env_proxy(httpx.URL("https://api.bls.gov/x")) == "http://proxy.internal:3128"
+        assert http_client._env_proxy(httpx.URL("https://a.example.gov/x")) is None
+        assert http_client._env_proxy(httpx.URL("http://api.bls.gov/x")) is None
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_lifecycle(self):
+        await http_client.close_http_client()
+        assert http_client.http_client_stats() is None
+
+        client = await http_client.init_http_client()
+        assert http_client.get_http_client() is client
+        assert http_client.http_client_stats()["hosts"] == {}
+
+        await http_client.close_http_client()
+        assert http_client.get_http_client() is not client
+        await http_client.close_http_client()
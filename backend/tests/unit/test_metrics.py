@@ -0,0 +1,35 @@
+"""Tests for the latency histograms in ``app.utils.metrics``."""
+
+import pytest
+
+from app.utils.metrics import Histogram
+
+
+class TestHistogram:
+    def test_empty(self):
+        snap = Histogram().snapshot()
+        assert snap["count"] == 0
+        assert snap["p99_ms"] == 0.0
+
+    def test_quantiles_use_bucket_bounds(self):
+        h = Histogram(buckets=(1, 10, 100))
+        for ms in [0.5] * 90 + [50] * 9 + [500]:
+            h.observe(ms)
+        assert h.quantile(0.5) == 1
+        assert h.quantile(0.95) == 100
+        assert h.quantile(1.0) == 500  # overflow bucket reports the max
+
+    def test_cumulative_buckets(self):
+        h = Histogram(buckets=(1, 10))
+        for ms in (0.2, 5, 5, 20):
+            h.observe(ms)
+        snap = h.snapshot()
+        assert snap["buckets"] == {"le_1": 1, "le_10": 3, "le_inf": 4}
+        assert snap["mean_ms"] == pytest.approx(7.55)
+        assert "buckets" not in h.snapshot(buckets=False)
+
+    def test_time_context_manager(self):
+        h = Histogram()
+        with h.time():
+            pass
+        assert h.count == 1
@@ -0,0 +1,68 @@
+"""Tests for the per-upstream token buckets in ``app.services.rate_limit``."""
+
+import httpx
+import pytest
+
+from app.services.http_client import PerHostTransport
+from app.services.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(RateLimit(requests=2, per_seconds=1, burst=3), clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        # Empty: each further caller queues behind the previous reservation.
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.throttled == 2
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(RateLimit(requests=60, per_seconds=60, burst=1), clock=clock)
+        assert bucket.reserve() == 0.0
+        clock.now += 1.0
+        assert bucket.reserve() == 0.0
+        clock.now += 100.0
+        assert bucket.stats()["available"] == 1.0  # capped at burst
+
+    def test_pause_after_429(self):
+        clock = FakeClock()
+        bucket = TokenBucket(RateLimit(requests=10, per_seconds=1, burst=10), clock=clock)
+        bucket.pause(5)
+        assert bucket.reserve() == pytest.approx(5.1)
+
+
+class TestRateLimiter:
+    def test_unknown_host_unlimited(self):
+        limiter = RateLimiter({})
+        assert limiter.bucket("example.com") is None
+
+    def test_backoff_uses_retry_after(self):
+        limiter = RateLimiter({"api.example.gov": RateLimit(60, 60, 5)})
+        limiter.backoff("api.example.gov", "2")
+        assert limiter.bucket("api.example.gov").reserve() == pytest.approx(3.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_enforced_in_transport(self):
+        limiter = RateLimiter({"api.example.gov": RateLimit(1, 3600, 1)})
+        transport = PerHostTransport(rate_limiter=limiter)
+        transport._pool_for(httpx.URL("https://api.example.gov/"))
+        transport._pools["api.example.gov"] = httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "30"}),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            resp = await client.get("https://api.example.gov/x")
+        assert resp.status_code == 429
+        stats = transport.stats()
+        assert stats["hosts"]["api.example.gov"]["rate_limited"] == 1
+        assert stats["rate_limits"]["api.example.gov"]["acquired"] == 1
+        assert limiter.bucket("api.example.gov").reserve() > 30
@@ -0,0 +1,44 @@
+"""Tests for the government data release schedules."""
+
+from datetime import datetime, timezone
+
+from app.utils.schedules import (
+    business_day,
+    employment_release,
+    mts_release,
+    next_mts_release,
+    next_state_release,
+    previous_employment_release,
+    previous_mts_release,
+    previous_state_release,
+    state_employment_release,
+)
+
+
+class TestEmploymentSchedule:
+    def test_first_friday(self):
+        release = employment_release(2024, 11)
+        assert release.date().isoformat() == "2024-11-01"
+        just_before = release.replace(minute=release.minute - 1)
+        assert previous_employment_release(just_before).date().isoformat() == "2024-10-04"
+        assert previous_employment_release(release) == release
+
+    def test_state_release_two_weeks_later(self):
+        assert state_employment_release(2024, 11).date().isoformat() == "2024-11-15"
+        assert previous_state_release(datetime(2024, 11, 10)).date().isoformat() == "2024-10-18"
+        assert next_state_release(datetime(2024, 11, 10)).date().isoformat() == "2024-11-15"
+
+
+class TestMTSSchedule:
+    def test_eighth_business_day(self):
+        assert business_day(2026, 7, 8).isoformat() == "2026-07-10"
+        assert business_day(2026, 8, 1).isoformat() == "2026-08-03"  # month opens on a Saturday
+        assert mts_release(2026, 7) == datetime(2026, 7, 10, 20, 0, tzinfo=timezone.utc)
+
+    def test_previous_release_before_this_months(self):
+        now = datetime(2026, 7, 2, tzinfo=timezone.utc)
+        assert previous_mts_release(now) == mts_release(2026, 6)
+
+    def test_next_release_after_this_months(self):
+        now = datetime(2026, 7, 11, tzinfo=timezone.utc)
+        assert next_mts_release(now) == mts_release(2026, 8)
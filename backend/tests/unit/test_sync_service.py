@@ -1,6 +1,7 @@
 """Tests for HousingSyncService."""
 
 import asyncio
+import json
 import os
 import tempfile
 from datetime import datetime, timedelta
@@ -11,10 +12,17 @@ import pytest
 # Point DATA_DIR at a temp directory so BaseGovService.__init__ doesn't fail
 os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
 
+from app.db import queries as Q
+from app.services.housing import sync_service
 from app.services.housing.sync_service import HousingSyncService
 from app.services.housing.series_config import HOUSING_SERIES
 
 
+@pytest.fixture(autouse=True)
+def fresh_schema(monkeypatch):
+    monkeypatch.setattr(sync_service, "_schema_ensured", False)
+
+
 @pytest.fixture
 def mock_pool():
     """Create a mock asyncpg pool."""
@@ -116,6 +124,149 @@ class TestSyncSeries:
         assert "timeout" in err
 
 
+class TestCopyUpsert:
+    @pytest.fixture
+    def conn(self, mock_pool):
+        """Wire ``pool.acquire()`` and ``conn.transaction()`` as async context managers."""
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.copy_records_to_table = AsyncMock()
+        tx = MagicMock()
+        tx.__aenter__ = AsyncMock()
+        tx.__aexit__ = AsyncMock(return_value=False)
+        conn.transaction = MagicMock(return_value=tx)
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=conn)
+        acquire.__aexit__ = AsyncMock(return_value=False)
+        mock_pool.acquire = MagicMock(return_value=acquire)
+        return conn
+
+    @pytest.fixture
+    def copy_threshold(self, monkeypatch):
+        from app.config import get_settings
+        monkeypatch.setattr(
+            "app.services.housing.sync_service.settings",
+            get_settings().model_copy(update={"housing_copy_threshold": 3}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_copy_and_merge(self, service, mock_pool, conn, copy_threshold):
+        from app.db import queries as Q
+        obs = [{"date": f"2024-0{m}-01", "value": str(m)} for m in range(1, 5)]
+        count = await service.upsert_observations("HOUST", obs)
+
+        assert count == 4
+        mock_pool.executemany.assert_not_called()
+        conn.transaction.assert_called_once()
+        records = conn.copy_records_to_table.await_args.kwargs["records"]
+        assert records[0][0] == "HOUST" and records[-1][2] == 4.0
+        executed = [c.args[0] for c in conn.execute.await_args_list]
+        assert executed == [Q.CREATE_OBSERVATIONS_STAGING, Q.MERGE_OBSERVATIONS_STAGING]
+
+    @pytest.mark.asyncio
+    async def test_small_batch_uses_executemany(self, service, mock_pool, conn, copy_threshold):
+        obs = [{"date": "2024-01-01", "value": "1.0"}, {"date": "2024-02-01", "value": "2.0"}]
+        assert await service.upsert_observations("HOUST", obs) == 2
+        mock_pool.executemany.assert_awaited_once()
+        conn.copy_records_to_table.assert_not_called()
+
+
+class TestSkipUnchanged:
+    @pytest.fixture
+    def tracking(self, service):
+        service._track_changes = True
+        return service
+
+    @pytest.mark.asyncio
+    async def test_unchanged_series_skipped(self, tracking, mock_pool, sample_series):
+        mock_pool.fetchrow.return_value = {
+            "last_synced_at": datetime(2024, 6, 1), "fred_last_updated": "2024-06-01 07:51:05-05",
+        }
+        with patch.object(tracking, "validate_series", new_callable=AsyncMock,
+                          return_value={"last_updated": "2024-06-01 07:51:05-05"}), \
+                patch.object(tracking, "fetch_observations", new_callable=AsyncMock) as mock_fetch:
+            count, err = await tracking.sync_series(sample_series)
+
+        assert (count, err) == (0, None)
+        mock_fetch.assert_not_called()
+        mock_pool.execute.assert_not_called()  # last_synced_at untouched
+        assert tracking._series_stats[sample_series["series_id"]]["status"] == "unchanged"
+
+    @pytest.mark.asyncio
+    async def test_changed_series_synced_and_marked(self, tracking, mock_pool, sample_series):
+        from app.db import queries as Q
+        mock_pool.fetchrow.return_value = {
+            "last_synced_at": datetime(2024, 6, 1), "fred_last_updated": "2024-06-01 07:51:05-05",
+        }
+        with patch.object(tracking, "validate_series", new_callable=AsyncMock,
+                          return_value={"last_updated": "2024-06-08 07:50:00-05"}), \
+                patch.object(tracking, "fetch_observations", new_callable=AsyncMock,
+                             return_value=[{"date": "2024-06-07", "value": "7.0"}]):
+            count, err = await tracking.sync_series(sample_series)
+
+        assert (count, err) == (1, None)
+        mock_pool.execute.assert_any_await(
+            Q.UPDATE_SERIES_FRED_LAST_UPDATED, sample_series["series_id"], "2024-06-08 07:50:00-05",
+        )
+        assert tracking._series_stats[sample_series["series_id"]]["status"] == "updated"
+
+    @pytest.mark.asyncio
+    async def test_sync_all_logs_series_stats(self, service, mock_pool):
+        from app.db import queries as Q
+        mock_pool.fetchrow.return_value = {"id": 7}
+
+        async def mock_sync(series_def, full_backfill=False):
+            service._series_stats[series_def["series_id"]] = {"status": "unchanged", "observations": 0}
+            return 0, None
+
+        with patch.object(service, "sync_series", side_effect=mock_sync):
+            summary = await service.sync_all()
+
+        mock_pool.execute.assert_any_await(Q.ENSURE_SYNC_SCHEMA)
+        assert summary["series_unchanged"] == len(HOUSING_SERIES)
+        query, *args = mock_pool.fetchrow.await_args.args
+        assert query == Q.INSERT_SYNC_LOG_WITH_STATS
+        assert len(json.loads(args[-1])) == len(HOUSING_SERIES)
+
+    @pytest.mark.asyncio
+    async def test_sync_all_refreshes_latest_for_changed_series(self, service, mock_pool):
+        from app.db import queries as Q
+        mock_pool.fetchrow.return_value = {"id": 7}
+        changed = HOUSING_SERIES[0]["series_id"]
+
+        async def mock_sync(series_def, full_backfill=False):
+            sid = series_def["series_id"]
+            n = 5 if sid == changed else 0
+            service._series_stats[sid] = {"status": "updated" if n else "unchanged", "observations": n}
+            return n, None
+
+        with patch.object(service, "sync_series", side_effect=mock_sync):
+            await service.sync_all()
+
+        mock_pool.execute.assert_any_await(Q.REFRESH_LATEST_OBSERVATIONS, [changed])
+        mock_pool.execute.assert_any_await(Q.NOTIFY_SYNC, Q.SYNC_NOTIFY_CHANNEL, "7")
+
+    @pytest.mark.asyncio
+    async def test_ddl_failure_falls_back_to_full_sync(self, service, mock_pool):
+        mock_pool.execute.side_effect = Exception("permission denied")
+        assert await service.ensure_sync_schema() is False
+        assert service._track_changes is False
+
+    @pytest.mark.asyncio
+    async def test_schema_ddl_runs_once_per_process(self, mock_pool):
+        assert await HousingSyncService(mock_pool).ensure_sync_schema() is True
+        assert await HousingSyncService(mock_pool).ensure_sync_schema() is True
+        ddl = [c for c in mock_pool.execute.await_args_list if c.args == (Q.ENSURE_SYNC_SCHEMA,)]
+        assert len(ddl) == 1
+
+    @pytest.mark.asyncio
+    async def test_schema_ddl_retried_after_failure(self, service, mock_pool):
+        mock_pool.execute.side_effect = Exception("permission denied")
+        assert await service.ensure_sync_schema() is False
+        mock_pool.execute.side_effect = None
+        assert await service.ensure_sync_schema() is True
+
+
 class TestSyncAll:
     @pytest.mark.asyncio
     async def test_collects_errors(self, service, mock_pool):
@@ -132,11 +283,35 @@ class TestSyncAll:
         mock_pool.fetchrow.return_value = {"id": 1}  # log_sync_run return
 
         with patch.object(service, "sync_series", side_effect=mock_sync):
-            # Override REQUEST_DELAY to speed up test
-            service.REQUEST_DELAY = 0
             summary = await service.sync_all()
 
         assert summary["status"] in ("success", "partial")
         assert summary["series_total"] == len(HOUSING_SERIES)
         assert summary["observations_upserted"] > 0
         assert isinstance(summary["errors"], list)
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently_within_limit(self, mock_pool):
+        service = HousingSyncService(mock_pool, fetch_concurrency=3, db_concurrency=2)
+        mock_pool.fetchrow.return_value = {"id": 1}
+        in_flight = peak = 0
+
+        async def slow_fetch(series_id, observation_start="1900-01-01"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if series_id == HOUSING_SERIES[0]["series_id"]:
+                raise RuntimeError("FRED 500")
+            return [{"date": "2024-01-01", "value": "1.0"}]
+
+        with patch.object(service, "fetch_observations", side_effect=slow_fetch), \
+                patch.object(service, "validate_series", new_callable=AsyncMock, return_value=None):
+            summary = await service.sync_all(full_backfill=True)
+
+        assert peak == 3
+        assert summary["status"] == "partial"
+        assert summary["series_synced"] == len(HOUSING_SERIES) - 1
+        assert summary["errors"] == [f"{HOUSING_SERIES[0]['series_id']}: FRED 500"]
+        assert set(summary["stage_seconds"]) == {"check", "fetch", "upsert", "refresh_latest"}